@@ -14,6 +14,9 @@ Features:
 - Type conversion and validation
 - Default value support
 
+### fast_config_parser.py
+Lightweight regex-based INI parser used by ConfigLoader (replaces configparser).
+
 ### constants.py
 Project-wide constants and enumerated values.
 Defines:
@@ -3,14 +3,21 @@
 提供飞机号映射逻辑和配置管理
 """
 
-import configparser
-import os
+import functools
+import threading
 from typing import Dict, List
 
+from .config_loader import DEFAULT_CONFIG_FILE, read_ini, split_csv
+
 
 class AircraftConfig:
     """飞机号配置管理类"""
 
+    # 预定义的短飞机号 -> 完整显示名称映射
+    # B-652G -> C909-185/B-652G
+    # B-656E -> C909-196/B-656E
+    PREDEFINED_MAPPINGS = {"B-652G": "C909-185/B-652G", "B-656E": "C909-196/B-656E"}
+
     def __init__(self, config_file: str = None):
         """
         初始化飞机号配置
@@ -18,21 +25,15 @@ class AircraftConfig:
         Args:
             config_file: 配置文件路径，默认为 config/config.ini
         """
-        if config_file is None:
-            # 默认配置文件路径
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            config_file = os.path.join(project_root, "config", "config.ini")
-
-        self.config_file = config_file
-        self.config = configparser.ConfigParser()
+        self.config_file = config_file or DEFAULT_CONFIG_FILE
         self._load_config()
 
     def _load_config(self):
         """加载配置文件"""
-        if not os.path.exists(self.config_file):
-            raise FileNotFoundError(f"❌ 配置文件不存在: {self.config_file}")
-
-        self.config.read(self.config_file, encoding="utf-8")
+        try:
+            self.config = read_ini(self.config_file, missing_ok=False)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"❌ 配置文件不存在: {self.config_file}") from None
 
     def get_aircraft_list(self) -> List[str]:
         """
@@ -41,15 +42,17 @@ class AircraftConfig:
         Returns:
             List[str]: 飞机号列表，例如 ['B-652G', 'B-656E']
         """
-        if self.config.has_section("aircraft") and self.config.has_option(
-            "aircraft", "aircraft_list"
-        ):
-            aircraft_list_str = self.config.get("aircraft", "aircraft_list")
-            aircraft_list = [x.strip() for x in aircraft_list_str.split(",")]
-            return aircraft_list
+        return list(self._aircraft_list)
+
+    @functools.cached_property
+    def _aircraft_list(self) -> tuple:
+        """飞机号列表（实例内只解析一次）"""
+        aircraft_list_str = self.config.get("aircraft", {}).get("aircraft_list")
+        if aircraft_list_str is not None:
+            return tuple(split_csv(aircraft_list_str))
         else:
             # 默认值
-            return ["B-652G", "B-656E"]
+            return ("B-652G", "B-656E")
 
     def get_aircraft_mapping(self) -> Dict[str, str]:
         """
@@ -60,12 +63,16 @@ class AircraftConfig:
         Returns:
             Dict[str, str]: 映射字典，例如 {'B-652G': 'C909-185/B-652G'}
         """
-        aircraft_list = self.get_aircraft_list()
+        return dict(self._aircraft_mapping)
+
+    @functools.cached_property
+    def _aircraft_mapping(self) -> Dict[str, str]:
+        """飞机号映射（实例内只构建一次，配置在实例生命周期内不变）"""
         mapping = {}
 
         # 默认映射规则
         # 如果飞机号本身不包含"C909-"，则添加前缀
-        for aircraft in aircraft_list:
+        for aircraft in self._aircraft_list:
             if "C909-" in aircraft:
                 # 已经是完整格式
                 mapping[aircraft] = aircraft
@@ -73,17 +80,9 @@ class AircraftConfig:
                 short_name = aircraft.split("/")[-1] if "/" in aircraft else aircraft
                 mapping[short_name] = aircraft
             else:
-                # 需要添加前缀（从飞机号提取编号）
-                # B-652G -> C909-185/B-652G
-                # B-656E -> C909-196/B-656E
-                # 这里使用预定义的映射
-                predefined_mappings = {"B-652G": "C909-185/B-652G", "B-656E": "C909-196/B-656E"}
-
-                if aircraft in predefined_mappings:
-                    mapping[aircraft] = predefined_mappings[aircraft]
-                else:
-                    # 如果没有预定义映射，使用飞机号本身
-                    mapping[aircraft] = aircraft
+                # 需要添加前缀，使用预定义的映射
+                # 如果没有预定义映射，使用飞机号本身
+                mapping[aircraft] = self.PREDEFINED_MAPPINGS.get(aircraft, aircraft)
 
         return mapping
 
@@ -97,8 +96,7 @@ class AircraftConfig:
         Returns:
             str: 完整名称，例如 'C909-185/B-652G'
         """
-        mapping = self.get_aircraft_mapping()
-        return mapping.get(short_name, short_name)
+        return self._aircraft_mapping.get(short_name, short_name)
 
     def get_all_short_names(self) -> List[str]:
         """
@@ -107,12 +105,12 @@ class AircraftConfig:
         Returns:
             List[str]: 短飞机号列表
         """
-        mapping = self.get_aircraft_mapping()
-        return list(mapping.keys())
+        return list(self._aircraft_mapping)
 
 
 # 全局实例（延迟加载）
 _aircraft_config_instance = None
+_aircraft_config_lock = threading.Lock()
 
 
 def get_aircraft_config() -> AircraftConfig:
@@ -123,9 +121,16 @@ def get_aircraft_config() -> AircraftConfig:
         AircraftConfig: 配置实例
     """
     global _aircraft_config_instance
-    if _aircraft_config_instance is None:
-        _aircraft_config_instance = AircraftConfig()
-    return _aircraft_config_instance
+    # 快速路径：已初始化时无锁返回（只读取一次全局变量）
+    instance = _aircraft_config_instance
+    if instance is not None:
+        return instance
+
+    # 双重检查锁：避免多线程并发时重复创建实例
+    with _aircraft_config_lock:
+        if _aircraft_config_instance is None:
+            _aircraft_config_instance = AircraftConfig()
+        return _aircraft_config_instance
 
 
 def get_aircraft_mapping() -> Dict[str, str]:
@@ -8,23 +8,120 @@
 - 参考 .env.template 文件了解需要配置哪些环境变量
 """
 
-import configparser
+import functools
+import hashlib
 import os
+import re
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+from .fast_config_parser import FastConfigParser
+
+# 项目根目录及默认配置路径（模块导入时解析一次）
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CONFIG_FILE = str(_PROJECT_ROOT / "config" / "config.ini")
+_ENV_FILE = _PROJECT_ROOT / ".env"
+
+# 空节（只读），用于缺失节时的统一返回
+_EMPTY_SECTION: Mapping[str, str] = MappingProxyType({})
+# 空配置（只读），配置文件不存在时返回同一对象，便于按对象身份判断配置是否变化
+_EMPTY_CONFIG: Mapping[str, Mapping[str, str]] = MappingProxyType({})
+
+# .env 中的 KEY=VALUE 行（注释行、空行及不含 "=" 的行自然不匹配）
+_ENV_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_.]*)[ \t]*=[ \t]*(.*?)[ \t]*$", re.M)
+
+# 逗号分隔列表的分隔符（连同两侧空白一起切掉）
+_CSV_RE = re.compile(r"\s*,\s*")
+
+
+def split_csv(value: str) -> List[str]:
+    """
+    解析逗号分隔的配置值
+
+    Args:
+        value: 例如 "B-652G, B-656E"
+
+    Returns:
+        List[str]: 去除空白后的非空项列表，例如 ['B-652G', 'B-656E']
+    """
+    return [x for x in _CSV_RE.split(value.strip()) if x]
+
+
+# 两级解析缓存各自保留的条目数（进程内通常只有一两个配置文件）
+_PARSE_CACHE_SIZE = 8
+
+# 按文件内容摘要缓存的解析结果 {摘要: 只读配置映射}，超出容量时淘汰最早加入的条目
+_PARSED_BY_DIGEST: Dict[bytes, Mapping[str, Mapping[str, str]]] = {}
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_ini(path: str, mtime_ns: int) -> Mapping[str, Mapping[str, str]]:
+    """
+    解析 INI 文件为只读的 {节: {键: 值}} 映射
+
+    两级缓存：
+    - (绝对路径, 修改时间)：文件未修改时不读文件
+    - 文件内容摘要：修改时间变化但内容相同（如 git checkout）时不重新解析，
+      并返回同一映射对象
+
+    Args:
+        path: 配置文件绝对路径
+        mtime_ns: 文件修改时间（纳秒），仅用作缓存键
+
+    Returns:
+        Mapping[str, Mapping[str, str]]: 只读配置映射
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    config = _PARSED_BY_DIGEST.get(digest)
+    if config is None:
+        parser = FastConfigParser()
+        parser.read_string(data.decode("utf-8"))
+        config = MappingProxyType(
+            {section: MappingProxyType(items) for section, items in parser.to_dict().items()}
+        )
+        if len(_PARSED_BY_DIGEST) >= _PARSE_CACHE_SIZE:
+            _PARSED_BY_DIGEST.pop(next(iter(_PARSED_BY_DIGEST)), None)
+        _PARSED_BY_DIGEST[digest] = config
+    return config
+
+
+def read_ini(path: str, missing_ok: bool = True) -> Mapping[str, Mapping[str, str]]:
+    """
+    读取 INI 配置文件（带缓存）
+
+    Args:
+        path: 配置文件路径
+        missing_ok: 文件不存在时是否返回空映射（False 时抛出 FileNotFoundError）
+
+    Returns:
+        Mapping[str, Mapping[str, str]]: 只读配置映射，文件不存在时返回空映射
+    """
+    path = os.path.abspath(path)
+    try:
+        # stat 与读取之间文件可能被删除，两处按同样方式处理
+        return _parse_ini(path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        if not missing_ok:
+            raise
+        return _EMPTY_CONFIG
 
 
 class ConfigLoader:
     """配置加载器类（支持环境变量优先）"""
 
-    # 环境变量映射
+    # 环境变量映射：(配置节, 配置键) -> 环境变量名
     ENV_MAPPING = {
-        "username": "SYSTEM_USERNAME",
-        "password": "SYSTEM_PASSWORD",
-        "sender_email": "GMAIL_SENDER_EMAIL",
-        "app_password": "GMAIL_APP_PASSWORD",
-        "recipients": "GMAIL_RECIPIENTS",
-        "sender_name": "GMAIL_SENDER_NAME",
+        ("credentials", "username"): "SYSTEM_USERNAME",
+        ("credentials", "password"): "SYSTEM_PASSWORD",
+        ("gmail", "sender_email"): "GMAIL_SENDER_EMAIL",
+        ("gmail", "app_password"): "GMAIL_APP_PASSWORD",
+        ("gmail", "recipients"): "GMAIL_RECIPIENTS",
+        ("gmail", "sender_name"): "GMAIL_SENDER_NAME",
     }
 
     def __init__(self, config_file: str = None):
@@ -34,42 +131,61 @@ class ConfigLoader:
         Args:
             config_file: 配置文件路径，默认为 config/config.ini
         """
-        if config_file is None:
-            # 默认配置文件路径
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            config_file = os.path.join(project_root, "config", "config.ini")
-
-        self.config_file = config_file
+        self.config_file = config_file or DEFAULT_CONFIG_FILE
 
         # 先加载 .env 文件到环境变量
         self._load_env()
+        # 环境变量快照（.env 加载后不再变化）
+        self._env: Dict[str, str] = dict(os.environ)
 
-        # 再加载 config.ini
-        self.config = configparser.ConfigParser()
+        # 再加载 config.ini（只读映射，同一文件在进程内只解析一次）
+        self.config: Mapping[str, Mapping[str, str]] = _EMPTY_CONFIG
         self._load_config()
 
+        # get_all_config() 的组装结果，配置文件修改后失效
+        self._all_config: Optional[Dict[str, Any]] = None
+
     def _load_env(self):
         """从项目根目录加载 .env 文件到环境变量"""
-        project_root = Path(__file__).parent.parent
-        env_file = project_root / ".env"
-
-        if env_file.exists():
-            with open(env_file, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    # 跳过注释和空行
-                    if not line or line.startswith("#"):
-                        continue
-                    # 解析 KEY=VALUE 格式
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        os.environ[key.strip()] = value.strip()
-
-    def _load_config(self):
-        """加载配置文件"""
-        if os.path.exists(self.config_file):
-            self.config.read(self.config_file, encoding="utf-8")
+        try:
+            # 一次读入整个文件，由预编译正则批量提取 KEY=VALUE
+            content = _ENV_FILE.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return
+        os.environ.update(_ENV_RE.findall(content))
+
+    def _load_config(self, config: Optional[Mapping[str, Mapping[str, str]]] = None):
+        """
+        加载配置文件
+
+        Args:
+            config: 已读取的配置映射（为空时从文件读取）
+        """
         # 配置文件不存在时不报错，依赖环境变量
+        self.config = config if config is not None else read_ini(self.config_file)
+
+        # 逗号分隔的列表值在加载时解析一次，getter 只做拷贝
+        aircraft = self.config.get("aircraft", _EMPTY_SECTION)
+        scheduler = self.config.get("scheduler", _EMPTY_SECTION)
+        self._aircraft_list = tuple(split_csv(aircraft.get("aircraft_list", "")))
+        self._flight_fetch_times = tuple(
+            split_csv(scheduler.get("flight_fetch_times", "07:00, 12:00, 18:00"))
+        )
+        self._faults_fetch_times = tuple(
+            split_csv(scheduler.get("faults_fetch_times", "08:00, 14:00, 20:00"))
+        )
+
+    def _refresh_config(self):
+        """
+        配置文件修改后重新加载
+
+        read_ini 以 (路径, 修改时间) 缓存解析结果：文件未修改时返回同一对象，
+        对象变化即说明文件已修改，此时清空派生缓存。
+        """
+        config = read_ini(self.config_file)
+        if config is not self.config:
+            self._load_config(config)
+            self._all_config = None
 
     def _get_value(self, section: str, key: str, fallback: Any = None) -> Optional[str]:
         """
@@ -86,15 +202,16 @@ class ConfigLoader:
             配置值
         """
         # 检查是否有对应的环境变量
-        composite_key = f"{section}.{key}"
-        if composite_key in self.ENV_MAPPING:
-            env_value = os.environ.get(self.ENV_MAPPING[composite_key])
+        env_name = self.ENV_MAPPING.get((section, key))
+        if env_name is not None:
+            env_value = self._env.get(env_name)
             if env_value:
                 return env_value
 
         # 尝试从 config.ini 读取
-        if self.config.has_section(section) and self.config.has_option(section, key):
-            return self.config.get(section, key)
+        value = self.config.get(section, _EMPTY_SECTION).get(key)
+        if value is not None:
+            return value
 
         return fallback
 
@@ -105,8 +222,13 @@ class ConfigLoader:
         Returns:
             Dict[str, str]: {'username': 'xxx', 'password': 'xxx'}
         """
-        username = os.environ.get("SYSTEM_USERNAME") or ""
-        password = os.environ.get("SYSTEM_PASSWORD") or ""
+        return dict(self._credentials)
+
+    @functools.cached_property
+    def _credentials(self) -> Dict[str, str]:
+        """登录凭证（首次访问时读取并提示缺失项，之后复用）"""
+        username = self._env.get("SYSTEM_USERNAME") or ""
+        password = self._env.get("SYSTEM_PASSWORD") or ""
 
         if not username:
             print("⚠️  警告: SYSTEM_USERNAME 环境变量未配置")
@@ -141,12 +263,7 @@ class ConfigLoader:
         Returns:
             List[str]: 飞机号列表
         """
-        if self.config.has_section("aircraft") and self.config.has_option(
-            "aircraft", "aircraft_list"
-        ):
-            aircraft_list_str = self.config.get("aircraft", "aircraft_list")
-            return [x.strip() for x in aircraft_list_str.split(",")]
-        return []
+        return list(self._aircraft_list)
 
     def get_urls(self) -> Dict[str, str]:
         """
@@ -155,9 +272,7 @@ class ConfigLoader:
         Returns:
             Dict[str, str]: URL配置字典
         """
-        if self.config.has_section("urls"):
-            return dict(self.config.items("urls"))
-        return {}
+        return dict(self.config.get("urls", _EMPTY_SECTION))
 
     def get_scheduler_config(self) -> Dict[str, Any]:
         """
@@ -166,22 +281,19 @@ class ConfigLoader:
         Returns:
             Dict[str, Any]: 调度器配置字典
         """
-        if not self.config.has_section("scheduler"):
+        section = self.config.get("scheduler")
+        if section is None:
             return self._get_default_scheduler_config()
 
         config = {}
-        section = self.config["scheduler"]
 
         # 时间配置
         config["start_time"] = section.get("start_time", "06:30")
         config["end_time"] = section.get("end_time", "21:00")
 
-        # 抓取时间列表
-        flight_times = section.get("flight_fetch_times", "07:00, 12:00, 18:00")
-        config["flight_fetch_times"] = [t.strip() for t in flight_times.split(",")]
-
-        faults_times = section.get("faults_fetch_times", "08:00, 14:00, 20:00")
-        config["faults_fetch_times"] = [t.strip() for t in faults_times.split(",")]
+        # 抓取时间列表（加载时已解析）
+        config["flight_fetch_times"] = list(self._flight_fetch_times)
+        config["faults_fetch_times"] = list(self._faults_fetch_times)
 
         return config
 
@@ -205,12 +317,19 @@ class ConfigLoader:
                 - recipients: 收件人列表
                 - sender_name: 发件人显示名称
         """
-        sender_email = os.environ.get("GMAIL_SENDER_EMAIL") or ""
-        app_password = os.environ.get("GMAIL_APP_PASSWORD") or ""
-        sender_name = os.environ.get("GMAIL_SENDER_NAME") or "航班监控系统"
-        recipients_str = os.environ.get("GMAIL_RECIPIENTS") or ""
+        gmail_config = dict(self._gmail_config)
+        gmail_config["recipients"] = list(gmail_config["recipients"])
+        return gmail_config
+
+    @functools.cached_property
+    def _gmail_config(self) -> Dict[str, Any]:
+        """Gmail配置（首次访问时读取并提示缺失项，之后复用）"""
+        sender_email = self._env.get("GMAIL_SENDER_EMAIL") or ""
+        app_password = self._env.get("GMAIL_APP_PASSWORD") or ""
+        sender_name = self._env.get("GMAIL_SENDER_NAME") or "航班监控系统"
+        recipients_str = self._env.get("GMAIL_RECIPIENTS") or ""
 
-        recipients = [r.strip() for r in recipients_str.split(",") if r.strip()]
+        recipients = split_csv(recipients_str)
 
         if not sender_email:
             print("⚠️  警告: GMAIL_SENDER_EMAIL 环境变量未配置")
@@ -230,22 +349,28 @@ class ConfigLoader:
         """
         获取所有配置
 
+        结果在配置文件未修改时复用，调用方应只读使用。
+
         Returns:
             Dict[str, Any]: 包含所有配置的字典
         """
-        return {
-            "credentials": self.get_credentials(),
-            "paths": self.get_paths(),
-            "target_url": self.get_target_url(),
-            "aircraft_list": self.get_aircraft_list(),
-            "urls": self.get_urls(),
-            "scheduler": self.get_scheduler_config(),
-            "gmail": self.get_gmail_config(),
-        }
+        self._refresh_config()
+        if self._all_config is None:
+            self._all_config = {
+                "credentials": self.get_credentials(),
+                "paths": self.get_paths(),
+                "target_url": self.get_target_url(),
+                "aircraft_list": self.get_aircraft_list(),
+                "urls": self.get_urls(),
+                "scheduler": self.get_scheduler_config(),
+                "gmail": self.get_gmail_config(),
+            }
+        return self._all_config
 
 
 # 全局实例（延迟加载）
 _config_loader_instance = None
+_config_loader_lock = threading.Lock()
 
 
 def load_config() -> ConfigLoader:
@@ -256,9 +381,16 @@ def load_config() -> ConfigLoader:
         ConfigLoader: 配置加载器实例
     """
     global _config_loader_instance
-    if _config_loader_instance is None:
-        _config_loader_instance = ConfigLoader()
-    return _config_loader_instance
+    # 快速路径：已初始化时无锁返回（只读取一次全局变量）
+    instance = _config_loader_instance
+    if instance is not None:
+        return instance
+
+    # 双重检查锁：避免多线程并发时重复创建实例
+    with _config_loader_lock:
+        if _config_loader_instance is None:
+            _config_loader_instance = ConfigLoader()
+        return _config_loader_instance
 
 
 # 向后兼容的便捷函数
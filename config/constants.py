@@ -11,7 +11,10 @@ DEFAULT_BROWSER_PORT = 9222
 
 # 登录超时配置
 MAX_LOGIN_WAIT_SECONDS = 90  # 登录流程最大等待时间
-LOGIN_CHECK_INTERVAL = 0.5  # 页面状态检测间隔（秒）
+LOGIN_CHECK_INTERVAL = 0.5  # 页面状态检测最长间隔（秒），URL变化时提前返回
+LOGIN_POLL_MIN_INTERVAL = 0.2  # 登录等待轮询初始间隔（秒），URL变化后重置为该值
+LOGIN_POLL_MAX_INTERVAL = 2.0  # 登录等待轮询最长间隔（秒），URL不变时按倍数递增至该值
+LOGIN_POLL_BACKOFF = 1.5  # 登录等待轮询间隔递增倍数
 TARGET_PAGE_LOAD_TIMEOUT = 15  # 目标页面加载超时（秒）
 
 # 备份管理
@@ -0,0 +1,77 @@
+"""
+轻量 INI 解析模块
+替代标准库 configparser 解析 config.ini
+
+config.ini 只包含 [节] 与 键=值 两种行，不需要插值、续行等特性，
+用两个预编译正则逐行匹配即可，避免 configparser 的逐行对象构建开销。
+"""
+
+import re
+from typing import Dict, Optional
+
+# [section]
+_SECTION_RE = re.compile(r"^\[([^\]]+)\]\s*$")
+# key = value 或 key: value
+_KV_RE = re.compile(r"^([^=:#;]+?)\s*[=:]\s*(.*)$")
+
+
+class FastConfigParser:
+    """
+    轻量 INI 解析器
+
+    与 configparser 保持一致的行为：
+    - 键名统一转为小写
+    - 以 # 或 ; 开头的行为注释
+    - 同名节合并，后出现的键覆盖先出现的
+
+    只提供 config_loader 使用的接口：文件由调用方一次读入后交给 read_string 解析
+    """
+
+    def __init__(self):
+        """初始化空配置"""
+        self._sections: Dict[str, Dict[str, str]] = {}
+
+    def read_string(self, text: str):
+        """
+        从字符串解析配置
+
+        Args:
+            text: INI 格式文本
+        """
+        self.read_lines(text.splitlines())
+
+    def read_lines(self, lines):
+        """
+        逐行解析配置
+
+        Args:
+            lines: 可迭代的文本行
+        """
+        section: Optional[Dict[str, str]] = None
+        for line in lines:
+            line = line.strip()
+            # 跳过注释和空行
+            if not line or line[0] in "#;":
+                continue
+
+            match = _SECTION_RE.match(line)
+            if match:
+                section = self._sections.setdefault(match.group(1).strip(), {})
+                continue
+
+            # 节之前的键值对无归属，忽略
+            if section is None:
+                continue
+
+            match = _KV_RE.match(line)
+            if match:
+                section[match.group(1).lower()] = match.group(2)
+
+    def to_dict(self) -> Dict[str, Dict[str, str]]:
+        """
+        获取解析结果
+
+        Returns:
+            Dict[str, Dict[str, str]]: {节: {键: 值}}
+        """
+        return self._sections
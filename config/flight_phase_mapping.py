@@ -26,9 +26,17 @@ CMS_PHASE_MAPPING = {"Taxi": "滑行", "In_Air": "空中", "Ground": "地面"}
 # 合并所有映射
 PHASE_MAPPING = {**RTMU_PHASE_MAPPING, **CMS_PHASE_MAPPING}
 
+# 带默认后缀的阶段名称（预先拼接，常用路径无需逐次格式化）
+_PHASE_NAME_WITH_SUFFIX = {code: f"{name}阶段" for code, name in PHASE_MAPPING.items()}
+
 # 故障类型映射
 FAULT_TYPE_MAPPING = {"MMSG": "CMS", "FDE": "CAS"}
 
+# 预绑定的查找方法（批量处理故障行时省去每次的属性查找）
+_PHASE_GET = PHASE_MAPPING.get
+_PHASE_WITH_SUFFIX_GET = _PHASE_NAME_WITH_SUFFIX.get
+_FAULT_TYPE_GET = FAULT_TYPE_MAPPING.get
+
 
 def get_fault_type_name(fault_type_code: str) -> str:
     """
@@ -48,10 +56,7 @@ def get_fault_type_name(fault_type_code: str) -> str:
         >>> get_fault_type_name('UNKNOWN')
         'UNKNOWN'
     """
-    if not fault_type_code:
-        return ""
-
-    return FAULT_TYPE_MAPPING.get(fault_type_code, fault_type_code)
+    return _FAULT_TYPE_GET(fault_type_code, fault_type_code) if fault_type_code else ""
 
 
 def get_phase_name(phase_code: str, suffix: str = "阶段") -> str:
@@ -76,8 +81,12 @@ def get_phase_name(phase_code: str, suffix: str = "阶段") -> str:
     if not phase_code:
         return ""
 
+    # 默认后缀直接查预拼接表
+    if suffix == "阶段":
+        return _PHASE_WITH_SUFFIX_GET(phase_code, phase_code)
+
     # 查找映射
-    chinese_name = PHASE_MAPPING.get(phase_code)
+    chinese_name = _PHASE_GET(phase_code)
 
     if chinese_name:
         return f"{chinese_name}{suffix}"
@@ -96,7 +105,4 @@ def get_phase_name_without_suffix(phase_code: str) -> str:
     Returns:
         str: 中文阶段名称（如 '进近'），如果找不到映射则返回原代码
     """
-    if not phase_code:
-        return ""
-
-    return PHASE_MAPPING.get(phase_code, phase_code)
+    return _PHASE_GET(phase_code, phase_code) if phase_code else ""
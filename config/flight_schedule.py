@@ -3,8 +3,54 @@
 所有时间均为越南时间（北京时间-1小时）
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+# 越南时间 = 北京时间 - 1小时
+_VIETNAM_OFFSET = timedelta(hours=1)
+
+
+def _parse_hm(time_str: str) -> Tuple[int, int]:
+    """解析 HH:MM 为 (时, 分)"""
+    hour, minute = time_str.split(":")
+    return int(hour), int(minute)
+
+
+@dataclass(frozen=True)
+class FlightInfo:
+    """单个航班的计划信息（不可变）"""
+
+    __slots__ = (
+        "scheduled_departure",
+        "duration_minutes",
+        "route",
+        "departure_airport",
+        "arrival_airport",
+        "hm",
+    )
+
+    scheduled_departure: str  # 计划起飞时间 (HH:MM, 北京时间)
+    duration_minutes: int  # 计划航程（分钟）
+    route: str  # 航线描述
+    departure_airport: str  # 起飞机场
+    arrival_airport: str  # 着陆机场
+
+    def __post_init__(self):
+        # hm: 预解析的计划起飞 (时, 分)，由 scheduled_departure 派生
+        object.__setattr__(self, "hm", _parse_hm(self.scheduled_departure))
+
+    def __getitem__(self, key: str) -> Any:
+        """兼容旧的字典式访问 flight_info["route"]"""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """兼容旧的字典式访问 flight_info.get("route")"""
+        return getattr(self, key, default)
 
 
 class FlightSchedule:
@@ -26,64 +72,70 @@ class FlightSchedule:
     #
     # 时间转换：越南时间 + 1小时 = 北京时间
     FLIGHT_SCHEDULES = {
-        "VJ105": {
-            "scheduled_departure": "07:45",  # 北京时间 (06:45越南时间 + 1)
-            "duration_minutes": 110,
-            "route": "HAN-VCS",  # 河内 → 昆岛
-            "departure_airport": "VVNB-内排国际机场",
-            "arrival_airport": "VVCS-昆仑国际机场",
-        },
-        "VJ107": {
-            "scheduled_departure": "09:15",  # 北京时间 (08:15越南时间 + 1)
-            "duration_minutes": 110,
-            "route": "HAN-VCS",  # 河内 → 昆岛
-            "departure_airport": "VVNB-内排国际机场",
-            "arrival_airport": "VVCS-昆仑国际机场",
-        },
-        "VJ112": {
-            "scheduled_departure": "10:20",  # 北京时间 (09:20越南时间 + 1)
-            "duration_minutes": 30,
-            "route": "VCS-SGN",  # 昆岛 → 胡志明
-            "departure_airport": "VVCS-昆仑国际机场",
-            "arrival_airport": "VVTS-新山一国际机场",
-        },
-        "VJ113": {
-            "scheduled_departure": "12:00",  # 北京时间 (11:00越南时间 + 1)
-            "duration_minutes": 30,
-            "route": "SGN-VCS",  # 胡志明 → 昆岛
-            "departure_airport": "VVTS-新山一国际机场",
-            "arrival_airport": "VVCS-昆仑国际机场",
-        },
-        "VJ118": {
-            "scheduled_departure": "12:00",  # 北京时间 (11:00越南时间 + 1)
-            "duration_minutes": 30,
-            "route": "VCS-SGN",  # 昆岛 → 胡志明
-            "departure_airport": "VVCS-昆仑国际机场",
-            "arrival_airport": "VVTS-新山一国际机场",
-        },
-        "VJ106": {
-            "scheduled_departure": "13:05",  # 北京时间 (12:05越南时间 + 1)
-            "duration_minutes": 110,
-            "route": "VCS-HAN",  # 昆岛 → 河内
-            "departure_airport": "VVCS-昆仑国际机场",
-            "arrival_airport": "VVNB-内排国际机场",
-        },
-        "VJ119": {
-            "scheduled_departure": "13:30",  # 北京时间 (12:30越南时间 + 1)
-            "duration_minutes": 30,
-            "route": "SGN-VCS",  # 胡志明 → 昆岛
-            "departure_airport": "VVTS-新山一国际机场",
-            "arrival_airport": "VVCS-昆仑国际机场",
-        },
-        "VJ108": {
-            "scheduled_departure": "15:00",  # 北京时间 (14:00越南时间 + 1)
-            "duration_minutes": 110,
-            "route": "VCS-HAN",  # 昆岛 → 河内
-            "departure_airport": "VVCS-昆仑国际机场",
-            "arrival_airport": "VVNB-内排国际机场",
-        },
+        "VJ105": FlightInfo(
+            scheduled_departure="07:45",  # 北京时间 (06:45越南时间 + 1)
+            duration_minutes=110,
+            route="HAN-VCS",  # 河内 → 昆岛
+            departure_airport="VVNB-内排国际机场",
+            arrival_airport="VVCS-昆仑国际机场",
+        ),
+        "VJ107": FlightInfo(
+            scheduled_departure="09:15",  # 北京时间 (08:15越南时间 + 1)
+            duration_minutes=110,
+            route="HAN-VCS",  # 河内 → 昆岛
+            departure_airport="VVNB-内排国际机场",
+            arrival_airport="VVCS-昆仑国际机场",
+        ),
+        "VJ112": FlightInfo(
+            scheduled_departure="10:20",  # 北京时间 (09:20越南时间 + 1)
+            duration_minutes=30,
+            route="VCS-SGN",  # 昆岛 → 胡志明
+            departure_airport="VVCS-昆仑国际机场",
+            arrival_airport="VVTS-新山一国际机场",
+        ),
+        "VJ113": FlightInfo(
+            scheduled_departure="12:00",  # 北京时间 (11:00越南时间 + 1)
+            duration_minutes=30,
+            route="SGN-VCS",  # 胡志明 → 昆岛
+            departure_airport="VVTS-新山一国际机场",
+            arrival_airport="VVCS-昆仑国际机场",
+        ),
+        "VJ118": FlightInfo(
+            scheduled_departure="12:00",  # 北京时间 (11:00越南时间 + 1)
+            duration_minutes=30,
+            route="VCS-SGN",  # 昆岛 → 胡志明
+            departure_airport="VVCS-昆仑国际机场",
+            arrival_airport="VVTS-新山一国际机场",
+        ),
+        "VJ106": FlightInfo(
+            scheduled_departure="13:05",  # 北京时间 (12:05越南时间 + 1)
+            duration_minutes=110,
+            route="VCS-HAN",  # 昆岛 → 河内
+            departure_airport="VVCS-昆仑国际机场",
+            arrival_airport="VVNB-内排国际机场",
+        ),
+        "VJ119": FlightInfo(
+            scheduled_departure="13:30",  # 北京时间 (12:30越南时间 + 1)
+            duration_minutes=30,
+            route="SGN-VCS",  # 胡志明 → 昆岛
+            departure_airport="VVTS-新山一国际机场",
+            arrival_airport="VVCS-昆仑国际机场",
+        ),
+        "VJ108": FlightInfo(
+            scheduled_departure="15:00",  # 北京时间 (14:00越南时间 + 1)
+            duration_minutes=110,
+            route="VCS-HAN",  # 昆岛 → 河内
+            departure_airport="VVCS-昆仑国际机场",
+            arrival_airport="VVNB-内排国际机场",
+        ),
     }
 
+    # 包装为只读映射，防止运行时被意外修改
+    FLIGHT_SCHEDULES: Mapping[str, FlightInfo] = MappingProxyType(FLIGHT_SCHEDULES)
+
+    # 当天计划起飞时间缓存 {(日期, 航班号): datetime}，只保留当天的条目
+    _departure_cache: Dict[Tuple[date, str], datetime] = {}
+
     # 航线链配置
     # 每条航线链是一组必须按顺序执行的航班,最终都回到河内
     # 只有完成航线链的最后一个航班,才算完成当日任务
@@ -93,14 +145,14 @@ class FlightSchedule:
     }
 
     @classmethod
-    def get_flight_info(cls, flight_number: str) -> Optional[Dict]:
+    def get_flight_info(cls, flight_number: str) -> Optional[FlightInfo]:
         """获取航班信息"""
-        return cls.FLIGHT_SCHEDULES.get(flight_number)
+        return _get_flight_info(flight_number)
 
     @classmethod
     def get_all_flights(cls) -> List[str]:
         """获取所有航班号列表"""
-        return list(cls.FLIGHT_SCHEDULES.keys())
+        return list(cls.FLIGHT_SCHEDULES)
 
     @classmethod
     def get_route_chain(cls, flight_number: str) -> Optional[List[str]]:
@@ -152,8 +204,7 @@ class FlightSchedule:
         if not flight_info:
             raise ValueError(f"未知航班号: {flight_number}")
 
-        duration = flight_info["duration_minutes"]
-        return actual_departure_time + timedelta(minutes=duration)
+        return actual_departure_time + timedelta(minutes=flight_info.duration_minutes)
 
     @classmethod
     def parse_scheduled_time(cls, time_str: str, base_date: datetime = None) -> datetime:
@@ -174,7 +225,7 @@ class FlightSchedule:
         if base_date is None:
             base_date = datetime.now()
 
-        hour, minute = map(int, time_str.split(":"))
+        hour, minute = _parse_hm(time_str)
         # 直接使用配置时间，就是北京时间
         return base_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
@@ -196,10 +247,24 @@ class FlightSchedule:
         if not flight_info:
             raise ValueError(f"未知航班号: {flight_number}")
 
-        return cls.parse_scheduled_time(flight_info["scheduled_departure"], base_date)
-
-    @classmethod
-    def to_vietnam_time(cls, beijing_dt: datetime) -> datetime:
+        hour, minute = flight_info.hm
+        if base_date is not None:
+            return base_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+        # 未指定日期时按 (今天, 航班号) 缓存，每个航班每天只构造一次
+        today = date.today()
+        key = (today, flight_number)
+        cached = cls._departure_cache.get(key)
+        if cached is None:
+            # 跨天后清理前一天的条目
+            if any(day != today for day, _ in cls._departure_cache):
+                cls._departure_cache.clear()
+            cached = datetime(today.year, today.month, today.day, hour, minute)
+            cls._departure_cache[key] = cached
+        return cached
+
+    @staticmethod
+    def to_vietnam_time(beijing_dt: datetime) -> datetime:
         """
         将北京时间转换为越南时间（用于展示）
 
@@ -209,10 +274,10 @@ class FlightSchedule:
         Returns:
             datetime: 越南时间（北京时间-1小时）
         """
-        return beijing_dt - timedelta(hours=1)
+        return beijing_dt - _VIETNAM_OFFSET
 
-    @classmethod
-    def format_vietnam_time(cls, beijing_dt: datetime, format_str: str = "%H:%M") -> str:
+    @staticmethod
+    def format_vietnam_time(beijing_dt: datetime, format_str: str = "%H:%M") -> str:
         """
         格式化北京时间为越南时间字符串（用于邮件展示）
 
@@ -223,8 +288,11 @@ class FlightSchedule:
         Returns:
             str: 越南时间字符串
         """
-        vietnam_dt = cls.to_vietnam_time(beijing_dt)
-        return vietnam_dt.strftime(format_str)
+        return (beijing_dt - _VIETNAM_OFFSET).strftime(format_str)
+
+
+# 绑定到模块级名称，get_flight_info 每次调用只做一次字典查找
+_get_flight_info = FlightSchedule.FLIGHT_SCHEDULES.get
 
 
 if __name__ == "__main__":
@@ -238,9 +306,9 @@ if __name__ == "__main__":
     for flight_num in FlightSchedule.get_all_flights():
         info = FlightSchedule.get_flight_info(flight_num)
         print(f"{flight_num}:")
-        print(f"  计划起飞: {info['scheduled_departure']} (越南时间)")
-        print(f"  航程: {info['duration_minutes']}分钟")
-        print(f"  航线: {info['route']}")
+        print(f"  计划起飞: {info.scheduled_departure} (越南时间)")
+        print(f"  航程: {info.duration_minutes}分钟")
+        print(f"  航线: {info.route}")
         print()
 
     # 测试计划到达时间计算
@@ -251,4 +319,4 @@ if __name__ == "__main__":
     scheduled_arrival = FlightSchedule.calculate_scheduled_arrival(test_flight, test_departure)
     print(f"{test_flight} 实际起飞: {test_departure.strftime('%H:%M')} (北京时间)")
     print(f"{test_flight} 计划到达: {scheduled_arrival.strftime('%H:%M')} (北京时间)")
-    print(f"航程: {FlightSchedule.get_flight_info(test_flight)['duration_minutes']}分钟")
+    print(f"航程: {FlightSchedule.get_flight_info(test_flight).duration_minutes}分钟")
@@ -30,6 +30,7 @@ Identifies abnormal flight patterns like diversions.
 #### fault_filter.py - FaultFilter
 CSV-based fault filtering with multi-column AND rules.
 Supports group filtering for simultaneous faults.
+get_fault_filter() reuses one instance until the rule files change.
 
 #### data_saver.py - DataSaver
 Generic CSV data saving with automatic directory creation.
@@ -74,11 +75,13 @@ tracker.update_flight_status("B-1234", "VJ105", "AIRBORNE")
 - BrowserHandler manages Chrome debug port connections
 - LoginManager handles page state detection and navigation
 - FlightTracker coordinates monitoring priority between schedulers
-- BaseMonitor uses MD5 hash for content change detection
+- BaseMonitor uses BLAKE2b hash for content change detection
 - BaseNotifier prevents duplicate email notifications
 - All log files automatically rotate and are cleaned up after 24h
 """
 
+from importlib import import_module
+
 # 延迟导入，避免依赖问题
 __all__ = [
     "BrowserHandler",
@@ -86,6 +89,7 @@ __all__ = [
     "FlightTracker",
     "AbnormalDetector",
     "FaultFilter",
+    "get_fault_filter",
     "DataSaver",
     "BaseMonitor",
     "BaseNotifier",
@@ -93,42 +97,28 @@ __all__ = [
 ]
 
 
-def __getattr__(name):
-    """延迟导入，只在需要时加载模块"""
-    if name == "BrowserHandler":
-        from .browser_handler import BrowserHandler
-
-        return BrowserHandler
-    elif name == "LoginManager":
-        from .login_manager import LoginManager
-
-        return LoginManager
-    elif name == "FlightTracker":
-        from .flight_tracker import FlightTracker
-
-        return FlightTracker
-    elif name == "AbnormalDetector":
-        from .abnormal_detector import AbnormalDetector
+# 延迟导入表：属性名 -> (子模块名, 模块内名称)
+_LAZY_IMPORTS = {
+    "BrowserHandler": ("browser_handler", "BrowserHandler"),
+    "LoginManager": ("login_manager", "LoginManager"),
+    "FlightTracker": ("flight_tracker", "FlightTracker"),
+    "AbnormalDetector": ("abnormal_detector", "AbnormalDetector"),
+    "FaultFilter": ("fault_filter", "FaultFilter"),
+    "get_fault_filter": ("fault_filter", "get_fault_filter"),
+    "DataSaver": ("data_saver", "DataSaver"),
+    "BaseMonitor": ("base_monitor", "BaseStatusMonitor"),
+    "BaseNotifier": ("base_notifier", "BaseNotifier"),
+    "get_logger": ("logger", "get_logger"),
+}
 
-        return AbnormalDetector
-    elif name == "FaultFilter":
-        from .fault_filter import FaultFilter
 
-        return FaultFilter
-    elif name == "DataSaver":
-        from .data_saver import DataSaver
-
-        return DataSaver
-    elif name == "BaseMonitor":
-        from .base_monitor import BaseMonitor
-
-        return BaseMonitor
-    elif name == "BaseNotifier":
-        from .base_notifier import BaseNotifier
-
-        return BaseNotifier
-    elif name == "get_logger":
-        from .logger import get_logger
-
-        return get_logger
-    raise AttributeError(f"module {__name__} has no attribute {name}")
+def __getattr__(name):
+    """延迟导入，只在需要时加载模块（加载后缓存到模块属性，后续访问不再经过此函数）"""
+    entry = _LAZY_IMPORTS.get(name)
+    if entry is None:
+        raise AttributeError(f"module {__name__} has no attribute {name}")
+
+    module_name, attr = entry
+    value = getattr(import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
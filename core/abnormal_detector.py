@@ -7,6 +7,8 @@
 - 支持未知航班、航线异常、起降机场相同等情况
 """
 
+import functools
+from types import MappingProxyType
 from typing import Dict, Optional
 
 import pandas as pd
@@ -14,6 +16,69 @@ import pandas as pd
 from config.flight_schedule import FlightSchedule
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_airport_short(airport_str: str) -> str:
+    """
+    从机场全名动态解析简短名称（结果缓存，机场种类很少）
+
+    空值判断留在调用方：NaN 互不相等，放进缓存会导致缓存无法命中
+
+    Args:
+        airport_str: 完整机场名称（如 'VVCI-海防吉碑国际'）
+
+    Returns:
+        str: 简短名称（如 '海防吉碑'）
+    """
+    # 动态解析：从机场代码后的名称中提取
+    # 格式: "VVCI-海防吉碑国际" -> 提取 "海防吉碑"
+    if "-" in airport_str:
+        parts = airport_str.split("-", 1)
+        if len(parts) == 2:
+            name_part = parts[1]  # "海防吉碑国际"
+
+            # 移除通用后缀（按优先级）
+            # "国际机场" -> 移除
+            # "机场" -> 移除
+            # "国际" -> 移除（仅在"机场"不存在时）
+            if name_part.endswith("国际机场"):
+                name_part = name_part[:-4]
+            elif name_part.endswith("机场") or name_part.endswith("国际"):
+                name_part = name_part[:-2]
+
+            return name_part if name_part else airport_str
+
+    # 如果没有 '-'，直接返回
+    return airport_str
+
+
+@functools.lru_cache(maxsize=None)
+def _build_route_tables():
+    """
+    构建正常航班的查找表（航班计划只读，结果缓存后各检测器实例共享）
+
+    Returns:
+        tuple: (正常航班号集合, 正常城市对映射, 正常 (航班号, 起飞机场, 着陆机场) 集合)
+    """
+    normal_flights = FlightSchedule.FLIGHT_SCHEDULES
+
+    # 构建正常城市对映射
+    # 格式: {航班号: {(起飞机场, 着陆机场): 航线描述}}
+    normal_route_pairs = {}
+    for flight_num, info in normal_flights.items():
+        dep = info.departure_airport  # 如 'VVNB-内排国际机场'
+        arr = info.arrival_airport  # 如 'VVCS-昆仑国际机场'
+        normal_route_pairs[flight_num] = MappingProxyType({(dep, arr): info.route})
+
+    # 正常的 (航班号, 起飞机场, 着陆机场) 组合，正常航班只需一次集合查找
+    valid_triples = frozenset(
+        (flight_num, dep, arr)
+        for flight_num, routes in normal_route_pairs.items()
+        for dep, arr in routes
+    )
+
+    return frozenset(normal_flights), MappingProxyType(normal_route_pairs), valid_triples
+
+
 class AbnormalDetector:
     """动态异常检测器"""
 
@@ -24,19 +89,24 @@ class AbnormalDetector:
         "VVTS-新山一国际机场": "胡志明",
     }
 
+    # 异常类型代码 -> 中文名称
+    ABNORMAL_TYPE_DESCRIPTIONS = MappingProxyType(
+        {
+            "unknown_flight": "检测到非计划航班",
+            "route_mismatch": "航线异常",
+            "same_airport": "起降机场相同",
+        }
+    )
+
     def __init__(self):
         """初始化异常检测器"""
-        # 从 FlightSchedule 加载正常航班配置
+        # 从 FlightSchedule 加载正常航班配置（查找表在进程内只构建一次，各实例共享）
         self.normal_flights = FlightSchedule.FLIGHT_SCHEDULES
-        self.normal_flight_numbers = set(self.normal_flights.keys())
-
-        # 构建正常城市对映射
-        # 格式: {航班号: {(起飞机场, 着陆机场): 航线描述}}
-        self.normal_route_pairs = {}
-        for flight_num, info in self.normal_flights.items():
-            dep = info["departure_airport"]  # 如 'VVNB-内排国际机场'
-            arr = info["arrival_airport"]  # 如 'VVCS-昆仑国际机场'
-            self.normal_route_pairs[flight_num] = {(dep, arr): info["route"]}
+        (
+            self.normal_flight_numbers,
+            self.normal_route_pairs,
+            self._valid_triples,
+        ) = _build_route_tables()
 
     @classmethod
     def get_airport_short(cls, airport_full: str) -> str:
@@ -58,26 +128,7 @@ class AbnormalDetector:
         if airport_str in cls.AIRPORT_MAPPING:
             return cls.AIRPORT_MAPPING[airport_str]
 
-        # 动态解析：从机场代码后的名称中提取
-        # 格式: "VVCI-海防吉碑国际" -> 提取 "海防吉碑"
-        if "-" in airport_str:
-            parts = airport_str.split("-", 1)
-            if len(parts) == 2:
-                name_part = parts[1]  # "海防吉碑国际"
-
-                # 移除通用后缀（按优先级）
-                # "国际机场" -> 移除
-                # "机场" -> 移除
-                # "国际" -> 移除（仅在"机场"不存在时）
-                if name_part.endswith("国际机场"):
-                    name_part = name_part[:-4]
-                elif name_part.endswith("机场") or name_part.endswith("国际"):
-                    name_part = name_part[:-2]
-
-                return name_part if name_part else airport_str
-
-        # 如果没有 '-'，直接返回
-        return airport_str
+        return _parse_airport_short(airport_str)
 
     def detect_abnormal(
         self, flight_number: str, departure_airport: str, arrival_airport: str
@@ -104,6 +155,10 @@ class AbnormalDetector:
         if pd.isna(departure_airport) or pd.isna(arrival_airport):
             return None
 
+        # 正常航线（最常见情况）直接返回
+        if (flight_number, departure_airport, arrival_airport) in self._valid_triples:
+            return None
+
         # 情况1: 未知航班号
         if flight_number not in self.normal_flight_numbers:
             dep_short = self.get_airport_short(departure_airport)
@@ -125,30 +180,23 @@ class AbnormalDetector:
             return {
                 "is_abnormal": True,
                 "abnormal_type": "same_airport",
-                "original_route": original_info["route"],
+                "original_route": original_info.route,
                 "actual_route": f"{dep_short}-{dep_short}",
                 "abnormal_airport": dep_short,
             }
 
-        # 情况3: 城市对不匹配
-        normal_routes = self.normal_route_pairs.get(flight_number, {})
-        actual_pair = (departure_airport, arrival_airport)
-
-        if actual_pair not in normal_routes:
-            original_info = self.normal_flights[flight_number]
-            dep_short = self.get_airport_short(departure_airport)
-            arr_short = self.get_airport_short(arrival_airport)
-
-            return {
-                "is_abnormal": True,
-                "abnormal_type": "route_mismatch",
-                "original_route": original_info["route"],
-                "actual_route": f"{dep_short}-{arr_short}",
-                "abnormal_airport": arr_short,
-            }
-
-        # 正常情况
-        return None
+        # 情况3: 城市对不匹配（正常航线已在开头排除）
+        original_info = self.normal_flights[flight_number]
+        dep_short = self.get_airport_short(departure_airport)
+        arr_short = self.get_airport_short(arrival_airport)
+
+        return {
+            "is_abnormal": True,
+            "abnormal_type": "route_mismatch",
+            "original_route": original_info.route,
+            "actual_route": f"{dep_short}-{arr_short}",
+            "abnormal_airport": arr_short,
+        }
 
     def check_abnormal_from_row(self, row: pd.Series) -> Optional[Dict]:
         """
@@ -166,7 +214,34 @@ class AbnormalDetector:
 
         return self.detect_abnormal(flight_number, departure_airport, arrival_airport)
 
-    def get_abnormal_type_description(self, abnormal_type: str) -> str:
+    def detect_abnormal_types(self, df: pd.DataFrame) -> pd.Series:
+        """
+        批量检测异常类型（向量化，与 detect_abnormal 逐行判断的结果一致）
+
+        Args:
+            df: 包含 航班号 / 起飞机场 / 着陆机场 列的数据
+
+        Returns:
+            pd.Series: 与 df 同索引的异常类型，正常或机场为空时为 None
+        """
+        flight_number = df["航班号"]
+        departure_airport = df["起飞机场"]
+        arrival_airport = df["着陆机场"]
+
+        has_airports = departure_airport.notna() & arrival_airport.notna()
+        is_normal_route = pd.MultiIndex.from_arrays(
+            [flight_number, departure_airport, arrival_airport]
+        ).isin(self._valid_triples)
+
+        # 按优先级从低到高赋值，高优先级覆盖低优先级
+        abnormal_types = pd.Series("route_mismatch", index=df.index, dtype=object)
+        abnormal_types[departure_airport == arrival_airport] = "same_airport"
+        abnormal_types[~flight_number.isin(self.normal_flight_numbers)] = "unknown_flight"
+        abnormal_types[is_normal_route | ~has_airports] = None
+        return abnormal_types
+
+    @classmethod
+    def get_abnormal_type_description(cls, abnormal_type: str) -> str:
         """
         获取异常类型的中文名称
 
@@ -176,12 +251,7 @@ class AbnormalDetector:
         Returns:
             str: 中文名称
         """
-        type_map = {
-            "unknown_flight": "检测到非计划航班",
-            "route_mismatch": "航线异常",
-            "same_airport": "起降机场相同",
-        }
-        return type_map.get(abnormal_type, "未知异常")
+        return cls.ABNORMAL_TYPE_DESCRIPTIONS.get(abnormal_type, "未知异常")
 
 
 if __name__ == "__main__":
@@ -11,17 +11,26 @@
 - get_data_file_path(): 获取数据文件路径
 - get_status_file_path(): 获取状态文件路径
 - generate_content(): 生成通知内容
-- get_content_hash(): 获取内容哈希值
 - send_notification(): 发送通知
+
+子类可选重写：
+- get_content_hash(): 获取内容哈希值（默认对内容文本做 BLAKE2b 哈希）
+- get_legacy_content_hash(): 旧版本的 MD5 内容哈希（与 get_content_hash 对应重写）
+- get_source_files(): 通知内容依赖的文件（默认仅数据文件），均未变化时跳过本轮检查
 """
 
+import contextlib
+import hashlib
 import json
 import os
 import sys
 from abc import ABC, abstractmethod
 from datetime import datetime
 
-import pandas as pd
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时使用标准库 json
+    orjson = None
 
 # 添加项目根目录到路径
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -32,6 +41,102 @@ from core.logger import get_logger
 from exceptions.data import DataFileError, DataParseError
 from exceptions.notification import EmailSendError
 
+# 内容哈希算法标识，随状态一起保存；旧状态文件（MD5）没有此字段
+CONTENT_HASH_ALGO = "blake2b-128"
+
+
+def hash_text(text: str) -> str:
+    """
+    计算文本的变化检测哈希
+
+    仅用于判断内容是否变化，不需要密码学强度；BLAKE2b 在 64 位平台上比 MD5 更快
+
+    Args:
+        text: 文本内容
+
+    Returns:
+        str: 32 位十六进制哈希值
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def legacy_hash_text(text: str) -> str:
+    """
+    计算文本的旧版哈希（MD5），仅用于与升级前保存的状态对比
+
+    Args:
+        text: 文本内容
+
+    Returns:
+        str: 32 位十六进制哈希值
+    """
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def read_csv(path):
+    """
+    读取 CSV 文件
+
+    不使用 pyarrow 引擎：其推断的日期/时间、全空列等类型与 C 引擎不一致，
+    对监控读取的小文件也没有明显收益
+
+    Args:
+        path: CSV 文件路径
+
+    Returns:
+        pd.DataFrame: 数据
+    """
+    # pandas 导入较慢（约 0.2 秒），仅在实际读取数据时导入
+    import pandas as pd
+
+    return pd.read_csv(path)
+
+
+def read_json(path):
+    """
+    读取 JSON 文件
+
+    Args:
+        path: 文件路径
+
+    Returns:
+        解析结果
+
+    Raises:
+        json.JSONDecodeError: JSON 格式错误（orjson.JSONDecodeError 是其子类）
+        OSError: 文件读取失败
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def write_json(path, obj):
+    """
+    写入 JSON 文件（UTF-8，缩进 2 格，不转义非 ASCII 字符）
+
+    先写入同目录的临时文件再原子替换，进程中途退出不会留下半截文件
+    （否则下次读取失败会被当作首次运行而重复发送通知）
+
+    Args:
+        path: 文件路径
+        obj: 要写入的对象
+    """
+    if orjson:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
 
 class BaseStatusMonitor(ABC):
     """
@@ -45,14 +150,21 @@ class BaseStatusMonitor(ABC):
     5. 保存当前状态
     """
 
-    def __init__(self, target_date=None):
+    def __init__(self, target_date=None, verbose=True):
         """
         初始化监控器
 
         Args:
             target_date: 目标日期（YYYY-MM-DD格式），默认为今天
+            verbose: 是否在控制台输出过程信息（警告和错误始终输出，日志照常记录）
         """
         self.target_date = target_date or datetime.now().strftime("%Y-%m-%d")
+        self.verbose = verbose
+        # 路径只依赖 target_date，初始化时计算一次，避免每轮监控重复拼接
+        self._data_file = self.get_data_file_path()
+        self._status_file = self.get_status_file_path()
+        # 已确认存在的目录，避免每次保存状态都调用 makedirs
+        self._ensured_dirs = set()
         self.log = get_logger()
         self.config_loader = load_config()
         self.gmail_config = self.config_loader.get_gmail_config()
@@ -60,6 +172,27 @@ class BaseStatusMonitor(ABC):
         # 确保数据目录存在
         self._ensure_data_dir()
 
+    def _echo(self, message):
+        """
+        输出过程信息（verbose=False 时不输出）
+
+        Args:
+            message: 信息文本
+        """
+        if self.verbose:
+            print(message)
+
+    def _ensure_dir(self, path):
+        """
+        确保目录存在（同一目录只创建一次）
+
+        Args:
+            path: 目录路径
+        """
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+
     def _ensure_data_dir(self):
         """确保数据目录存在"""
         data_dir = os.path.join(project_root, "data")
@@ -70,7 +203,8 @@ class BaseStatusMonitor(ABC):
         """
         获取数据文件路径
 
-        子类必须实现此方法，返回要监控的数据文件路径
+        子类必须实现此方法，返回要监控的数据文件路径。
+        仅在 __init__ 中调用一次，结果缓存在 self._data_file
 
         Returns:
             str: 数据文件的完整路径
@@ -82,7 +216,8 @@ class BaseStatusMonitor(ABC):
         """
         获取状态文件路径
 
-        子类必须实现此方法，返回用于存储上次状态的状态文件路径
+        子类必须实现此方法，返回用于存储上次状态的状态文件路径。
+        仅在 __init__ 中调用一次，结果缓存在 self._status_file
 
         Returns:
             str: 状态文件的完整路径
@@ -104,20 +239,37 @@ class BaseStatusMonitor(ABC):
         """
         pass
 
-    @abstractmethod
     def get_content_hash(self, content):
         """
         获取内容的哈希值
 
-        子类必须实现此方法，生成内容的唯一标识
+        默认实现：列表内容按行拼接，其他内容转为字符串后计算哈希。
+        子类可重写以自定义变化检测的粒度。
 
         Args:
             content: generate_content() 返回的内容
 
         Returns:
-            str: MD5 哈希值
+            str: 哈希值
         """
-        pass
+        text = "\n".join(content) if isinstance(content, list) else str(content)
+        return hash_text(text)
+
+    def get_legacy_content_hash(self, content):
+        """
+        获取内容的旧版（MD5）哈希值
+
+        升级前的状态文件没有 hash_algo 字段，保存的是 MD5 哈希；
+        据此判断内容是否变化，避免升级后首次运行重复发送通知。
+
+        Args:
+            content: generate_content() 返回的内容
+
+        Returns:
+            str: 哈希值
+        """
+        text = "\n".join(content) if isinstance(content, list) else str(content)
+        return legacy_hash_text(text)
 
     @abstractmethod
     def send_notification(self, content):
@@ -134,6 +286,55 @@ class BaseStatusMonitor(ABC):
         """
         pass
 
+    def get_source_files(self):
+        """
+        获取通知内容依赖的源文件
+
+        这些文件的修改时间和大小与上次保存状态时一致时，monitor() 跳过读取和哈希计算。
+        通知内容还依赖其他文件时，子类应重写并一并返回。
+
+        Returns:
+            tuple: 文件路径
+        """
+        return (self._data_file,)
+
+    def get_source_stat(self):
+        """
+        获取源文件的 [修改时间(ns), 大小] 列表
+
+        Returns:
+            list: 每个源文件对应一项，文件不存在时为 None
+        """
+        source_stat = []
+        for path in self.get_source_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                source_stat.append(None)
+            else:
+                source_stat.append([stat.st_mtime_ns, stat.st_size])
+        return source_stat
+
+    def get_source_digest(self):
+        """
+        计算源文件原始字节的哈希
+
+        源文件被重写但内容未变时（修改时间变化），据此跳过 CSV 解析和内容生成
+
+        Returns:
+            str: 哈希值，任一源文件不存在或读取失败时返回 None
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for path in self.get_source_files():
+            try:
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+            except OSError:
+                return None
+            # 分隔不同文件，避免内容拼接后碰撞
+            digest.update(b"\0")
+        return digest.hexdigest()
+
     def read_data_file(self):
         """
         读取数据文件
@@ -141,7 +342,9 @@ class BaseStatusMonitor(ABC):
         Returns:
             pd.DataFrame: 数据DataFrame，读取失败返回 None
         """
-        data_file = self.get_data_file_path()
+        import pandas as pd
+
+        data_file = self._data_file
 
         if not os.path.exists(data_file):
             error_msg = f"数据文件不存在: {data_file}"
@@ -154,8 +357,8 @@ class BaseStatusMonitor(ABC):
             )
 
         try:
-            df = pd.read_csv(data_file)
-            print(f"   ✅ 读取到 {len(df)} 行数据")
+            df = read_csv(data_file)
+            self._echo(f"   ✅ 读取到 {len(df)} 行数据")
             return df
         except pd.errors.EmptyDataError as e:
             error_msg = f"数据文件为空: {data_file}"
@@ -200,16 +403,15 @@ class BaseStatusMonitor(ABC):
         Returns:
             dict: 状态字典，如果文件不存在或读取失败返回 None
         """
-        status_file = self.get_status_file_path()
+        status_file = self._status_file
 
         if not os.path.exists(status_file):
             return None
 
         try:
-            with open(status_file, encoding="utf-8") as f:
-                status_data = json.load(f)
-                print("   📋 上次状态已加载")
-                return status_data
+            status_data = read_json(status_file)
+            self._echo("   📋 上次状态已加载")
+            return status_data
         except json.JSONDecodeError as e:
             print(f"   ⚠️ 状态文件JSON格式错误: {e}")
             self.log(f"状态文件解析失败: {status_file} - {e}", "WARNING")
@@ -231,10 +433,10 @@ class BaseStatusMonitor(ABC):
             status_hash: 当前状态的哈希值
             **metadata: 额外的元数据（如通知内容、数据量等）
         """
-        status_file = self.get_status_file_path()
+        status_file = self._status_file
 
         try:
-            os.makedirs(os.path.dirname(status_file), exist_ok=True)
+            self._ensure_dir(os.path.dirname(status_file))
 
             status_data = {
                 "status_hash": status_hash,
@@ -243,10 +445,9 @@ class BaseStatusMonitor(ABC):
                 **metadata,
             }
 
-            with open(status_file, "w", encoding="utf-8") as f:
-                json.dump(status_data, f, ensure_ascii=False, indent=2)
+            write_json(status_file, status_data)
 
-            print("   💾 已保存当前状态")
+            self._echo("   💾 已保存当前状态")
             self.log(f"状态已保存: {status_file}")
         except OSError as e:
             print(f"   ⚠️ 保存状态失败: {e}")
@@ -267,19 +468,19 @@ class BaseStatusMonitor(ABC):
             bool: 状态变化返回 True，否则返回 False
         """
         if last_status is None:
-            print("   ✅ 首次运行，需要发送通知")
+            self._echo("   ✅ 首次运行，需要发送通知")
             return True
 
         last_hash = last_status.get("status_hash")
-        print(f"   📊 上次状态哈希: {last_hash}")
-        print(f"   📊 当前状态哈希: {current_hash}")
+        self._echo(f"   📊 上次状态哈希: {last_hash}")
+        self._echo(f"   📊 当前状态哈希: {current_hash}")
 
         if current_hash == last_hash:
-            print("\n   ℹ️ 状态无变化，跳过通知")
+            self._echo("\n   ℹ️ 状态无变化，跳过通知")
             self.log("状态无变化，跳过通知")
             return False
 
-        print("\n   ✅ 检测到状态变化")
+        self._echo("\n   ✅ 检测到状态变化")
         return True
 
     def monitor(self):
@@ -287,9 +488,10 @@ class BaseStatusMonitor(ABC):
         执行监控流程
 
         这是模板方法，定义了完整的监控流程：
+        0. 加载上次状态（源文件修改时间或内容未变化时直接返回）
         1. 读取数据文件
         2. 生成通知内容
-        3. 加载上次状态
+        3. 计算状态哈希
         4. 对比哈希值
         5. 发送通知（如果状态变化）
         6. 保存当前状态
@@ -297,20 +499,52 @@ class BaseStatusMonitor(ABC):
         Returns:
             bool: 监控成功返回 True，否则返回 False
         """
-        print(f"📅 监控日期：{self.target_date}")
+        self._echo(f"📅 监控日期：{self.target_date}")
+
+        # 0. 加载上次状态；源文件自上次保存后未变化时无需读取和计算哈希
+        self._echo("\n📋 加载上次状态...")
+        last_status = self.load_last_status()
+        source_stat = self.get_source_stat()
+        if (
+            last_status
+            and None not in source_stat
+            and last_status.get("source_stat") == source_stat
+        ):
+            self._echo("   ℹ️ 数据文件未变化，跳过本次状态检查")
+            self.log("数据文件未变化，跳过本次状态检查")
+            return True
+
+        source_digest = self.get_source_digest()
+        if (
+            last_status
+            and source_digest is not None
+            and last_status.get("source_digest") == source_digest
+        ):
+            self._echo("   ℹ️ 数据文件内容未变化，跳过本次状态检查")
+            self.log("数据文件内容未变化，跳过本次状态检查")
+            # 记录新的修改时间，下次直接按修改时间跳过，不再计算内容哈希
+            if None not in source_stat:
+                metadata = {
+                    key: value
+                    for key, value in last_status.items()
+                    if key not in ("status_hash", "timestamp", "date")
+                }
+                metadata["source_stat"] = source_stat
+                self.save_current_status(last_status.get("status_hash"), **metadata)
+            return True
 
         # 1. 读取数据文件
-        print("\n📂 读取数据文件...")
+        self._echo("\n📂 读取数据文件...")
         df = self.read_data_file()
         if df is None:
             return False
 
         # 2. 生成通知内容
-        print("\n📊 生成通知内容...")
+        self._echo("\n📊 生成通知内容...")
         try:
             content = self.generate_content(df)
             if not content:
-                print("   ℹ️ 无通知内容")
+                self._echo("   ℹ️ 无通知内容")
                 return True
         except (ValueError, KeyError) as e:
             # 数据验证或字段缺失错误
@@ -324,27 +558,34 @@ class BaseStatusMonitor(ABC):
 
         # 3. 计算当前状态哈希
         current_hash = self.get_content_hash(content)
-        print(f"   🔐 当前状态哈希: {current_hash}")
-
-        # 4. 加载上次状态
-        print("\n📋 加载上次状态...")
-        last_status = self.load_last_status()
-
-        # 5. 对比状态，检查是否需要发送通知
-        if not self.has_status_changed(current_hash, last_status):
+        self._echo(f"   🔐 当前状态哈希: {current_hash}")
+
+        status_metadata = {
+            "hash_algo": CONTENT_HASH_ALGO,
+            "source_stat": source_stat,
+            "source_digest": source_digest,
+            "content": content if isinstance(content, str) else None,
+        }
+
+        # 4. 对比状态，检查是否需要发送通知
+        if last_status and last_status.get("hash_algo") != CONTENT_HASH_ALGO:
+            # 旧状态文件保存的是 MD5 哈希：内容未变化时按新算法重新保存状态，不发送通知
+            legacy_hash = self.get_legacy_content_hash(content)
+            if not self.has_status_changed(legacy_hash, last_status):
+                self.save_current_status(current_hash, **status_metadata)
+                return True
+        elif not self.has_status_changed(current_hash, last_status):
             return True
 
-        # 6. 发送通知
-        print("\n📧 发送通知...")
+        # 5. 发送通知
+        self._echo("\n📧 发送通知...")
         try:
             success = self.send_notification(content)
             if success:
-                print("   ✅ 通知发送成功")
+                self._echo("   ✅ 通知发送成功")
 
-                # 7. 保存当前状态
-                self.save_current_status(
-                    current_hash, content=content if isinstance(content, str) else None
-                )
+                # 6. 保存当前状态
+                self.save_current_status(current_hash, **status_metadata)
                 return True
             else:
                 print("   ⚠️ 通知发送失败")
@@ -3,7 +3,7 @@
 
 提供通用的邮件发送功能：
 - 配置管理（支持 config.ini 和 YAML）
-- 邮件发送（支持 SSL/TLS）
+- 邮件发送（支持 SSL/TLS，复用已认证的 SMTP 连接）
 - 附件处理
 - 频率控制
 
@@ -11,19 +11,137 @@
 - 专用的通知方法（如 send_leg_status_notification）
 """
 
+import atexit
+import contextlib
+import functools
+import mmap
 import os
 import smtplib
+import threading
+import weakref
 from abc import ABC
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from email.mime.application import MIMEApplication
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage, MIMEPart
 from typing import List
 
-import yaml
+from exceptions.notification import EmailSendError
 
 from .logger import get_logger
 
+# 汇总报告正文模板及缺省值
+_SUMMARY_REPORT_TEMPLATE = """\
+数据抓取汇总报告
+报告日期: {date}
+
+【航班数据】
+  抓取次数: {flight_fetch_count}
+  成功次数: {flight_success_count}
+  失败次数: {flight_failure_count}
+
+【故障数据】
+  抓取次数: {faults_fetch_count}
+  成功次数: {faults_success_count}
+  失败次数: {faults_failure_count}
+
+【累计数据】
+  航班累计飞行时间: {total_air_time} 小时
+  航班累计轮挡时间: {total_block_time} 小时
+  故障累计记录数: {total_faults_count} 条"""
+
+_SUMMARY_REPORT_DEFAULTS = {
+    "date": "",
+    "flight_fetch_count": 0,
+    "flight_success_count": 0,
+    "flight_failure_count": 0,
+    "faults_fetch_count": 0,
+    "faults_success_count": 0,
+    "faults_failure_count": 0,
+    "total_air_time": "N/A",
+    "total_block_time": "N/A",
+    "total_faults_count": "N/A",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_yaml(path: str, mtime_ns: int):
+    """
+    解析 YAML 配置文件（按 路径 + 修改时间 缓存，多个通知器实例只解析一次）
+
+    Args:
+        path: 配置文件绝对路径
+        mtime_ns: 文件修改时间（纳秒），仅用作缓存键
+
+    Returns:
+        解析结果
+    """
+    # 仅旧的 YAML 配置方式需要 yaml，按需导入；有 libyaml 时使用 C 实现的解析器
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
+
+
+@contextlib.contextmanager
+def _map_file(path: str):
+    """
+    以只读内存映射打开文件
+
+    附件编码时按行切片读取，由操作系统按页载入，不必先把整个文件读入内存。
+
+    Args:
+        path: 文件路径
+
+    Yields:
+        memoryview: 文件内容（空文件为 b""）
+    """
+    with open(path, "rb") as f:
+        # 空文件无法映射
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with mapped, memoryview(mapped) as data:
+            yield data
+
+
+@functools.lru_cache(maxsize=8)
+def _attachment_part(path: str, mtime_ns: int, size: int) -> MIMEPart:
+    """
+    构造已完成 base64 编码的附件（按 路径 + 修改时间 + 大小 缓存）
+
+    同一文件在多封邮件中作为附件时只读取、编码一次，各邮件共用同一附件对象。
+
+    Args:
+        path: 附件文件路径
+        mtime_ns: 文件修改时间（纳秒），仅用作缓存键
+        size: 文件大小，仅用作缓存键
+
+    Returns:
+        MIMEPart: 附件（子部分不带 MIME-Version 头）
+    """
+    part = MIMEPart()
+    with _map_file(path) as data:
+        part.set_content(
+            data,
+            maintype="application",
+            subtype="octet-stream",
+            filename=os.path.basename(path),
+        )
+    return part
+
+
+# 持有 SMTP 连接或后台发送线程的通知器（弱引用，不阻止回收），进程退出时统一关闭
+_OPEN_NOTIFIERS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_notifiers():
+    """进程退出时关闭所有仍打开的 SMTP 连接"""
+    for notifier in list(_OPEN_NOTIFIERS):
+        notifier.close()
+
 
 class BaseNotifier(ABC):
     """
@@ -32,6 +150,15 @@ class BaseNotifier(ABC):
     提供通用的邮件发送功能，子类实现具体的业务通知方法
     """
 
+    # 批量发送达到此数量后才按失败率中止
+    BATCH_MIN_SIZE = 30
+
+    # SMTP 连接与读写超时（秒），避免复用的连接在网络异常时无限阻塞
+    SMTP_TIMEOUT = 30
+
+    # 单个 SMTP 连接最多发送的邮件数，达到后重新连接（服务器通常限制每个连接的邮件数）
+    SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+
     def __init__(self, config_file=None, config_dict=None):
         """
         初始化通知器
@@ -43,6 +170,16 @@ class BaseNotifier(ABC):
         self.log = get_logger()
         self.last_send_time = 0
         self.min_send_interval = 30  # 最小发送间隔(秒),避免Gmail限流
+        # 已认证的 SMTP 连接，多次发送复用，避免重复 TLS 握手和登录
+        self._smtp = None
+        # 当前连接已发送的邮件数
+        self._smtp_sent = 0
+        # 同步发送与后台发送共用连接，发送时加锁
+        self._smtp_lock = threading.RLock()
+        # 后台发送线程（首次异步发送时创建）
+        self._executor = None
+        # 批量发送统计（仅在 batch() 内有效）
+        self._batch_stats = None
 
         # 加载配置
         if config_dict:
@@ -55,6 +192,11 @@ class BaseNotifier(ABC):
         # 检查配置
         if self.config:
             self.enabled = True
+            # 邮件头在每次发送时不变，预先生成
+            self._from_header = (
+                f"{self.config.get('sender_name', '航班状态监控系统')} <{self.config['smtp_user']}>"
+            )
+            self._to_header = self.config["receiver_email"]
             self.log(f"邮件通知器初始化成功（配置来源: {self.config_source}）")
         else:
             self.enabled = False
@@ -106,16 +248,18 @@ class BaseNotifier(ABC):
             project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             config_file = os.path.join(project_root, "email_config.yaml")
 
-        if not os.path.exists(config_file):
+        config_path = os.path.abspath(config_file)
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError:
             self.log(f"配置文件不存在: {config_file}", "ERROR")
             return None
 
         try:
-            with open(config_file, encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = _parse_yaml(config_path, mtime_ns)
 
-            # 验证必需的配置项
-            email_config = config.get("email", {})
+            # 验证必需的配置项（返回副本，避免修改缓存的解析结果）
+            email_config = dict(config.get("email", {}))
             required_fields = [
                 "smtp_server",
                 "smtp_port",
@@ -161,60 +305,203 @@ class BaseNotifier(ABC):
             return False
 
         try:
-            # 创建邮件对象
-            msg = MIMEMultipart()
-            msg["From"] = (
-                f"{self.config.get('sender_name', '航班状态监控系统')} <{self.config['smtp_user']}>"
-            )
-            msg["To"] = self.config["receiver_email"]
+            # 创建邮件对象（EmailMessage 使用新版 API，序列化比 MIMEMultipart 更快）
+            msg = EmailMessage()
+            msg["From"] = self._from_header
+            msg["To"] = self._to_header
             msg["Subject"] = subject
 
             # 添加邮件正文
-            msg.attach(MIMEText(body, "plain", "utf-8"))
+            msg.set_content(body, charset="utf-8")
 
-            # 添加附件
+            # 添加附件（文件未修改时复用已编码的附件）
             if attachments:
                 for file_path in attachments:
-                    if os.path.exists(file_path):
-                        with open(file_path, "rb") as f:
-                            part = MIMEApplication(f.read(), Name=os.path.basename(file_path))
-                        part["Content-Disposition"] = (
-                            f'attachment; filename="{os.path.basename(file_path)}"'
-                        )
-                        msg.attach(part)
-                    else:
+                    try:
+                        stat = os.stat(file_path)
+                    except FileNotFoundError:
                         self.log(f"附件不存在: {file_path}", "WARNING")
-
-            # 连接到SMTP服务器
-            smtp_server = self.config["smtp_server"]
-            smtp_port = self.config["smtp_port"]
-
-            print(f"📧 正在连接SMTP服务器: {smtp_server}:{smtp_port}")
-            print(f"📤 发件人: {self.config['smtp_user']}")
-            print(f"📥 收件人: {self.config['receiver_email']}")
-
-            if self.config.get("use_ssl", False):
-                # SSL连接
-                with smtplib.SMTP_SSL(smtp_server, smtp_port) as server:
-                    server.login(self.config["smtp_user"], self.config["smtp_password"])
-                    server.send_message(msg)
-                    print("✅ 邮件已通过SSL发送")
-            else:
-                # TLS连接
-                with smtplib.SMTP(smtp_server, smtp_port) as server:
-                    server.starttls()
-                    server.login(self.config["smtp_user"], self.config["smtp_password"])
-                    server.send_message(msg)
-                    print("✅ 邮件已通过TLS发送")
-
-            self.log(f"邮件发送成功: {subject}", "SUCCESS")
-            return True
+                        continue
+                    if not msg.is_multipart():
+                        msg.make_mixed()
+                    msg.attach(_attachment_part(file_path, stat.st_mtime_ns, stat.st_size))
+
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # 复用的连接在检查后被服务器断开，重连后重试一次
+                    self._close_smtp()
+                    self._get_smtp().send_message(msg)
+                self._smtp_sent += 1
+
+            self.log(f"邮件发送成功: {subject} -> {self._to_header}", "SUCCESS")
 
         except Exception as e:
             self.log(f"邮件发送失败: {e}", "ERROR")
-            print(f"❌ 邮件发送失败: {e}")
+            self._record_batch_result(False)
             return False
 
+        self._record_batch_result(True)
+        return True
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        批量发送上下文
+
+        块内的多次 send_email 共用同一个 SMTP 连接，退出时关闭连接。
+        已发送不少于 BATCH_MIN_SIZE 封且失败超过三分之一时抛出 EmailSendError 中止批量发送。
+
+        用法:
+            with notifier.batch():
+                notifier.send_success_notification(...)
+                notifier.send_summary_report(...)
+        """
+        if self._batch_stats is not None:
+            # 嵌套调用沿用外层批次
+            yield self
+            return
+
+        self._batch_stats = {"ok": 0, "fail": 0}
+        try:
+            yield self
+        finally:
+            stats, self._batch_stats = self._batch_stats, None
+            self.close()
+            if stats["ok"] + stats["fail"]:
+                self.log(f"批量发送完成: 成功 {stats['ok']} 封，失败 {stats['fail']} 封")
+
+    def send_many(self, messages) -> List[bool]:
+        """
+        在同一个 SMTP 连接上连续发送多封邮件，发送完毕后关闭连接
+
+        Args:
+            messages: (主题, 正文[, 附件路径列表]) 元组列表
+
+        Returns:
+            List[bool]: 每封邮件是否发送成功
+        """
+        with self.batch():
+            return [self.send_email(*message) for message in messages]
+
+    def _record_batch_result(self, success: bool):
+        """
+        记录批量发送结果，失败率过高时中止
+
+        Args:
+            success: 本次是否发送成功
+        """
+        stats = self._batch_stats
+        if stats is None:
+            return
+
+        stats["ok" if success else "fail"] += 1
+        total = stats["ok"] + stats["fail"]
+        if total >= self.BATCH_MIN_SIZE and stats["fail"] * 3 > total:
+            raise EmailSendError(
+                recipient=self._to_header,
+                reason=f"批量发送失败率过高（{stats['fail']}/{total}），已中止",
+            )
+
+    def _connect_smtp(self):
+        """
+        建立并登录 SMTP 连接
+
+        Returns:
+            smtplib.SMTP: 已认证的连接
+        """
+        smtp_server = self.config["smtp_server"]
+        smtp_port = self.config["smtp_port"]
+        self.log(f"SMTP {smtp_server}:{smtp_port} -> {self._to_header}")
+
+        if self.config.get("use_ssl", False):
+            # SSL连接
+            server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=self.SMTP_TIMEOUT)
+        else:
+            # TLS连接
+            server = smtplib.SMTP(smtp_server, smtp_port, timeout=self.SMTP_TIMEOUT)
+
+        try:
+            if not self.config.get("use_ssl", False):
+                server.starttls()
+            server.login(self.config["smtp_user"], self.config["smtp_password"])
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _get_smtp(self):
+        """
+        获取可用的 SMTP 连接
+
+        已有连接通过 NOOP 检查存活，失效或已发送 SMTP_MAX_MESSAGES_PER_CONNECTION 封时重新连接
+
+        Returns:
+            smtplib.SMTP: 已认证的连接
+        """
+        if self._smtp is not None and self._smtp_sent >= self.SMTP_MAX_MESSAGES_PER_CONNECTION:
+            self._close_smtp()
+
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+                self._smtp = None
+
+        self._smtp = self._connect_smtp()
+        self._smtp_sent = 0
+        _OPEN_NOTIFIERS.add(self)
+        return self._smtp
+
+    def send_email_async(self, subject: str, body: str, attachments: List[str] = None) -> Future:
+        """
+        在后台线程发送邮件，调用方无需等待 SMTP 往返
+
+        后台发送按提交顺序逐封进行，close() 会等待已提交的邮件发送完成。
+
+        Args:
+            subject: 邮件主题
+            body: 邮件正文
+            attachments: 附件文件路径列表
+
+        Returns:
+            Future: 结果为发送是否成功
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp")
+            _OPEN_NOTIFIERS.add(self)
+        return self._executor.submit(self.send_email, subject, body, attachments)
+
+    def close(self):
+        """等待后台发送完成，并关闭复用的 SMTP 连接"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._close_smtp()
+
+    def _close_smtp(self):
+        """关闭复用的 SMTP 连接"""
+        with self._smtp_lock:
+            server, self._smtp = self._smtp, None
+            _OPEN_NOTIFIERS.discard(self)
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def __enter__(self):
+        """支持 with 语句，退出时关闭 SMTP 连接"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """退出 with 语句时关闭 SMTP 连接"""
+        self.close()
+
     def _get_current_time(self) -> str:
         """
         获取当前时间字符串
@@ -288,27 +575,7 @@ class BaseNotifier(ABC):
         """
         subject = f"📊 数据抓取汇总报告 - {report_data.get('date', '')}"
 
-        body_lines = [
-            "数据抓取汇总报告",
-            f"报告日期: {report_data.get('date', '')}",
-            "",
-            "【航班数据】",
-            f"  抓取次数: {report_data.get('flight_fetch_count', 0)}",
-            f"  成功次数: {report_data.get('flight_success_count', 0)}",
-            f"  失败次数: {report_data.get('flight_failure_count', 0)}",
-            "",
-            "【故障数据】",
-            f"  抓取次数: {report_data.get('faults_fetch_count', 0)}",
-            f"  成功次数: {report_data.get('faults_success_count', 0)}",
-            f"  失败次数: {report_data.get('faults_failure_count', 0)}",
-            "",
-            "【累计数据】",
-            f"  航班累计飞行时间: {report_data.get('total_air_time', 'N/A')} 小时",
-            f"  航班累计轮挡时间: {report_data.get('total_block_time', 'N/A')} 小时",
-            f"  故障累计记录数: {report_data.get('total_faults_count', 'N/A')} 条",
-        ]
-
-        body = "\n".join(body_lines)
+        body = _SUMMARY_REPORT_TEMPLATE.format_map({**_SUMMARY_REPORT_DEFAULTS, **report_data})
 
         # 添加附件
         attachments = []
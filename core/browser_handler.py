@@ -34,7 +34,17 @@ class BrowserHandler:
         Returns:
             bool: 连接是否成功
         """
+        # 已有可用连接时直接复用，避免重复创建页面对象和 CDP 会话
+        if self.page is not None:
+            try:
+                if self.page.states.is_alive:
+                    return True
+            except Exception:
+                pass
+            self.page = None
+
         try:
+            # 调试端口上已有 Chrome 时 ChromiumPage 直接接管，仅在端口无浏览器时才启动新进程
             co = ChromiumOptions()
 
             if self.user_data_path and os.path.exists(self.user_data_path):
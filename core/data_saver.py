@@ -19,17 +19,49 @@ from config.constants import DEFAULT_BACKUP_KEEP_COUNT
 class DataSaver:
     """数据保存器 - 处理CSV保存和备份管理"""
 
-    def __init__(self, base_dir: str, logger):
+    def __init__(self, base_dir: str, logger, verbose: bool = True):
         """
         初始化数据保存器
 
         Args:
             base_dir: 项目根目录
             logger: 日志记录器
+            verbose: 是否在控制台输出过程信息（警告和错误始终输出）
         """
         self.base_dir = base_dir
+        self.verbose = verbose
         self.backup_dir = os.path.join(base_dir, "data", "backup")
         self.log = logger
+        # 已确认存在的目录，避免每次保存都检查/创建
+        self._ensured_dirs = set()
+
+    def _echo(self, message: str):
+        """
+        输出过程信息（verbose=False 时不输出）
+
+        Args:
+            message: 信息文本
+        """
+        if self.verbose:
+            print(message)
+
+    def _ensure_dir(self, path: str) -> bool:
+        """
+        确保目录存在（同一目录只检查一次）
+
+        Args:
+            path: 目录路径
+
+        Returns:
+            bool: 本次新建了目录返回 True
+        """
+        if path in self._ensured_dirs:
+            return False
+
+        created = not os.path.isdir(path)
+        os.makedirs(path, exist_ok=True)
+        self._ensured_dirs.add(path)
+        return created
 
     def save_csv(
         self, data: list, filename: str, subdir: str = "data/daily_raw", needs_backup: bool = False
@@ -52,9 +84,8 @@ class DataSaver:
 
         # 确保目录存在
         data_dir = os.path.join(self.base_dir, subdir)
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
-            print(f"   📁 创建文件夹: {data_dir}")
+        if self._ensure_dir(data_dir):
+            self._echo(f"   📁 创建文件夹: {data_dir}")
 
         filepath = os.path.join(data_dir, filename)
 
@@ -67,7 +98,7 @@ class DataSaver:
             with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
                 writer = csv.writer(f)
                 writer.writerows(data)
-            print(f"\n✅ 数据已保存到: {filepath}")
+            self._echo(f"\n✅ 数据已保存到: {filepath}")
             return filepath
         except Exception as e:
             print(f"   ❌ 保存CSV失败: {e}")
@@ -82,8 +113,7 @@ class DataSaver:
             filename: 文件名
         """
         # 确保备份目录存在
-        if not os.path.exists(self.backup_dir):
-            os.makedirs(self.backup_dir)
+        self._ensure_dir(self.backup_dir)
 
         # 生成带时间戳的备份文件名
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -92,9 +122,9 @@ class DataSaver:
         backup_path = os.path.join(self.backup_dir, backup_filename)
 
         try:
-            # 先备份当前文件
-            shutil.copy2(filepath, backup_path)
-            print(f"   💾 已备份总表: {backup_path}")
+            # 先备份当前文件（只复制内容；时间戳已在文件名中，无需保留元数据）
+            shutil.copyfile(filepath, backup_path)
+            self._echo(f"   💾 已备份总表: {backup_path}")
 
             # 清理旧备份，只保留最新的N个
             self._cleanup_old_backups(name, ext, DEFAULT_BACKUP_KEEP_COUNT)
@@ -113,14 +143,14 @@ class DataSaver:
         """
         try:
             # 获取所有匹配的备份文件
-            backup_files = []
-
-            for filename in os.listdir(self.backup_dir):
-                if filename.startswith(f"{base_name}_") and filename.endswith(extension):
-                    filepath = os.path.join(self.backup_dir, filename)
-                    # 获取文件修改时间
-                    mtime = os.path.getmtime(filepath)
-                    backup_files.append((filepath, mtime, filename))
+            # scandir 的目录项自带文件名和缓存的 stat，避免逐个文件再调用 getmtime
+            prefix = f"{base_name}_"
+            with os.scandir(self.backup_dir) as entries:
+                backup_files = [
+                    (entry.path, entry.stat().st_mtime, entry.name)
+                    for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith(extension)
+                ]
 
             # 按修改时间排序（最新的在前）
             backup_files.sort(key=lambda x: x[1], reverse=True)
@@ -130,7 +160,7 @@ class DataSaver:
                 files_to_delete = backup_files[keep_count:]
                 for filepath, _, filename in files_to_delete:
                     os.remove(filepath)
-                    print(f"   🗑️  删除旧备份: {filename}")
+                    self._echo(f"   🗑️  删除旧备份: {filename}")
 
         except Exception as e:
             print(f"   ⚠️ 清理旧备份失败: {e}")
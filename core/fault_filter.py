@@ -7,15 +7,26 @@
 - 支持关联故障过滤规则（同一时间的多个故障组合）
 """
 
+import functools
 import os
-from datetime import datetime
+import re
 
+import numpy as np
 import pandas as pd
 
 from core.logger import get_logger
 
 log = get_logger()
 
+# 默认规则目录：项目 config 目录（__file__ 位于 core/fault_filter.py，向上两级为项目根目录）
+_DEFAULT_CONFIG_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config"
+)
+
+# 规则文件名
+SINGLE_RULES_FILE = "fault_filter_rules.csv"
+GROUP_RULES_FILE = "fault_group_filter_rules.csv"
+
 
 class FaultFilter:
     """故障过滤器"""
@@ -29,44 +40,116 @@ class FaultFilter:
         """
         if config_dir is None:
             # 默认使用项目config目录
-            # __file__ 位于 core/fault_filter.py，需要向上两级到项目根目录
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            config_dir = os.path.join(project_root, "config")
+            config_dir = _DEFAULT_CONFIG_DIR
 
         self.config_dir = config_dir
         self.single_rules = self._load_single_filter_rules()
         self.group_rules = self._load_group_filter_rules()
 
+        # 规则在实例生命周期内不变，预先解析供每次过滤复用
+        self._single_rules_parsed = self._parse_single_rules(self.single_rules)
+        self._group_rules_parsed = self._parse_group_rules(self.group_rules)
+
+        # 所有关联规则故障描述的或式，用于一次扫描判断数据是否可能命中关联规则
+        group_descriptions = sorted(
+            {desc for _, descriptions, _ in self._group_rules_parsed for desc in descriptions}
+        )
+        self._group_desc_pattern = (
+            re.compile("|".join(map(re.escape, group_descriptions))) if group_descriptions else None
+        )
+
     def _load_single_filter_rules(self) -> pd.DataFrame:
         """加载组合过滤规则"""
-        path = os.path.join(self.config_dir, "fault_filter_rules.csv")
-        if not os.path.exists(path):
-            log(f"组合过滤规则文件不存在: {path}", "WARNING")
-            return pd.DataFrame()
-
+        path = os.path.join(self.config_dir, SINGLE_RULES_FILE)
         try:
             df = pd.read_csv(path, encoding="utf-8-sig")
             log(f"加载组合过滤规则: {len(df)} 条", "INFO")
             return df
+        except FileNotFoundError:
+            log(f"组合过滤规则文件不存在: {path}", "WARNING")
+            return pd.DataFrame()
         except Exception as e:
             log(f"加载组合过滤规则失败: {e}", "ERROR")
             return pd.DataFrame()
 
     def _load_group_filter_rules(self) -> pd.DataFrame:
         """加载关联故障过滤规则"""
-        path = os.path.join(self.config_dir, "fault_group_filter_rules.csv")
-        if not os.path.exists(path):
-            log(f"关联故障过滤规则文件不存在: {path}", "WARNING")
-            return pd.DataFrame()
-
+        path = os.path.join(self.config_dir, GROUP_RULES_FILE)
         try:
             df = pd.read_csv(path, encoding="utf-8-sig")
             log(f"加载关联故障过滤规则: {len(df)} 条", "INFO")
             return df
+        except FileNotFoundError:
+            log(f"关联故障过滤规则文件不存在: {path}", "WARNING")
+            return pd.DataFrame()
         except Exception as e:
             log(f"加载关联故障过滤规则失败: {e}", "ERROR")
             return pd.DataFrame()
 
+    @staticmethod
+    def _is_blank(value) -> bool:
+        """判断规则单元格是否为空"""
+        return pd.isna(value) or str(value).strip() == ""
+
+    @classmethod
+    def _parse_single_rules(cls, rules: pd.DataFrame) -> list:
+        """
+        解析组合过滤规则
+
+        Args:
+            rules: 组合过滤规则DataFrame
+
+        Returns:
+            list: [(规则索引, [(字段, 规则值), ...]), ...]，不含全空的规则
+        """
+        parsed = []
+        columns = list(rules.columns)
+        for idx, *values in rules.itertuples(name=None):
+            conditions = [
+                (col, str(value).strip())
+                for col, value in zip(columns, values)
+                if not cls._is_blank(value)
+            ]
+            if conditions:
+                parsed.append((idx, conditions))
+        return parsed
+
+    @classmethod
+    def _parse_group_rules(cls, rules: pd.DataFrame) -> list:
+        """
+        解析关联故障过滤规则
+
+        Args:
+            rules: 关联故障过滤规则DataFrame
+
+        Returns:
+            list: [(规则索引, [故障描述, ...], 时间间隔秒数), ...]，不含少于2个故障描述的规则
+        """
+        parsed = []
+        columns = list(rules.columns)
+        for idx, *values in rules.itertuples(name=None):
+            row = dict(zip(columns, values))
+
+            # 获取规则中定义的所有故障描述（非空）
+            fault_descriptions = [
+                str(value).strip()
+                for col, value in row.items()
+                if col.startswith("故障描述") and not cls._is_blank(value)
+            ]
+            if len(fault_descriptions) < 2:
+                continue  # 至少需要2个故障描述才构成关联规则
+
+            # 获取时间间隔阈值（秒）
+            time_threshold = 0
+            if pd.notna(row.get("时间间隔(秒)")):
+                try:
+                    time_threshold = int(row["时间间隔(秒)"])
+                except (ValueError, TypeError):
+                    time_threshold = 0
+
+            parsed.append((idx, fault_descriptions, time_threshold))
+        return parsed
+
     def apply_filters(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         应用所有过滤规则
@@ -103,50 +186,95 @@ class FaultFilter:
 
         规则说明：
         - 配置文件中同一行的多个非空字段为AND关系
-        - 使用 str.contains() 进行模糊匹配
+        - 使用 str.contains() 进行模糊匹配（规则值按字面子串匹配，不作为正则）
         - 多行规则之间为OR关系（满足任一行即过滤）
         """
-        if self.single_rules.empty:
+        if not self._single_rules_parsed:
             return df
 
-        # 记录需要过滤的索引
-        indices_to_filter = set()
-
-        # 遍历每条过滤规则
-        for idx, rule in self.single_rules.iterrows():
-            # 获取规则中所有非空字段
-            rule_conditions = []
-            for col in df.columns:
-                if col in rule.index and pd.notna(rule[col]) and str(rule[col]).strip() != "":
-                    rule_value = str(rule[col]).strip()
-                    rule_conditions.append((col, rule_value))
-
-            if not rule_conditions:
-                continue
+        # 只保留数据中存在的字段条件
+        rules = []
+        for idx, conditions in self._single_rules_parsed:
+            rule_conditions = [(col, value) for col, value in conditions if col in df.columns]
+            if rule_conditions:
+                rules.append((idx, rule_conditions))
 
-            # 应用AND逻辑：检查所有条件是否都满足
-            mask = pd.Series([True] * len(df), index=df.index)
+        if not rules:
+            return df
 
-            for col, rule_value in rule_conditions:
-                # 使用 str.contains() 进行模糊匹配
-                col_mask = df[col].astype(str).str.contains(rule_value, na=False)
-                mask = mask & col_mask
+        # 每个 (字段, 规则值) 只匹配一次，供所有规则共用
+        condition_masks = self._match_conditions(df, [cond for _, conds in rules for cond in conds])
 
-            # 将满足该规则的行添加到过滤集合
-            matched_indices = df[mask].index.tolist()
-            indices_to_filter.update(matched_indices)
+        # 多行规则之间为OR关系
+        filter_mask = np.zeros(len(df), dtype=bool)
+        # 各规则复用同一个缓冲区，避免每条规则分配新数组
+        rule_mask = np.empty(len(df), dtype=bool)
+        for idx, rule_conditions in rules:
+            # 应用AND逻辑：所有条件都满足
+            rule_mask.fill(True)
+            for cond in rule_conditions:
+                np.logical_and(rule_mask, condition_masks[cond], out=rule_mask)
+            np.logical_or(filter_mask, rule_mask, out=filter_mask)
 
-            if matched_indices:
-                log(f"组合规则 {idx} 匹配 {len(matched_indices)} 条: {rule_conditions}", "DEBUG")
+            matched_count = int(np.count_nonzero(rule_mask))
+            if matched_count:
+                log(f"组合规则 {idx} 匹配 {matched_count} 条: {rule_conditions}", "DEBUG")
 
         # 返回未匹配的行
-        if indices_to_filter:
-            result = df.drop(indices_to_filter)
-            log(f"组合过滤: 过滤掉 {len(indices_to_filter)} 条故障", "INFO")
+        filtered_count = int(filter_mask.sum())
+        if filtered_count:
+            result = df[~filter_mask]
+            log(f"组合过滤: 过滤掉 {filtered_count} 条故障", "INFO")
             return result
         else:
             return df
 
+    @staticmethod
+    def _match_conditions(df: pd.DataFrame, conditions) -> dict:
+        """
+        批量计算 (字段, 规则值) 的模糊匹配结果
+
+        故障数据中同一字段的取值大量重复：每个字段只在去重后的取值上匹配，
+        再按编码展开到各行；并先用所有规则值（转义后）的正则或式扫描一遍，
+        各规则值只需在命中的候选取值上再单独匹配。
+
+        Args:
+            df: 故障数据DataFrame
+            conditions: (字段, 规则值) 列表
+
+        Returns:
+            dict: {(字段, 规则值): 布尔数组}
+        """
+        values_by_col = {}
+        for col, rule_value in conditions:
+            values_by_col.setdefault(col, {})[rule_value] = None
+
+        masks = {}
+        for col, values in values_by_col.items():
+            # 空值编码为 -1，对应末尾追加的 False（与 str.contains(na=False) 一致）
+            codes, uniques = pd.factorize(df[col])
+            if len(uniques) == 0:
+                for value in values:
+                    masks[(col, value)] = np.zeros(len(df), dtype=bool)
+                continue
+            series = pd.Series(uniques).astype(str)
+
+            candidates = None
+            if len(values) > 1:
+                pattern = re.compile("|".join(map(re.escape, values)))
+                candidates = series.str.contains(pattern, na=False).to_numpy()
+                series = series[candidates]
+
+            for value in values:
+                matched = series.str.contains(value, regex=False, na=False).to_numpy()
+                if candidates is not None:
+                    full = np.zeros(len(uniques), dtype=bool)
+                    full[candidates] = matched
+                    matched = full
+                masks[(col, value)] = np.append(matched, False)[codes]
+
+        return masks
+
     def _apply_group_filters(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         应用关联故障过滤规则
@@ -158,118 +286,137 @@ class FaultFilter:
         - 如果所有配置的故障都在设定的时间间隔内出现，则将这些故障全部过滤
         - 时间间隔由规则中的"时间间隔(秒)"字段指定
         """
-        if self.group_rules.empty:
+        if not self._group_rules_parsed or df.empty:
             return df
 
-        # 记录需要过滤的索引
-        indices_to_filter = set()
-
-        df = df.copy()
-
-        # 按机号分组
-        for aircraft, group in df.groupby("机号"):
-            # 检查该机号的故障是否匹配任一关联故障规则
-            for rule_idx, rule in self.group_rules.iterrows():
-                # 获取规则中定义的所有故障描述（非空）
-                fault_descriptions = []
-                for col in rule.index:
-                    if (
-                        col.startswith("故障描述")
-                        and pd.notna(rule[col])
-                        and str(rule[col]).strip() != ""
-                    ):
-                        fault_descriptions.append(str(rule[col]).strip())
-
-                if len(fault_descriptions) < 2:
-                    continue  # 至少需要2个故障描述才构成关联规则
-
-                # 获取时间间隔阈值（秒）
-                time_threshold = 0
-                if "时间间隔(秒)" in rule.index and pd.notna(rule["时间间隔(秒)"]):
-                    try:
-                        time_threshold = int(rule["时间间隔(秒)"])
-                    except (ValueError, TypeError):
-                        time_threshold = 0
-
-                # 检查该机号的故障组是否包含所有配置的故障描述
-                matched_faults = {}  # 故障描述 -> [匹配的行索引列表]
-
-                # 遍历组内的每一条故障记录
-                for idx, row in group.iterrows():
-                    fault_desc = str(row["描述"])
-
-                    # 检查该故障是否匹配规则中的任一故障描述
-                    for rule_desc in fault_descriptions:
-                        if rule_desc in fault_desc:
-                            if rule_desc not in matched_faults:
-                                matched_faults[rule_desc] = []
-                            matched_faults[rule_desc].append(idx)
-                            break
-
-                # 检查是否所有规则的故障描述都找到了匹配
-                if len(matched_faults) == len(fault_descriptions):
-                    # 所有故障都出现了，现在检查时间间隔
-                    # 收集所有匹配故障的触发时间
-                    all_matched_indices = []
-                    for indices in matched_faults.values():
-                        all_matched_indices.extend(indices)
-
-                    # 去重（可能同一行匹配多个规则描述）
-                    all_matched_indices = list(set(all_matched_indices))
-
-                    # 获取所有匹配故障的触发时间
-                    trigger_times = df.loc[all_matched_indices, "触发时间"].tolist()
-
-                    # 解析时间并计算时间范围
-                    try:
-                        # 解析时间字符串 (假设格式为 "YYYY-MM-DD HH:MM:SS" 或 "HH:MM:SS")
-                        parsed_times = []
-                        for t in trigger_times:
-                            # 尝试解析完整的时间戳
-                            if " " in str(t):
-                                parsed_times.append(datetime.strptime(str(t), "%Y-%m-%d %H:%M:%S"))
-                            else:
-                                # 如果只有时间部分，使用今天日期
-                                time_part = str(t).split(".")[0]  # 去掉可能的毫秒部分
-                                parsed_times.append(datetime.strptime(time_part, "%H:%M:%S"))
-
-                        # 计算时间差（秒）
-                        if len(parsed_times) > 1:
-                            time_span = (max(parsed_times) - min(parsed_times)).total_seconds()
-
-                            # 如果时间差小于阈值，则过滤这些故障
-                            if time_span <= time_threshold:
-                                indices_to_filter.update(all_matched_indices)
-                                log(
-                                    f"关联规则 {rule_idx} 匹配机号 {aircraft}: {fault_descriptions}, "
-                                    f"时间跨度 {time_span:.1f}秒 <= {time_threshold}秒, 过滤 {len(all_matched_indices)} 条",
-                                    "DEBUG",
-                                )
-                            else:
-                                log(
-                                    f"关联规则 {rule_idx} 匹配机号 {aircraft}: {fault_descriptions}, "
-                                    f"时间跨度 {time_span:.1f}秒 > {time_threshold}秒, 不予过滤",
-                                    "DEBUG",
-                                )
-                        else:
-                            # 只有一个时间点，直接过滤
-                            indices_to_filter.update(all_matched_indices)
-                            log(
-                                f"关联规则 {rule_idx} 匹配机号 {aircraft}: {fault_descriptions}, "
-                                f"单点时间, 过滤 {len(all_matched_indices)} 条",
-                                "DEBUG",
-                            )
-                    except Exception as e:
-                        log(f"解析时间失败: {e}, 跳过该规则", "WARNING")
+        # 故障描述大量重复：只扫描一遍得到去重值，规则描述只在去重值上匹配后按编码展开，
+        # 同一规则描述在多条规则间共用匹配结果
+        desc_codes, desc_values = pd.factorize(df["描述"])
+        # 空描述编码为 -1，对应末尾追加的 str(nan)
+        desc_values = [str(value) for value in desc_values] + ["nan"]
+
+        # 没有任何故障描述命中关联规则时直接返回，跳过时间解析和逐规则匹配
+        if not any(self._group_desc_pattern.search(value) for value in desc_values):
+            return df
+
+        desc_hits = {}
+
+        # 需要过滤的行
+        filter_mask = np.zeros(len(df), dtype=bool)
+
+        # 机号编码（空机号为 -1，与 groupby 一样不参与匹配）与触发时间只准备一次
+        aircraft_codes, aircraft_names = pd.factorize(df["机号"])
+        trigger_times = self._parse_trigger_times(df["触发时间"]).to_numpy()
+        trigger_missing = np.isnat(trigger_times)
+
+        def match_description(rule_desc: str) -> np.ndarray:
+            hits = desc_hits.get(rule_desc)
+            if hits is None:
+                unique_hits = np.fromiter(
+                    (rule_desc in value for value in desc_values),
+                    dtype=bool,
+                    count=len(desc_values),
+                )
+                hits = desc_hits[rule_desc] = unique_hits[desc_codes]
+            return hits
+
+        for rule_idx, fault_descriptions, time_threshold in self._group_rules_parsed:
+            # 行 × 故障描述 的匹配矩阵
+            desc_matches = [match_description(d) for d in fault_descriptions]
+            # 有故障描述在数据中完全未出现时该规则不可能命中
+            if not all(m.any() for m in desc_matches):
+                continue
+            hits = np.column_stack(desc_matches)
+            matched = hits.any(axis=1) & (aircraft_codes >= 0)
+            if not matched.any():
+                continue
+
+            # 每条故障只归属于第一个匹配的规则故障描述
+            first_desc = hits.argmax(axis=1)
+
+            # 检查各机号是否包含所有配置的故障描述
+            desc_counts = (
+                pd.Series(first_desc[matched]).groupby(aircraft_codes[matched], sort=True).nunique()
+            )
+            full_codes = desc_counts.index[desc_counts == len(fault_descriptions)]
+
+            for code in full_codes:
+                # 所有故障都出现了，现在检查时间间隔
+                aircraft = aircraft_names[code]
+                rows = matched & (aircraft_codes == code)
+                matched_count = int(rows.sum())
+
+                # 获取所有匹配故障的触发时间
+                parsed_times = trigger_times[rows]
+                bad_rows = rows & trigger_missing
+                if bad_rows.any():
+                    bad_times = df["触发时间"][bad_rows].tolist()
+                    log(f"解析时间失败: {bad_times}, 跳过该规则", "WARNING")
+                    continue
+
+                # 计算时间差（秒）
+                if len(parsed_times) > 1:
+                    time_span = (parsed_times.max() - parsed_times.min()) / np.timedelta64(1, "s")
+
+                    # 如果时间差小于阈值，则过滤这些故障
+                    if time_span <= time_threshold:
+                        filter_mask |= rows
+                        log(
+                            f"关联规则 {rule_idx} 匹配机号 {aircraft}: {fault_descriptions}, "
+                            f"时间跨度 {time_span:.1f}秒 <= {time_threshold}秒, 过滤 {matched_count} 条",
+                            "DEBUG",
+                        )
+                    else:
+                        log(
+                            f"关联规则 {rule_idx} 匹配机号 {aircraft}: {fault_descriptions}, "
+                            f"时间跨度 {time_span:.1f}秒 > {time_threshold}秒, 不予过滤",
+                            "DEBUG",
+                        )
+                else:
+                    # 只有一个时间点，直接过滤
+                    filter_mask |= rows
+                    log(
+                        f"关联规则 {rule_idx} 匹配机号 {aircraft}: {fault_descriptions}, "
+                        f"单点时间, 过滤 {matched_count} 条",
+                        "DEBUG",
+                    )
 
         # 返回未匹配的行
-        if indices_to_filter:
-            result = df.drop(indices_to_filter)
-            log(f"关联故障过滤: 过滤掉 {len(indices_to_filter)} 条故障", "INFO")
+        filtered_count = int(filter_mask.sum())
+        if filtered_count:
+            result = df[~filter_mask]
+            log(f"关联故障过滤: 过滤掉 {filtered_count} 条故障", "INFO")
             return result
         else:
             return df
 
+    @staticmethod
+    def _parse_trigger_times(times: pd.Series) -> pd.Series:
+        """
+        解析触发时间列
+
+        支持 "YYYY-MM-DD HH:MM:SS" 与 "HH:MM:SS"（可带毫秒）两种格式，
+        只有时间部分的记录日期为 1900-01-01，与 datetime.strptime 一致。
+
+        Args:
+            times: 触发时间列
+
+        Returns:
+            pd.Series: 解析后的时间，无法解析的记录为 NaT
+        """
+        times = times.astype(str)
+        has_date = times.str.contains(" ", regex=False)
+
+        full_times = pd.to_datetime(
+            times.where(has_date), format="%Y-%m-%d %H:%M:%S", errors="coerce", cache=True
+        )
+        # 去掉可能的毫秒部分
+        time_parts = times.str.replace(r"\..*", "", regex=True)
+        time_only = pd.to_datetime(
+            time_parts.where(~has_date), format="%H:%M:%S", errors="coerce", cache=True
+        )
+        return full_times.where(has_date, time_only)
+
     def get_filter_stats(self) -> dict:
         """
         获取过滤规则统计信息
@@ -281,3 +428,45 @@ class FaultFilter:
             "single_filter_rules": len(self.single_rules),
             "group_filter_rules": len(self.group_rules),
         }
+
+
+def _rules_mtime(path: str):
+    """获取规则文件修改时间（纳秒），文件不存在时为 None"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_fault_filter(config_dir: str, single_mtime, group_mtime) -> FaultFilter:
+    """
+    按 (规则目录, 规则文件修改时间) 缓存过滤器实例
+
+    Args:
+        config_dir: 规则目录绝对路径
+        single_mtime: 组合过滤规则文件修改时间，仅用作缓存键
+        group_mtime: 关联故障过滤规则文件修改时间，仅用作缓存键
+
+    Returns:
+        FaultFilter: 过滤器实例
+    """
+    return FaultFilter(config_dir)
+
+
+def get_fault_filter(config_dir: str = None) -> FaultFilter:
+    """
+    获取故障过滤器（规则文件未修改时复用同一实例，不重复读取和解析规则）
+
+    Args:
+        config_dir: 配置文件目录路径，默认为项目 config 目录
+
+    Returns:
+        FaultFilter: 过滤器实例
+    """
+    config_dir = os.path.abspath(config_dir or _DEFAULT_CONFIG_DIR)
+    return _cached_fault_filter(
+        config_dir,
+        _rules_mtime(os.path.join(config_dir, SINGLE_RULES_FILE)),
+        _rules_mtime(os.path.join(config_dir, GROUP_RULES_FILE)),
+    )
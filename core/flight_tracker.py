@@ -3,14 +3,25 @@
 实时跟踪每架飞机的航班执行状态
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import pandas as pd
 
 from config.flight_schedule import FlightSchedule
-from core.logger import get_logger
+from core.logger import get_default_logger
+
+# 加载航班状态需要的 leg 数据列
+LEG_COLUMNS = ("执飞飞机", "航班号", "日期", "OUT", "OFF", "ON", "IN")
+# leg 数据中的时间列（滑出、起飞、落地、滑入）
+LEG_TIME_COLUMNS = ("OUT", "OFF", "ON", "IN")
+# leg 数据时间格式
+LEG_TIME_FORMAT = "%Y-%m-%d %H:%M"
+# leg 数据列类型：日期列取值很少，用 category 按整数编码比较当天日期
+LEG_DTYPES = {**dict.fromkeys(LEG_COLUMNS, str), "日期": "category"}
+# leg 数据分块读取的行数
+LEG_CHUNK_SIZE = 50_000
 
 
 class FlightPhase:
@@ -24,9 +35,67 @@ class FlightPhase:
     UNKNOWN = "unknown"  # 未知状态
 
 
+# 飞机在地面的航班阶段
+_ON_GROUND_PHASES = frozenset(
+    {
+        FlightPhase.SCHEDULED,
+        FlightPhase.PUSHBACK,
+        FlightPhase.LANDED,
+        FlightPhase.IN_GATE,
+    }
+)
+
+# 航班阶段中文名称
+_PHASE_NAMES = {
+    FlightPhase.SCHEDULED: "计划中",
+    FlightPhase.PUSHBACK: "滑出",
+    FlightPhase.AIRBORNE: "空中",
+    FlightPhase.LANDED: "落地",
+    FlightPhase.IN_GATE: "滑入",
+    FlightPhase.UNKNOWN: "未知",
+}
+
+# 状态摘要分隔线
+_SUMMARY_BANNER = "=" * 60
+
+
+def _parse_time_column(column: pd.Series) -> list:
+    """
+    向量化解析leg数据时间列
+
+    Args:
+        column: 时间字符串列（YYYY-MM-DD HH:MM）
+
+    Returns:
+        list: datetime列表，缺失或无法解析的为None
+    """
+    parsed = pd.to_datetime(column, format=LEG_TIME_FORMAT, errors="coerce")
+    # 不依赖 dt.to_pydatetime 的返回类型（pandas 2 为 ndarray，pandas 3 为 Series）
+    values = parsed.astype(object).where(parsed.notna(), None)
+    return [None if ts is None else ts.to_pydatetime() for ts in values]
+
+
 class FlightStatus:
     """单个航班状态"""
 
+    __slots__ = (
+        "flight_number",
+        "aircraft_registration",
+        "scheduled_departure",
+        "_scheduled_departure_date",
+        "scheduled_arrival",
+        "pushback_time",
+        "takeoff_time",
+        "landing_time",
+        "in_gate_time",
+        "current_phase",
+        "last_update_time",
+        "pushback_notified",
+        "takeoff_notified",
+        "landing_notified",
+        "in_gate_notified",
+    )
+
     def __init__(self, flight_number: str, aircraft_registration: str):
         """
         初始化航班状态
@@ -40,6 +109,7 @@ class FlightStatus:
 
         # 时间信息
         self.scheduled_departure: Optional[datetime] = None  # 计划起飞时间
+        self._scheduled_departure_date: Optional[date] = None  # 计划起飞时间对应的日期
         self.scheduled_arrival: Optional[datetime] = None  # 计划到达时间
 
         self.pushback_time: Optional[datetime] = None  # 实际滑出时间
@@ -58,6 +128,15 @@ class FlightStatus:
         self.in_gate_notified = False
 
     def get_flight_phase(self) -> FlightPhase:
+        """
+        获取当前航班阶段（由 update_status 维护）
+
+        Returns:
+            FlightPhase: 当前航班阶段
+        """
+        return self.current_phase
+
+    def _compute_flight_phase(self) -> FlightPhase:
         """
         根据已有时间判断当前航班阶段
 
@@ -77,22 +156,15 @@ class FlightStatus:
 
     def is_airborne(self) -> bool:
         """判断飞机是否在空中"""
-        phase = self.get_flight_phase()
-        return phase == FlightPhase.AIRBORNE
+        return self.current_phase == FlightPhase.AIRBORNE
 
     def is_on_ground(self) -> bool:
         """判断飞机是否在地面"""
-        phase = self.get_flight_phase()
-        return phase in [
-            FlightPhase.SCHEDULED,
-            FlightPhase.PUSHBACK,
-            FlightPhase.LANDED,
-            FlightPhase.IN_GATE,
-        ]
+        return self.current_phase in _ON_GROUND_PHASES
 
     def is_completed(self) -> bool:
         """判断航班是否已完成（滑入）"""
-        return self.get_flight_phase() == FlightPhase.IN_GATE
+        return self.current_phase == FlightPhase.IN_GATE
 
     def needs_arrival_monitoring(self, current_time: datetime) -> bool:
         """
@@ -114,6 +186,23 @@ class FlightStatus:
 
         return False
 
+    def get_scheduled_departure(self, today: date) -> datetime:
+        """
+        获取指定日期的计划起飞时间（每个日期只计算一次）
+
+        Args:
+            today: 日期
+
+        Returns:
+            datetime: 计划起飞时间（北京时间）
+        """
+        if self._scheduled_departure_date != today:
+            self.scheduled_departure = FlightSchedule.get_scheduled_departure_datetime(
+                self.flight_number, datetime(today.year, today.month, today.day)
+            )
+            self._scheduled_departure_date = today
+        return self.scheduled_departure
+
     def calculate_scheduled_arrival(self) -> Optional[datetime]:
         """计算计划到达时间"""
         if self.takeoff_time:
@@ -142,8 +231,37 @@ class FlightStatus:
         if leg_data.get("in_gate_time"):
             self.in_gate_time = self._parse_datetime(leg_data["in_gate_time"])
 
+        self._refresh_phase()
+
+    def _update_status_parsed(
+        self,
+        pushback_time: Optional[datetime],
+        takeoff_time: Optional[datetime],
+        landing_time: Optional[datetime],
+        in_gate_time: Optional[datetime],
+    ):
+        """
+        使用已解析的时间更新状态（leg数据文件加载的快速路径，跳过逐个字符串解析）
+
+        Args:
+            pushback_time: 滑出时间，缺失或无法解析时为None
+            takeoff_time: 起飞时间，缺失或无法解析时为None
+            landing_time: 落地时间，缺失或无法解析时为None
+            in_gate_time: 滑入时间，缺失或无法解析时为None
+        """
+        self.last_update_time = datetime.now()
+
+        self.pushback_time = pushback_time
+        self.takeoff_time = takeoff_time
+        self.landing_time = landing_time
+        self.in_gate_time = in_gate_time
+
+        self._refresh_phase()
+
+    def _refresh_phase(self):
+        """时间更新后刷新当前阶段与计划到达时间"""
         # 更新当前阶段
-        self.current_phase = self.get_flight_phase()
+        self.current_phase = self._compute_flight_phase()
 
         # 如果已起飞，计算计划到达时间
         if self.takeoff_time and not self.scheduled_arrival:
@@ -151,12 +269,13 @@ class FlightStatus:
 
     def _parse_datetime(self, time_str: str) -> Optional[datetime]:
         """解析时间字符串"""
-        if not time_str or pd.isna(time_str):
+        # 空串与缺失值（NaN 等非字符串）直接返回，不进入 strptime
+        if not isinstance(time_str, str) or not time_str:
             return None
         try:
             # 假设时间格式为 YYYY-MM-DD HH:MM
-            return datetime.strptime(time_str, "%Y-%m-%d %H:%M")
-        except:
+            return datetime.strptime(time_str, LEG_TIME_FORMAT)
+        except ValueError:
             return None
 
 
@@ -170,11 +289,17 @@ class FlightTracker:
         Args:
             monitored_aircraft: 需要监控的飞机号列表，如果为None则加载所有飞机
         """
-        self.log = get_logger()
+        self.log = get_default_logger()
         self.flights: Dict[str, FlightStatus] = {}  # {aircraft_registration: FlightStatus}
         self.leg_data_file = Path("data/leg_data.csv")
         self.monitored_aircraft = monitored_aircraft  # 保存监控飞机列表
 
+        # 空中/地面飞机数，随航班阶段变化增量维护（航班状态须经本类方法更新）
+        self._airborne_count = 0
+        self._ground_count = 0
+        # 最早的leg监控时间点缓存 (日期, 时间点)，航班状态更新或跨天时重新计算
+        self._leg_deadline: Optional[tuple] = None
+
         # 加载已有的leg数据
         self._load_existing_leg_data()
 
@@ -184,45 +309,98 @@ class FlightTracker:
             return
 
         try:
-            df = pd.read_csv(self.leg_data_file)
-
-            # 按飞机号和日期分组，获取最新状态
+            # 只关注今天的航班（CSV列名是中文'日期'）：只读取需要的列，
+            # 分块读取并在每块内过滤日期（category 编码比较），历史记录不会整体载入内存
             today = datetime.now().strftime("%Y-%m-%d")
+            frames = [
+                chunk[chunk["日期"].eq(today)] if "日期" in chunk else chunk.iloc[0:0]
+                for chunk in pd.read_csv(
+                    self.leg_data_file,
+                    usecols=lambda col: col in LEG_COLUMNS,
+                    dtype=LEG_DTYPES,
+                    chunksize=LEG_CHUNK_SIZE,
+                )
+            ]
+            # 缺失的列按空值处理
+            df = pd.concat(frames) if frames else pd.DataFrame()
+            df = df.reindex(columns=list(LEG_COLUMNS))
+
+            aircraft_col = df["执飞飞机"]
+            flight_col = df["航班号"]
+            keep = (
+                aircraft_col.notna() & aircraft_col.ne("") & flight_col.notna() & flight_col.ne("")
+            )
+            # 如果指定了监控飞机列表，只加载列表中的飞机
+            if self.monitored_aircraft is not None:
+                keep &= aircraft_col.isin(self.monitored_aircraft)
+
+            rows = df[keep]
+            # 时间列整列向量化解析，缺失或无法解析的记为None
+            times = [_parse_time_column(rows[col]) for col in LEG_TIME_COLUMNS]
+
+            # 按文件顺序逐行更新，同一飞机以首条航班号建档、后续记录更新时间
+            for aircraft, flight_number, out, off, on, in_ in zip(
+                rows["执飞飞机"], rows["航班号"], *times
+            ):
+                status = self._get_or_create_status(aircraft, flight_number)
+                self._apply_update(status, status._update_status_parsed, out, off, on, in_)
 
-            for _, row in df.iterrows():
-                aircraft = row.get("执飞飞机")
-                flight_number = row.get("航班号")
+            self.log(f"已加载 {len(self.flights)} 架飞机的航班状态")
 
-                if not aircraft or not flight_number:
-                    continue
+        except Exception as e:
+            self.log(f"加载leg数据失败: {e}", "ERROR")
 
-                # 如果指定了监控飞机列表，只加载列表中的飞机
-                if self.monitored_aircraft is not None:
-                    if aircraft not in self.monitored_aircraft:
-                        continue
+    def _get_or_create_status(self, aircraft: str, flight_number: str) -> FlightStatus:
+        """
+        获取飞机的航班状态，不存在时以该航班号初始化
 
-                # 只关注今天的航班（CSV列名是中文'日期'）
-                flight_date = row.get("日期")
-                if flight_date != today:
-                    continue
+        Args:
+            aircraft: 机号
+            flight_number: 航班号
 
-                # 初始化航班状态
-                if aircraft not in self.flights:
-                    self.flights[aircraft] = FlightStatus(flight_number, aircraft)
+        Returns:
+            FlightStatus: 航班状态
+        """
+        status = self.flights.get(aircraft)
+        if status is None:
+            status = FlightStatus(flight_number, aircraft)
+            self.flights[aircraft] = status
+            self._count_phase_change(None, status.current_phase)
+            self._leg_deadline = None
+        return status
+
+    def _apply_update(self, status: FlightStatus, update, *args):
+        """
+        执行航班状态更新，并按阶段变化调整空中/地面飞机数
 
-                # 转换中文列名为英文键名
-                leg_data = {
-                    "pushback_time": row.get("OUT"),
-                    "takeoff_time": row.get("OFF"),
-                    "landing_time": row.get("ON"),
-                    "in_gate_time": row.get("IN"),
-                }
-                self.flights[aircraft].update_status(leg_data)
+        更新中途抛出异常时阶段可能已改变，因此在 finally 中计数。
 
-            self.log(f"已加载 {len(self.flights)} 架飞机的航班状态")
+        Args:
+            status: 航班状态
+            update: 状态更新方法
+            *args: 更新方法的参数
+        """
+        old_phase = status.current_phase
+        try:
+            update(*args)
+        finally:
+            self._count_phase_change(old_phase, status.current_phase)
+            self._leg_deadline = None
 
-        except Exception as e:
-            self.log(f"加载leg数据失败: {e}", "ERROR")
+    def _count_phase_change(self, old_phase: Optional[str], new_phase: str):
+        """
+        根据航班阶段变化调整空中/地面飞机数
+
+        Args:
+            old_phase: 原阶段（新建航班状态时为None）
+            new_phase: 新阶段
+        """
+        if old_phase == new_phase:
+            return
+        self._airborne_count += (new_phase == FlightPhase.AIRBORNE) - (
+            old_phase == FlightPhase.AIRBORNE
+        )
+        self._ground_count += (new_phase in _ON_GROUND_PHASES) - (old_phase in _ON_GROUND_PHASES)
 
     def get_aircraft_status(self, aircraft_registration: str) -> Optional[FlightStatus]:
         """获取指定飞机的状态"""
@@ -248,8 +426,7 @@ class FlightTracker:
         Returns:
             bool: 是否需要故障监控
         """
-        airborne_aircraft = self.get_all_aircraft_in_air()
-        return len(airborne_aircraft) > 0
+        return self._airborne_count > 0
 
     def needs_leg_monitoring(self, current_time: datetime) -> bool:
         """
@@ -265,21 +442,81 @@ class FlightTracker:
         Returns:
             bool: 是否需要leg监控
         """
-        # 检查是否需要到达监控
-        for aircraft, status in self.flights.items():
-            if status.needs_arrival_monitoring(current_time):
-                return True
+        return self._leg_monitoring_due(current_time)
 
-        # 检查地面飞机是否已过计划起飞时间
-        for aircraft, status in self.flights.items():
-            if status.is_on_ground():
-                scheduled_dept = FlightSchedule.get_scheduled_departure_datetime(
-                    status.flight_number
-                )
-                if current_time >= scheduled_dept:
+    def _leg_monitoring_due(self, current_time: datetime) -> bool:
+        """
+        判断是否需要leg监控（按最早时间点判断，航班状态不变时无需逐架检查）
+
+        需要leg监控等价于当前时间已到达以下时间点中最早的一个：
+        空中飞机的计划到达时间、地面飞机当天的计划起飞时间。
+
+        Args:
+            current_time: 当前时间
+
+        Returns:
+            bool: 是否需要leg监控
+        """
+        today = date.today()
+        cached = self._leg_deadline
+        if cached is None or cached[0] != today:
+            try:
+                cached = (today, self._earliest_leg_deadline(today))
+            except ValueError:
+                # 存在未知航班号时不缓存，按优先级逐架检查
+                return self._scan_leg_monitoring(current_time)
+            self._leg_deadline = cached
+
+        deadline = cached[1]
+        return deadline is not None and current_time >= deadline
+
+    def _earliest_leg_deadline(self, today: date) -> Optional[datetime]:
+        """
+        计算最早的leg监控时间点
+
+        Args:
+            today: 日期
+
+        Returns:
+            Optional[datetime]: 最早时间点，没有需要关注的飞机时为None
+        """
+        deadlines = []
+        for status in self.flights.values():
+            phase = status.current_phase
+            if phase == FlightPhase.AIRBORNE:
+                if status.takeoff_time and status.scheduled_arrival:
+                    deadlines.append(status.scheduled_arrival)
+            elif phase in _ON_GROUND_PHASES:
+                deadlines.append(status.get_scheduled_departure(today))
+        return min(deadlines, default=None)
+
+    def _scan_leg_monitoring(self, current_time: datetime) -> bool:
+        """
+        单次遍历所有飞机，判断是否需要leg监控
+
+        先检查到达监控，再检查地面飞机的计划起飞时间（与逐项检查的优先级一致）。
+
+        Args:
+            current_time: 当前时间
+
+        Returns:
+            bool: 是否需要leg监控
+        """
+        ground_flights = []
+        for status in self.flights.values():
+            phase = status.current_phase
+            if phase == FlightPhase.AIRBORNE:
+                # 在空中且已到计划到达时间
+                if status.needs_arrival_monitoring(current_time):
                     return True
+            elif phase in _ON_GROUND_PHASES:
+                ground_flights.append(status)
 
-        return False
+        # 地面飞机已过计划起飞时间
+        today = date.today()
+        return any(
+            current_time >= status.get_scheduled_departure(today) for status in ground_flights
+        )
 
     def should_monitor_leg_first(self, current_time: datetime) -> bool:
         """
@@ -306,30 +543,14 @@ class FlightTracker:
         Returns:
             bool: True=leg页面优先, False=故障页面优先
         """
-        # 优先级1: 检查是否需要到达监控（在空中且已到计划到达时间）
-        for aircraft, status in self.flights.items():
-            if status.needs_arrival_monitoring(current_time):
-                return True
-
-        # 优先级2: 检查是否有任何飞机在地面 且 已过计划起飞时间
-        # 只有当当前时间已过该飞机的计划起飞时间，才需要监控Leg页面
-        for aircraft, status in self.flights.items():
-            if status.is_on_ground():
-                # 获取该飞机的计划起飞时间
-                scheduled_dept = FlightSchedule.get_scheduled_departure_datetime(
-                    status.flight_number
-                )
-                # 只有当前时间已过计划起飞时间，才需要监控
-                if current_time >= scheduled_dept:
-                    return True
+        # 优先级1: 有飞机在空中且已到计划到达时间
+        # 优先级2: 有飞机在地面 且 已过计划起飞时间
+        if self._leg_monitoring_due(current_time):
+            return True
 
         # 优先级3: 如果所有飞机都在空中（都有OFF时间且没有IN时间）
         # 则监控故障页面
-        airborne_aircraft = self.get_all_aircraft_in_air()
-        ground_aircraft = self.get_all_aircraft_on_ground()
-
-        # 所有飞机都在空中，没有飞机在地面
-        if len(airborne_aircraft) > 0 and len(ground_aircraft) == 0:
+        if self._airborne_count > 0 and self._ground_count == 0:
             return False
 
         # 默认监控Leg页面（防御性逻辑）
@@ -350,8 +571,7 @@ class FlightTracker:
                 continue
 
             # 初始化或更新航班状态
-            if aircraft not in self.flights:
-                self.flights[aircraft] = FlightStatus(flight_number, aircraft)
+            status = self._get_or_create_status(aircraft, flight_number)
 
             # 转换中文列名为英文键名
             converted_leg_data = {
@@ -361,45 +581,30 @@ class FlightTracker:
                 "in_gate_time": leg_data.get("IN"),
             }
 
-            self.flights[aircraft].update_status(converted_leg_data)
+            self._apply_update(status, status.update_status, converted_leg_data)
 
         self.log(f"已更新 {len(self.flights)} 架飞机的航班状态")
 
     def get_status_summary(self) -> str:
         """获取状态摘要"""
-        summary_lines = []
-        summary_lines.append("=" * 60)
-        summary_lines.append("📊 航班状态跟踪摘要")
-        summary_lines.append("=" * 60)
+        summary_lines = [_SUMMARY_BANNER, "📊 航班状态跟踪摘要", _SUMMARY_BANNER]
 
         for aircraft, status in self.flights.items():
-            phase_names = {
-                FlightPhase.SCHEDULED: "计划中",
-                FlightPhase.PUSHBACK: "滑出",
-                FlightPhase.AIRBORNE: "空中",
-                FlightPhase.LANDED: "落地",
-                FlightPhase.IN_GATE: "滑入",
-                FlightPhase.UNKNOWN: "未知",
-            }
-
-            phase_name = phase_names.get(status.current_phase, "未知")
-
-            summary_lines.append(f"\n✈️ {aircraft} - {status.flight_number}")
-            summary_lines.append(f"   当前阶段: {phase_name}")
-
-            if status.pushback_time:
-                summary_lines.append(f"   滑出时间: {status.pushback_time.strftime('%H:%M')}")
-            if status.takeoff_time:
-                summary_lines.append(f"   起飞时间: {status.takeoff_time.strftime('%H:%M')}")
-            if status.landing_time:
-                summary_lines.append(f"   落地时间: {status.landing_time.strftime('%H:%M')}")
-            if status.in_gate_time:
-                summary_lines.append(f"   滑入时间: {status.in_gate_time.strftime('%H:%M')}")
-
-            if status.scheduled_arrival:
-                summary_lines.append(f"   计划到达: {status.scheduled_arrival.strftime('%H:%M')}")
-
-        summary_lines.append("\n" + "=" * 60)
+            phase_name = _PHASE_NAMES.get(status.current_phase, "未知")
+            summary_lines.append(
+                f"\n✈️ {aircraft} - {status.flight_number}\n   当前阶段: {phase_name}"
+            )
+
+            times = (
+                ("滑出时间", status.pushback_time),
+                ("起飞时间", status.takeoff_time),
+                ("落地时间", status.landing_time),
+                ("滑入时间", status.in_gate_time),
+                ("计划到达", status.scheduled_arrival),
+            )
+            summary_lines.extend(f"   {label}: {t:%H:%M}" for label, t in times if t)
+
+        summary_lines.append("\n" + _SUMMARY_BANNER)
         return "\n".join(summary_lines)
 
 
@@ -3,9 +3,77 @@
 提供统一的日志记录功能，自动清理过期日志
 """
 
+import atexit
 import os
-from datetime import datetime, timedelta
-from typing import Callable
+import threading
+import time
+from typing import Callable, Dict, Optional, TextIO, Tuple
+
+# 同一日志目录两次清理之间的最小间隔（秒）
+CLEANUP_INTERVAL = 3600
+
+# 各日志目录上次清理的时间戳 {log_dir: time.time()}
+_last_cleanup: Dict[str, float] = {}
+
+# 各日志目录当天日志文件的常驻句柄 {log_dir: (日期, 文件句柄)}
+_log_files: Dict[str, Tuple[str, TextIO]] = {}
+_log_files_lock = threading.Lock()
+
+
+def _get_log_file(log_dir: str, today: str) -> TextIO:
+    """
+    获取日志目录当天日志文件的追加句柄，跨天时关闭旧文件并打开新文件
+
+    Args:
+        log_dir: 日志文件存储目录
+        today: 当天日期 (YYYY-MM-DD)
+
+    Returns:
+        TextIO: 行缓冲的追加模式文件句柄
+    """
+    with _log_files_lock:
+        cached = _log_files.get(log_dir)
+        if cached is not None:
+            if cached[0] == today:
+                return cached[1]
+            cached[1].close()
+
+        # 行缓冲：每条日志写完即落盘，进程异常退出也不丢日志
+        log_file = open(  # noqa: SIM115 句柄常驻，由 _close_log_files 关闭
+            os.path.join(log_dir, f"{today}.log"), "a", encoding="utf-8", buffering=1
+        )
+        _log_files[log_dir] = (today, log_file)
+        return log_file
+
+
+# 最近一次格式化的时间戳 (整秒, "YYYY-MM-DD HH:MM:SS")，同一秒内的日志复用
+_last_timestamp: Tuple[int, str] = (0, "")
+
+
+def _format_timestamp() -> str:
+    """
+    获取当前时间的日志时间戳，同一秒内只格式化一次
+
+    Returns:
+        str: YYYY-MM-DD HH:MM:SS
+    """
+    global _last_timestamp
+    now = int(time.time())
+    second, timestamp = _last_timestamp
+    if now != second:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        # 整体替换元组，多线程下读到的秒数与时间戳始终一致
+        _last_timestamp = (now, timestamp)
+    return timestamp
+
+
+@atexit.register
+def _close_log_files():
+    """进程退出时关闭所有日志文件句柄"""
+    with _log_files_lock:
+        for _, log_file in _log_files.values():
+            log_file.close()
+        _log_files.clear()
 
 
 def get_logger(log_dir: str = "logs", hours: int = 24) -> Callable:
@@ -30,12 +98,11 @@ def get_logger(log_dir: str = "logs", hours: int = 24) -> Callable:
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
 
-    # 清理过期日志
-    cleanup_old_logs(log_dir, hours)
-
-    # 获取当前日志文件名 (YYYY-MM-DD.log)
-    log_filename = datetime.now().strftime("%Y-%m-%d.log")
-    log_path = os.path.join(log_dir, log_filename)
+    # 清理过期日志（同一目录每小时最多清理一次）
+    now = time.time()
+    if now - _last_cleanup.get(log_dir, float("-inf")) >= CLEANUP_INTERVAL:
+        _last_cleanup[log_dir] = now
+        cleanup_old_logs(log_dir, hours)
 
     def logger(message: str, level: str = "INFO"):
         """
@@ -45,16 +112,15 @@ def get_logger(log_dir: str = "logs", hours: int = 24) -> Callable:
             message: 日志消息
             level: 日志级别 (INFO, WARNING, ERROR, SUCCESS)
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _format_timestamp()
         log_line = f"[{timestamp}] [{level}] {message}"
 
         # 输出到控制台
         print(log_line)
 
-        # 写入日志文件
+        # 写入当天日志文件 (YYYY-MM-DD.log)，句柄常驻，不再每条日志重新打开
         try:
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(log_line + "\n")
+            _get_log_file(log_dir, timestamp[:10]).write(log_line + "\n")
         except Exception as e:
             print(f"❌ 写入日志失败: {e}")
 
@@ -72,28 +138,45 @@ def cleanup_old_logs(log_dir: str, hours: int = 24):
     if not os.path.exists(log_dir):
         return
 
-    cutoff_time = datetime.now() - timedelta(hours=hours)
+    cutoff_ts = time.time() - hours * 3600
 
-    for filename in os.listdir(log_dir):
-        if not filename.endswith(".log"):
-            continue
+    # scandir 的目录项自带 stat 缓存，每个文件只需一次 stat
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".log"):
+                continue
 
-        filepath = os.path.join(log_dir, filename)
+            try:
+                # 如果文件过期则删除
+                if entry.stat().st_mtime < cutoff_ts:
+                    os.remove(entry.path)
+                    print(f"[CLEANUP] 已删除过期日志: {entry.name}")
+            except Exception as e:
+                print(f"[ERROR] 删除日志文件失败 {entry.name}: {e}")
 
-        # 获取文件修改时间
-        try:
-            file_mtime = datetime.fromtimestamp(os.path.getmtime(filepath))
 
-            # 如果文件过期则删除
-            if file_mtime < cutoff_time:
-                os.remove(filepath)
-                print(f"[CLEANUP] 已删除过期日志: {filename}")
-        except Exception as e:
-            print(f"[ERROR] 删除日志文件失败 {filename}: {e}")
+# 默认日志记录器实例（首次使用时创建，导入模块不产生目录和文件操作）
+_default_logger: Optional[Callable] = None
+
+
+def get_default_logger() -> Callable:
+    """
+    获取默认日志记录器（写入 logs 目录）
+
+    Returns:
+        Callable: 日志记录函数
+    """
+    global _default_logger
+    if _default_logger is None:
+        _default_logger = get_logger()
+    return _default_logger
 
 
-# 默认日志记录器实例
-default_logger = get_logger()
+def __getattr__(name: str):
+    """兼容旧的模块属性 default_logger，访问时才创建"""
+    if name == "default_logger":
+        return get_default_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@
 - 处理页面跳转逻辑
 """
 
+import re
 import time
 from typing import Optional
 
@@ -15,10 +16,36 @@ from DrissionPage import ChromiumPage
 
 from config.constants import (
     LOGIN_CHECK_INTERVAL,
+    LOGIN_POLL_BACKOFF,
+    LOGIN_POLL_MAX_INTERVAL,
+    LOGIN_POLL_MIN_INTERVAL,
     MAX_LOGIN_WAIT_SECONDS,
+    PAGE_LOAD_WAIT_SECONDS,
     TARGET_PAGE_LOAD_TIMEOUT,
 )
 
+# URL 分类正则（预编译，一次扫描完成多个子串判断）
+# 空白页: chrome:// 页、新标签页或 about:blank
+_BLANK_URL_RE = re.compile(r"chrome://|newtab|\Aabout:blank\Z")
+# 登录页: 同时包含 portal 与 login（顺序不限），或 rbac 登录中间页
+_LOGIN_URL_RE = re.compile(r"rbacUsersController/login\.html|portal.*login|login.*portal", re.S)
+# 系统内页面: 8004 / 8010 端口
+_IN_SYSTEM_URL_RE = re.compile(r"cis\.comac\.cc:80(?:04|10)")
+# 目标数据页面: 综合监控或航段日志
+_TARGET_URL_RE = re.compile(r"integratedMonitorController|lineLogController")
+
+# 一次 JS 调用取回轮询所需的全部页面状态（URL、登录框、WEB 按钮是否可见）
+_PAGE_STATE_JS = """
+const web = document.evaluate(
+    "//*[contains(text(), 'WEB')]", document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+return {
+    url: location.href,
+    pwd: !!document.querySelector("#loginPwd"),
+    web: !!(web && web.getClientRects().length),
+};
+"""
+
 
 class LoginManager:
     """登录管理器 - 处理所有登录相关逻辑"""
@@ -45,38 +72,67 @@ class LoginManager:
         Returns:
             bool: 成功返回 True，失败返回 False
         """
-        print("\n🔍 检查当前页面状态...")
+        # 快速路径：已登录时只需读取一次 URL，不切换加载模式、不查询页面元素
         current_url = page.url
-        print(f"📍 当前URL: {current_url}")
+        if self._is_ready(current_url):
+            return True
 
+        # 登录流程只需 DOMContentLoaded 即可判断页面状态，无需等待图片等子资源加载完成
+        page.set.load_mode.eager()
+        try:
+            return self._login(page, target_url, current_url)
+        finally:
+            page.set.load_mode.normal()
+
+    def _is_ready(self, url: str) -> bool:
+        """
+        判断是否已登录就绪（在系统首页或系统内其他页面）
+
+        Args:
+            url: 当前URL
+
+        Returns:
+            bool: 是否已就绪
+        """
         # 优先级1: 检查是否在系统首页
-        if "mainController/index.html" in current_url:
+        if "mainController/index.html" in url:
             print("✅ 已在系统首页: mainController/index.html")
             self.log("Already at main page", "INFO")
             return True
 
+        # 已在系统内但不在首页，也认为就绪
+        if self._is_in_system(url):
+            print("✅ 已在系统内")
+            self.log("Already in system", "INFO")
+            return True
+
+        return False
+
+    def _login(self, page: ChromiumPage, target_url: Optional[str], current_url: str) -> bool:
+        """智能登录流程（eager 加载模式下执行，调用前已确认未就绪）"""
+        print("\n🔍 检查当前页面状态...")
+        print(f"📍 当前URL: {current_url}")
+
         # 优先级2: 处理空白页
         if self._is_blank_page(current_url):
             print("🌐 检测到空白页,导航到登录页面...")
             page.get("https://cis2.comac.cc:8040/portal/")
-            time.sleep(2)
+            page.wait.doc_loaded(timeout=PAGE_LOAD_WAIT_SECONDS)
             current_url = page.url
+            # 跳转后已在系统内，也认为就绪（先于登录页判断，避免不必要的页面查询）
+            if self._is_in_system(current_url):
+                print("✅ 已在系统内")
+                self.log("Already in system", "INFO")
+                return True
 
         # 判断页面状态
         is_login_page = self._is_login_page(current_url, page)
-        is_in_system = self._is_in_system(current_url)
-
-        # 如果已在系统内但不在首页，也认为就绪
-        if is_in_system:
-            print("✅ 已在系统内")
-            self.log("Already in system", "INFO")
-            return True
 
         # 如果不在登录流程中，导航到首页
         if not self._is_blank_page(current_url) and not is_login_page:
             print("🚀 不在登录流程中,导航到系统首页...")
             page.get("https://cis.comac.cc:8004/caphm/mainController/index.html")
-            time.sleep(2)
+            page.wait.doc_loaded(timeout=PAGE_LOAD_WAIT_SECONDS)
             current_url = page.url
 
         # 智能等待: 监控所有可能的页面状态
@@ -84,18 +140,40 @@ class LoginManager:
 
     def _is_blank_page(self, url: str) -> bool:
         """判断是否为空白页"""
-        return "chrome://" in url or url == "about:blank" or "newtab" in url
+        return _BLANK_URL_RE.search(url) is not None
+
+    def _is_login_page(
+        self, url: str, page: ChromiumPage, has_login_form: Optional[bool] = None
+    ) -> bool:
+        """判断是否为登录页（has_login_form 已知时不再查询页面）"""
+        if _LOGIN_URL_RE.search(url):
+            return True
+        # 只有 cis 域名下才需要查询页面中的登录框（DOM 查询远比正则昂贵）
+        if "cis.comac.cc" not in url:
+            return False
+        if has_login_form is None:
+            has_login_form = bool(page.ele("#loginPwd"))
+        return has_login_form
 
-    def _is_login_page(self, url: str, page: ChromiumPage) -> bool:
-        """判断是否为登录页"""
-        is_portal = "portal" in url and "login" in url
-        is_rbac = "rbacUsersController/login.html" in url
-        is_cis_login = "cis.comac.cc" in url and page.ele("#loginPwd")
-        return is_portal or is_rbac or is_cis_login
+    def _get_page_state(self, page: ChromiumPage) -> dict:
+        """
+        批量获取页面状态（单次 CDP 往返）
+
+        Returns:
+            dict: {"url": 当前URL, "pwd": 是否有登录框, "web": WEB按钮是否可见}
+        """
+        try:
+            state = page.run_js(_PAGE_STATE_JS)
+            if isinstance(state, dict) and state.get("url"):
+                return state
+        except Exception:
+            # 页面跳转中执行上下文被销毁，退回只读取 URL
+            pass
+        return {"url": page.url, "pwd": False, "web": False}
 
     def _is_in_system(self, url: str) -> bool:
         """判断是否已在系统内"""
-        return "cis.comac.cc:8004" in url or "cis.comac.cc:8010" in url
+        return _IN_SYSTEM_URL_RE.search(url) is not None
 
     def _wait_and_navigate(self, page: ChromiumPage, target_url: Optional[str]) -> bool:
         """
@@ -110,13 +188,27 @@ class LoginManager:
         """
         print("\n⏳ 智能监控页面跳转...")
         login_executed = False
-
-        for i in range(MAX_LOGIN_WAIT_SECONDS):
-            current_url = page.url
+        start = time.monotonic()
+        deadline = start + MAX_LOGIN_WAIT_SECONDS
+        next_report = start
+        # 轮询间隔：URL 不变时指数退避，URL 变化后重置，减少无效的页面状态查询
+        interval = LOGIN_POLL_MIN_INTERVAL
+        last_url = None
+
+        while time.monotonic() < deadline:
+            state = self._get_page_state(page)
+            current_url = state["url"]
+            if current_url != last_url:
+                interval = LOGIN_POLL_MIN_INTERVAL
+                last_url = current_url
+            else:
+                interval = min(interval * LOGIN_POLL_BACKOFF, LOGIN_POLL_MAX_INTERVAL)
+            elapsed = int(time.monotonic() - start)
 
             # 每5秒打印一次URL
-            if i % 10 == 0:
-                print(f"   📍 [{i // 2}s] 当前URL: {current_url}")
+            if time.monotonic() >= next_report:
+                print(f"   📍 [{elapsed}s] 当前URL: {current_url}")
+                next_report += 5
 
             # 情况1: 已在目标首页
             if "mainController/index.html" in current_url:
@@ -124,30 +216,28 @@ class LoginManager:
                 break
 
             # 情况2: 在登录页 - 需要填充账号密码
-            if self._is_login_page(current_url, page) and not login_executed:
-                if self._handle_login(page):
+            if self._is_login_page(current_url, page, state["pwd"]) and not login_executed:
+                if state["pwd"] and self._handle_login(page):
                     login_executed = True
 
             # 情况3: 在rbac中间页 - 需要点击WEB
             elif "rbacUsersController/login.html" in current_url:
-                self._handle_rbac_intermediate(page)
+                if state["web"]:
+                    self._handle_rbac_intermediate(page)
 
             # 情况4: 已在系统内其他页面
             elif self._is_in_system(current_url):
                 print("   ✅ 已在系统内")
                 break
 
-            # 每5秒打印一次进度
-            if i % 10 == 0 and i > 0:
-                print(f"   ⏳ 等待中... {i // 2}秒", end="\r")
-
-            # 快速检测
-            time.sleep(LOGIN_CHECK_INTERVAL)
+            # 事件驱动等待：URL 一变化立即进入下一轮，而不是固定休眠
+            page.wait.url_change(current_url, exclude=True, timeout=interval)
 
         print()  # 换行
 
         # 最终验证
-        success = "mainController/index.html" in page.url or self._is_in_system(page.url)
+        final_url = page.url  # 只读取一次，page.url 每次读取都是一次 CDP 往返
+        success = "mainController/index.html" in final_url or self._is_in_system(final_url)
         if success:
             print(f"🎉 准备完成!当前页面: {page.title}")
             self.log("系统就绪", "SUCCESS")
@@ -158,7 +248,7 @@ class LoginManager:
 
             return True
         else:
-            print(f"❌ 超时或异常,当前页面: {page.url}")
+            print(f"❌ 超时或异常,当前页面: {final_url}")
             self.log("页面状态异常", "ERROR")
             return False
 
@@ -217,6 +307,10 @@ class LoginManager:
         Args:
             page: ChromiumPage 对象
         """
+        # 等待 WEB 按钮出现（元素一加载即返回，无需按秒轮询）
+        if not page.wait.ele_displayed("text:WEB", timeout=LOGIN_CHECK_INTERVAL):
+            return
+
         web_btn = page.ele("text:WEB")
         if web_btn and web_btn.states.is_displayed:
             print("   👀 检测到中间页,点击 'WEB' 按钮...")
@@ -241,21 +335,22 @@ class LoginManager:
 
             page.get(target_url)
 
-            # 等待页面加载完成
+            # 等待页面加载完成（URL 变化时立即检查，不逐秒打印进度）
             print("   ⏳ 等待目标页面加载...")
-            for i in range(TARGET_PAGE_LOAD_TIMEOUT):
+            start = time.monotonic()
+            deadline = start + TARGET_PAGE_LOAD_TIMEOUT
+            while True:
                 current_url = page.url
-                if (
-                    "integratedMonitorController" in current_url
-                    or "lineLogController" in current_url
-                ):
-                    print(f"   ✅ 已到达目标页面 (耗时: {i + 1}秒)")
+                if _TARGET_URL_RE.search(current_url):
+                    print(f"   ✅ 已到达目标页面 (耗时: {time.monotonic() - start:.1f}秒)")
                     print(f"   📍 最终URL: {current_url}")
                     return True
-                print(
-                    f"   ⏳ 加载中... URL: {current_url[:80]}... ({i + 1}/{TARGET_PAGE_LOAD_TIMEOUT}秒)"
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                page.wait.url_change(
+                    current_url, exclude=True, timeout=min(remaining, LOGIN_CHECK_INTERVAL)
                 )
-                time.sleep(1)
 
             print("   ⚠️ 页面加载超时，可能被重定向")
             print(f"   📍 最终URL: {page.url}")
@@ -25,13 +25,18 @@ class FlightMonitorException(Exception):
         super().__init__(message)
         self.message = message
         self.context = context or {}
+        # 格式化后的错误信息缓存（异常在日志中常被多次格式化，构造后上下文视为不变）
+        self._str_cache: Optional[str] = None
 
     def __str__(self) -> str:
         """提供包含上下文的详细错误信息"""
-        if self.context:
-            context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
-            return f"{self.message} [{context_str}]"
-        return self.message
+        if self._str_cache is None:
+            if self.context:
+                context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
+                self._str_cache = f"{self.message} [{context_str}]"
+            else:
+                self._str_cache = self.message
+        return self._str_cache
 
     def to_dict(self) -> Dict[str, Any]:
         """将异常转换为字典，便于日志记录和监控"""
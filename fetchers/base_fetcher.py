@@ -119,6 +119,28 @@ class BaseFetcher(ABC):
         print(f"   ❌ 超时: 未找到 {desc}")
         return False
 
+    @staticmethod
+    def wait_for_page(page, url_text, locator, timeout=10):
+        """
+        等待页面跳转完成：URL 包含 url_text 且 locator 元素已加载
+
+        事件驱动等待，条件满足即返回，不按秒轮询
+
+        Args:
+            page: ChromiumPage 对象
+            url_text: 目标页面 URL 片段
+            locator: 页面关键元素定位符
+            timeout: 总超时时间（秒）
+
+        Returns:
+            bool: 是否在超时前加载完成
+        """
+        deadline = time.monotonic() + timeout
+        if not page.wait.url_change(url_text, timeout=timeout):
+            return False
+        remaining = max(deadline - time.monotonic(), 0.1)
+        return bool(page.wait.eles_loaded(locator, timeout=remaining))
+
     def connect_browser(self):
         """
         连接到浏览器
@@ -197,8 +197,8 @@ class DataProcessor:
             backup_filename = f"{name}_{timestamp}{ext}"
             backup_path = os.path.join(self.backup_dir, backup_filename)
 
-            # 复制文件
-            shutil.copy2(filepath, backup_path)
+            # 复制文件（只复制内容；时间戳已在文件名中，无需保留元数据）
+            shutil.copyfile(filepath, backup_path)
 
             self.log(f"文件已备份: {backup_path}", "SUCCESS")
             return backup_path
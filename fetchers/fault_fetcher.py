@@ -139,20 +139,14 @@ class FaultFetcher(BaseFetcher):
                 page.get(target_url)
                 print("   ✅ 已导航到故障监控页面")
 
-                # 等待页面关键元素加载完成
+                # 等待页面关键元素加载完成：URL 到达目标页面且机号下拉框已加载
                 print("   ⏳ 等待页面加载...")
-                for i in range(10):
-                    # 先检查URL是否已经到达目标页面
-                    current_url_after_nav = page.url
-                    if "integratedMonitorController" in current_url_after_nav:
-                        # 再检查机号下拉框是否已加载
-                        dropdown = page.ele("tag:div@@class=filter-option")
-                        if dropdown:
-                            print(f"   ✅ 页面加载完成 (耗时: {i + 1}秒)")
-                            print(f"   📍 当前URL: {current_url_after_nav}")
-                            break
-                    print(f"   ⏳ 加载中... URL: {current_url_after_nav[:80]}... ({i + 1}/10秒)")
-                    time.sleep(1)
+                start = time.monotonic()
+                if self.wait_for_page(
+                    page, "integratedMonitorController", "tag:div@@class=filter-option", 10
+                ):
+                    print(f"   ✅ 页面加载完成 (耗时: {time.monotonic() - start:.1f}秒)")
+                    print(f"   📍 当前URL: {page.url}")
                 else:
                     # 10秒后仍未到达目标页面
                     final_url = page.url
@@ -198,15 +192,11 @@ class FaultFetcher(BaseFetcher):
                 try:
                     page.get(target_url)
                     # 等待页面关键元素加载
-                    for i in range(10):
-                        current_url_after_reload = page.url
-                        if "integratedMonitorController" in current_url_after_reload:
-                            dropdown = page.ele("tag:div@@class=filter-option")
-                            if dropdown:
-                                print(f"   ✅ 页面重新加载完成 (耗时: {i + 1}秒)")
-                                break
-                        print(f"   ⏳ 重新加载中... ({i + 1}/10秒)")
-                        time.sleep(1)
+                    start = time.monotonic()
+                    if self.wait_for_page(
+                        page, "integratedMonitorController", "tag:div@@class=filter-option", 10
+                    ):
+                        print(f"   ✅ 页面重新加载完成 (耗时: {time.monotonic() - start:.1f}秒)")
                     else:
                         print("   ⚠️ 页面重新加载超时，尝试继续初始化")
                 except Exception as e:
@@ -390,7 +380,7 @@ class FaultFetcher(BaseFetcher):
 
     def _select_single_aircraft(self, page, aircraft):
         """选择单架飞机"""
-        # 重新获取元素列表
+        # 重新获取元素列表：每次选择后 bootstrap-select 会重新渲染选项，之前的元素句柄失效
         text_elements = page.eles("tag:span@@class=text")
         for ele in text_elements:
             text = ele.text.strip()
@@ -20,6 +20,7 @@ from config.constants import (
     DATA_REFRESH_WAIT_SECONDS,
     FRAMEWORK_LOAD_WAIT_SECONDS,
     PAGE_LOAD_WAIT_SECONDS,
+    TARGET_PAGE_LOAD_TIMEOUT,
 )
 
 # 添加项目根目录到路径
@@ -605,13 +606,11 @@ class LegFetcher(BaseFetcher):
         intermediate_url = "https://cis.comac.cc:8004/caphm/mainController/index.html"
         page.get(url=intermediate_url)
 
-        # 等待页面加载
+        # 等待页面加载（URL 到达首页即返回，不按秒轮询）
         print("   ⏳ 等待8004首页初始化...")
-        for i in range(8):
-            time.sleep(1)
-            if "mainController/index.html" in page.url:
-                print(f"   ✅ 8004首页已就绪 ({i + 1}秒)")
-                break
+        start = time.monotonic()
+        if page.wait.url_change("mainController/index.html", timeout=8):
+            print(f"   ✅ 8004首页已就绪 ({time.monotonic() - start:.1f}秒)")
 
         # 额外等待，确保JavaScript框架完全加载
         print("   ⏳ 等待页面框架完全加载...")
@@ -623,21 +622,15 @@ class LegFetcher(BaseFetcher):
         print("   🚀 导航到目标页面...")
         page.get(url=target_url)
 
-        # 验证是否到达目标页面
+        # 验证是否到达目标页面（URL 一到达目标页面即返回，不再固定等待后逐秒检查）
         print("   🔍 验证页面...")
-        time.sleep(2)
-
-        max_wait = 10
-        for i in range(max_wait):
-            current_url = page.url
-            print(f"   📍 第{i + 1}次检查: {current_url}")
-
-            if "lineLogController/index.html" in current_url:
-                print("   ✅ 成功到达目标页面!")
-                print("   💡 此后将停留在此页面")
-                return True
-            time.sleep(1)
+        if page.wait.url_change("lineLogController/index.html", timeout=TARGET_PAGE_LOAD_TIMEOUT):
+            print(f"   📍 当前页面: {page.url}")
+            print("   ✅ 成功到达目标页面!")
+            print("   💡 此后将停留在此页面")
+            return True
 
+        print(f"   📍 当前页面: {page.url}")
         print("   ❌ 导航失败！")
         return False
 
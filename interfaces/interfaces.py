@@ -6,9 +6,11 @@
 
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from DrissionPage import ChromiumPage
+if TYPE_CHECKING:
+    # 仅用于类型注解：导入接口时不加载 DrissionPage
+    from DrissionPage import ChromiumPage
 
 
 class IFetcher(ABC):
@@ -19,7 +21,7 @@ class IFetcher(ABC):
     """
 
     @abstractmethod
-    def connect_browser(self) -> Optional[ChromiumPage]:
+    def connect_browser(self) -> Optional["ChromiumPage"]:
         """
         连接到浏览器
 
@@ -29,7 +31,7 @@ class IFetcher(ABC):
         pass
 
     @abstractmethod
-    def smart_login(self, page: ChromiumPage) -> bool:
+    def smart_login(self, page: "ChromiumPage") -> bool:
         """
         执行智能登录
 
@@ -53,7 +55,7 @@ class IFetcher(ABC):
 
     @abstractmethod
     def navigate_to_target_page(
-        self, page: ChromiumPage, target_date: str, aircraft_list: List[str]
+        self, page: "ChromiumPage", target_date: str, aircraft_list: List[str]
     ) -> Optional[List[Dict[str, Any]]]:
         """
         导航到目标页面并提取数据
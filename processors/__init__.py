@@ -25,7 +25,7 @@ updater.update()
 #### leg_status_monitor.py - LegStatusMonitor
 Monitors leg status changes and sends email notifications.
 Features:
-- Hash-based change detection (MD5 of content)
+- Hash-based change detection (BLAKE2b of content)
 - Detects OUT/OFF/ON/IN time updates
 - Sends Vietnam time formatted emails
 
@@ -8,7 +8,6 @@
 - 发送故障邮件通知
 """
 
-import hashlib
 import os
 import re
 import sys
@@ -25,8 +24,19 @@ from config.flight_phase_mapping import (
     get_phase_name_without_suffix,
 )
 from config.flight_schedule import FlightSchedule
-from core.base_monitor import BaseStatusMonitor
-from core.fault_filter import FaultFilter
+from core.base_monitor import (
+    BaseStatusMonitor,
+    hash_text,
+    legacy_hash_text,
+    read_json,
+    write_json,
+)
+from core.fault_filter import (
+    _DEFAULT_CONFIG_DIR,
+    GROUP_RULES_FILE,
+    SINGLE_RULES_FILE,
+    get_fault_filter,
+)
 from core.logger import get_logger
 from exceptions.data import DataFileError, DataParseError
 from notifiers.fault_status_notifier import FaultStatusNotifier
@@ -38,10 +48,29 @@ AIRPORT_TO_CITY = {"VVNB": "河内", "VVTS": "胡志明", "VVCS": "昆岛"}
 class FaultStatusMonitor(BaseStatusMonitor):
     """故障状态监控器"""
 
-    def __init__(self, target_date=None):
-        super().__init__(target_date)
+    # 航班时间字段：(字段名, 航班数据列名)
+    FLIGHT_TIME_FIELDS = (
+        ("OUT", "OUT"),
+        ("OFF", "OFF"),
+        ("ON", "ON"),
+        ("IN", "IN"),
+        ("departure_airport", "起飞机场"),
+        ("arrival_airport", "着陆机场"),
+    )
+
+    def __init__(self, target_date=None, verbose=True):
+        super().__init__(target_date, verbose)
         self.log = get_logger()
         self.flight_times = None
+        # 航班数据文件（用于补充故障的起降时间上下文）
+        self._leg_file = os.path.join(
+            project_root, "data", "daily_raw", f"leg_data_{self.target_date}.csv"
+        )
+        # 故障过滤规则文件（规则修改后过滤结果随之变化）
+        self._rule_files = tuple(
+            os.path.join(_DEFAULT_CONFIG_DIR, name)
+            for name in (SINGLE_RULES_FILE, GROUP_RULES_FILE)
+        )
 
     def get_data_file_path(self):
         """获取数据文件路径"""
@@ -51,9 +80,18 @@ class FaultStatusMonitor(BaseStatusMonitor):
         """获取状态文件路径"""
         return os.path.join(project_root, "data", "last_fault_email_status.json")
 
+    def get_source_files(self):
+        """
+        通知内容还依赖航班数据文件中的起降时间，以及故障过滤规则文件
+
+        规则文件为可选文件，只加入存在的；规则文件新增或删除时文件列表变化，同样视为源文件变化
+        """
+        rule_files = tuple(path for path in self._rule_files if os.path.exists(path))
+        return (self._data_file, self._leg_file, *rule_files)
+
     def read_data_file(self):
         """读取数据文件（重写以支持编码处理和列名重命名）"""
-        data_file = self.get_data_file_path()
+        data_file = self._data_file
 
         if not os.path.exists(data_file):
             self.log(f"数据文件不存在: {data_file}", "ERROR")
@@ -81,7 +119,7 @@ class FaultStatusMonitor(BaseStatusMonitor):
             if "触发_time" in df.columns and "触发时间" not in df.columns:
                 df.rename(columns={"触发_time": "触发时间"}, inplace=True)
 
-            print(f"   ✅ 读取到 {len(df)} 行数据")
+            self._echo(f"   ✅ 读取到 {len(df)} 行数据")
             return df
         except pd.errors.ParserError as e:
             error_msg = f"CSV解析失败: {data_file} - {e}"
@@ -110,56 +148,62 @@ class FaultStatusMonitor(BaseStatusMonitor):
     def generate_content(self, df):
         """生成故障汇总内容"""
         # 应用故障过滤规则
-        print("\n🔍 应用故障过滤规则...")
+        self._echo("\n🔍 应用故障过滤规则...")
         try:
-            filter_obj = FaultFilter()
+            filter_obj = get_fault_filter()
             filter_stats = filter_obj.get_filter_stats()
-            print(
+            self._echo(
                 f"   📋 过滤规则: 组合规则 {filter_stats['single_filter_rules']} 条, 关联规则 {filter_stats['group_filter_rules']} 条"
             )
 
             df = filter_obj.apply_filters(df)
-            print(f"   ✅ 过滤后剩余 {len(df)} 行数据")
+            self._echo(f"   ✅ 过滤后剩余 {len(df)} 行数据")
         except Exception as e:
             print(f"   ⚠️ 过滤失败，继续使用原始数据: {e}")
             self.log(f"Filter application failed: {e}", "WARNING")
 
         # 加载航班时间数据
-        print("\n✈️ 加载航班时间数据...")
+        self._echo("\n✈️ 加载航班时间数据...")
         self.flight_times = self.load_flight_times()
         if self.flight_times:
-            print(f"   ✅ 成功加载 {len(self.flight_times)} 条航班时间记录")
+            self._echo(f"   ✅ 成功加载 {len(self.flight_times)} 条航班时间记录")
         else:
             print("   ⚠️ 未找到航班时间数据，邮件将不包含时间背景信息")
 
         # 生成故障汇总
-        print("\n📊 生成故障汇总...")
+        self._echo("\n📊 生成故障汇总...")
         return self.generate_fault_summary(df)
 
     def get_content_hash(self, content):
         """获取内容哈希值（基于数据行数）"""
-        return hashlib.md5(
-            f"{self.target_date}_{len(content) if hasattr(content, '__len__') else 0}".encode()
-        ).hexdigest()
+        return hash_text(self._hash_key(content))
+
+    def get_legacy_content_hash(self, content):
+        """获取内容的旧版（MD5）哈希值（基于数据行数）"""
+        return legacy_hash_text(self._hash_key(content))
+
+    def _hash_key(self, content):
+        """变化检测的哈希输入：日期 + 数据行数"""
+        return f"{self.target_date}_{len(content) if hasattr(content, '__len__') else 0}"
 
     def send_notification(self, content):
         """发送故障通知"""
-        notifier = FaultStatusNotifier(config_dict=self.gmail_config)
-
-        if notifier.is_enabled():
-            return notifier.send_fault_status_notification(content, self.target_date, None)
-        else:
-            print("   ⚠️ 邮件通知未启用")
-            print("\n📧 通知内容：")
-            print(content)
-            return True  # 未启用时认为发送成功
+        # with 退出时关闭 SMTP 连接（发送 QUIT）
+        with FaultStatusNotifier(config_dict=self.gmail_config) as notifier:
+            if notifier.is_enabled():
+                return notifier.send_fault_status_notification(content, self.target_date, None)
+            else:
+                print("   ⚠️ 邮件通知未启用")
+                print("\n📧 通知内容：")
+                print(content)
+                return True  # 未启用时认为发送成功
 
     def save_current_status(self, status_hash, **metadata):
         """保存当前状态（重写以保存额外的元数据）"""
-        status_file = self.get_status_file_path()
+        status_file = self._status_file
 
         try:
-            os.makedirs(os.path.dirname(status_file), exist_ok=True)
+            self._ensure_dir(os.path.dirname(status_file))
 
             status_data = {
                 "data_hash": status_hash,  # 故障监控使用 data_hash 而不是 status_hash
@@ -168,12 +212,9 @@ class FaultStatusMonitor(BaseStatusMonitor):
                 **metadata,
             }
 
-            with open(status_file, "w", encoding="utf-8") as f:
-                import json
-
-                json.dump(status_data, f, ensure_ascii=False, indent=2)
+            write_json(status_file, status_data)
 
-            print("   💾 已保存当前状态")
+            self._echo("   💾 已保存当前状态")
             self.log(f"状态已保存: {status_file}")
         except Exception as e:
             print(f"   ⚠️ 保存状态失败: {e}")
@@ -181,21 +222,18 @@ class FaultStatusMonitor(BaseStatusMonitor):
 
     def load_last_status(self):
         """加载上次保存的状态（重写以支持 data_hash）"""
-        status_file = self.get_status_file_path()
+        status_file = self._status_file
 
         if not os.path.exists(status_file):
             return None
 
         try:
-            with open(status_file, encoding="utf-8") as f:
-                import json
-
-                status_data = json.load(f)
-                # 兼容 status_hash 和 data_hash
-                if "data_hash" not in status_data and "status_hash" in status_data:
-                    status_data["data_hash"] = status_data["status_hash"]
-                print("   📋 上次状态已加载")
-                return status_data
+            status_data = read_json(status_file)
+            # 兼容 status_hash 和 data_hash
+            if "data_hash" not in status_data and "status_hash" in status_data:
+                status_data["data_hash"] = status_data["status_hash"]
+            self._echo("   📋 上次状态已加载")
+            return status_data
         except Exception as e:
             print(f"   ⚠️ 读取上次状态失败: {e}")
             self.log(f"读取状态文件失败: {e}", "WARNING")
@@ -204,19 +242,19 @@ class FaultStatusMonitor(BaseStatusMonitor):
     def has_status_changed(self, current_hash, last_status):
         """检查状态是否发生变化（重写以使用 data_hash）"""
         if last_status is None:
-            print("   ✅ 首次运行，需要发送通知")
+            self._echo("   ✅ 首次运行，需要发送通知")
             return True
 
         last_hash = last_status.get("data_hash")  # 使用 data_hash 而不是 status_hash
-        print(f"   📊 上次数据哈希: {last_hash}")
-        print(f"   📊 当前数据哈希: {current_hash}")
+        self._echo(f"   📊 上次数据哈希: {last_hash}")
+        self._echo(f"   📊 当前数据哈希: {current_hash}")
 
         if current_hash == last_hash:
-            print("\n   ℹ️ 数据无变化，跳过通知")
+            self._echo("\n   ℹ️ 数据无变化，跳过通知")
             self.log("数据无变化，跳过通知")
             return False
 
-        print("\n   ✅ 检测到数据变化")
+        self._echo("\n   ✅ 检测到数据变化")
         return True
 
     # ============ 辅助方法 ============
@@ -363,8 +401,8 @@ class FaultStatusMonitor(BaseStatusMonitor):
 
         # 如果实际数据无法获取，尝试从配置文件获取
         flight_info = FlightSchedule.get_flight_info(flight_num)
-        if flight_info and "route" in flight_info:
-            route = flight_info["route"]
+        if flight_info:
+            route = flight_info.route
             parts = route.split("-")
             if len(parts) == 2:
                 city_map = {"HAN": "河内", "SGN": "胡志明", "VCS": "昆岛"}
@@ -377,9 +415,7 @@ class FaultStatusMonitor(BaseStatusMonitor):
 
     def load_flight_times(self):
         """加载航班起降时间数据和机场信息"""
-        leg_file = os.path.join(
-            project_root, "data", "daily_raw", f"leg_data_{self.target_date}.csv"
-        )
+        leg_file = self._leg_file
 
         if not os.path.exists(leg_file):
             self.log(f"航班数据文件不存在: {leg_file}", "WARNING")
@@ -393,16 +429,18 @@ class FaultStatusMonitor(BaseStatusMonitor):
 
             flight_times = {}
 
-            for _, row in df.iterrows():
-                key = (row["执飞飞机"], row["航班号"])
-                flight_times[key] = {
-                    "OUT": row.get("OUT", ""),
-                    "OFF": row.get("OFF", ""),
-                    "ON": row.get("ON", ""),
-                    "IN": row.get("IN", ""),
-                    "departure_airport": row.get("起飞机场", ""),
-                    "arrival_airport": row.get("着陆机场", ""),
-                }
+            # 缺失的列取空字符串；itertuples 逐行返回元组，避免 iterrows 为每行构造 Series
+            present = [(name, col) for name, col in self.FLIGHT_TIME_FIELDS if col in df.columns]
+            fields = [name for name, _ in present]
+            columns = [col for _, col in present]
+            empty = {name: "" for name, _ in self.FLIGHT_TIME_FIELDS}
+
+            for aircraft, flight_no, *values in df[["执飞飞机", "航班号", *columns]].itertuples(
+                index=False, name=None
+            ):
+                times = empty.copy()
+                times.update(zip(fields, values))
+                flight_times[(aircraft, flight_no)] = times
 
             self.log(f"成功加载 {len(flight_times)} 条航班时间数据")
             return flight_times
@@ -540,11 +578,11 @@ class FaultStatusMonitor(BaseStatusMonitor):
         return "\n".join(summary_lines)
 
 
-def monitor_fault_status(target_date=None):
+def monitor_fault_status(target_date=None, verbose=True):
     """
     监控故障状态并发送通知（向后兼容的包装函数）
     """
-    monitor = FaultStatusMonitor(target_date)
+    monitor = FaultStatusMonitor(target_date, verbose)
     return monitor.run()
 
 
@@ -324,7 +324,7 @@ class LegAlertMonitor:
             # 未知航班，跳过此检查
             return None
 
-        duration_minutes = flight_info.get("duration_minutes", 0)
+        duration_minutes = flight_info.duration_minutes
 
         # 计算OFF时间到现在的分钟数
         off_minutes = self.parse_time_to_minutes(off_time)
@@ -449,16 +449,16 @@ class LegAlertMonitor:
         # 提取消息部分
         alert_messages = [alert["message"] for alert in alerts]
 
-        notifier = LegAlertNotifier(config_dict=self.gmail_config)
-
-        if notifier.is_enabled():
-            return notifier.send_alert_notification(alert_messages, self.target_date)
-        else:
-            print("   ⚠️ 邮件通知未启用")
-            print("\n📧 告警内容：")
-            for msg in alert_messages:
-                print(f"   - {msg}")
-            return True  # 未启用时认为发送成功
+        # with 退出时关闭 SMTP 连接（发送 QUIT）
+        with LegAlertNotifier(config_dict=self.gmail_config) as notifier:
+            if notifier.is_enabled():
+                return notifier.send_alert_notification(alert_messages, self.target_date)
+            else:
+                print("   ⚠️ 邮件通知未启用")
+                print("\n📧 告警内容：")
+                for msg in alert_messages:
+                    print(f"   - {msg}")
+                return True  # 未启用时认为发送成功
 
     def monitor(self):
         """
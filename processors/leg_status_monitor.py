@@ -12,7 +12,6 @@
 - 数据新鲜度检查，防止使用过期数据发送错误通知
 """
 
-import hashlib
 import json
 import os
 import sys
@@ -45,8 +44,8 @@ DATA_STALE_THRESHOLD = 300  # 5分钟
 class LegStatusMonitor(BaseStatusMonitor):
     """航班状态监控器"""
 
-    def __init__(self, target_date=None):
-        super().__init__(target_date)
+    def __init__(self, target_date=None, verbose=True):
+        super().__init__(target_date, verbose)
         self.log = get_logger()
         # 数据时间戳文件路径
         self.data_timestamp_file = os.path.join(project_root, "data", "last_data_update.json")
@@ -66,7 +65,7 @@ class LegStatusMonitor(BaseStatusMonitor):
         # 从配置文件读取需要监控的飞机列表
         config_loader = load_config()
         configured_aircraft = config_loader.get_aircraft_list()
-        print(f"   📋 配置的监控飞机: {', '.join(configured_aircraft)}")
+        self._echo(f"   📋 配置的监控飞机: {', '.join(configured_aircraft)}")
 
         # 过滤数据：只保留配置的飞机
         # 使用 str.contains() 支持短机号匹配（如 "B-652G" 可匹配 "C909-185/B-652G"）
@@ -77,11 +76,11 @@ class LegStatusMonitor(BaseStatusMonitor):
             print(f"   ⚠️ 过滤后无数据（原始数据: {len(df)} 行）")
             return []
 
-        print(f"   ✅ 过滤前 {len(df)} 行，过滤后 {len(df_filtered)} 行")
+        self._echo(f"   ✅ 过滤前 {len(df)} 行，过滤后 {len(df_filtered)} 行")
 
         # 从过滤后的数据中获取所有飞机
         all_aircraft = df_filtered["执飞飞机"].unique()
-        print(f"   ✅ 检测到 {len(all_aircraft)} 架飞机")
+        self._echo(f"   ✅ 检测到 {len(all_aircraft)} 架飞机")
 
         # 为每架飞机生成状态消息
         for aircraft_num in all_aircraft:
@@ -92,28 +91,23 @@ class LegStatusMonitor(BaseStatusMonitor):
 
         return notifications if notifications else []
 
-    def get_content_hash(self, content):
-        """获取内容哈希值"""
-        status_text = "\n".join(content) if isinstance(content, list) else str(content)
-        return hashlib.md5(status_text.encode("utf-8")).hexdigest()
-
     def send_notification(self, content):
         """发送航班状态通知"""
         if not content:
             return False
 
-        notifier = LegStatusNotifier(config_dict=self.gmail_config)
-
-        if notifier.is_enabled():
-            subject = f"航班状态 - {self.target_date}"
-            body = "\n".join(content)
-            return notifier.send_email(subject, body)
-        else:
-            print("   ⚠️ 邮件通知未启用")
-            print("\n📧 通知内容：")
-            for msg in content:
-                print(f"   - {msg}")
-            return True  # 未启用时认为发送成功
+        # with 退出时关闭 SMTP 连接（发送 QUIT）
+        with LegStatusNotifier(config_dict=self.gmail_config) as notifier:
+            if notifier.is_enabled():
+                subject = f"航班状态 - {self.target_date}"
+                body = "\n".join(content)
+                return notifier.send_email(subject, body)
+            else:
+                print("   ⚠️ 邮件通知未启用")
+                print("\n📧 通知内容：")
+                for msg in content:
+                    print(f"   - {msg}")
+                return True  # 未启用时认为发送成功
 
     # ============ 辅助方法 ============
 
@@ -150,7 +144,7 @@ class LegStatusMonitor(BaseStatusMonitor):
                 print(f"   ⚠️ 数据已过期：最后更新于 {last_update_str}（{int(time_diff)}秒前）")
                 return False
 
-            print(f"   ✅ 数据新鲜：最后更新于 {last_update_str}（{int(time_diff)}秒前）")
+            self._echo(f"   ✅ 数据新鲜：最后更新于 {last_update_str}（{int(time_diff)}秒前）")
             return True
 
         except Exception as e:
@@ -166,7 +160,7 @@ class LegStatusMonitor(BaseStatusMonitor):
             bool: 监控成功返回 True，否则返回 False
         """
         # 首先检查数据新鲜度
-        print("\n🔍 检查数据新鲜度...")
+        self._echo("\n🔍 检查数据新鲜度...")
         if not self.is_data_fresh():
             print("   ⚠️ 数据已过期，跳过本次状态检查")
             print("   💡 可能原因：浏览器连接断开、网络问题或数据抓取失败")
@@ -230,8 +224,8 @@ class LegStatusMonitor(BaseStatusMonitor):
 
         # 否则使用计划航线
         flight_info = FlightSchedule.get_flight_info(flight_number)
-        if flight_info and "route" in flight_info:
-            route = flight_info["route"]
+        if flight_info:
+            route = flight_info.route
             route_mapping = {"HAN": "河内", "VCS": "昆岛", "SGN": "胡志明"}
             parts = route.split("-")
             if len(parts) == 2:
@@ -276,7 +270,7 @@ class LegStatusMonitor(BaseStatusMonitor):
                 flight_info = FlightSchedule.get_flight_info(flight_num)
 
                 if flight_info:
-                    scheduled_time = flight_info["scheduled_departure"]
+                    scheduled_time = flight_info.scheduled_departure
                 else:
                     scheduled_time = row["OUT"] if pd.notna(row["OUT"]) else "00:00"
 
@@ -293,8 +287,9 @@ class LegStatusMonitor(BaseStatusMonitor):
         if not abnormal_detected:
             return status_notifications
 
-        detector = AbnormalDetector()
-        abnormal_type = detector.get_abnormal_type_description(abnormal_detected["abnormal_type"])
+        abnormal_type = AbnormalDetector.get_abnormal_type_description(
+            abnormal_detected["abnormal_type"]
+        )
         abnormal_warning = f"⚠️ 提醒：原计划{abnormal_detected['original_route']}，系统显示{abnormal_detected['actual_route']}，{abnormal_type}。"
 
         return status_notifications + [abnormal_warning]
@@ -307,6 +302,9 @@ class LegStatusMonitor(BaseStatusMonitor):
         if not flight_sequence:
             return [f"{aircraft_num}暂无航班数据"]
 
+        # 一次性检测所有航班的异常类型，循环中只为异常行生成详情
+        abnormal_types = detector.detect_abnormal_types(df_aircraft)
+
         current_flight = None
         current_row = None
         last_completed_flight = None
@@ -323,9 +321,8 @@ class LegStatusMonitor(BaseStatusMonitor):
                 row = flight_rows.iloc[0]
 
                 # 检测异常
-                abnormal = detector.check_abnormal_from_row(row)
-                if abnormal and abnormal["is_abnormal"]:
-                    abnormal_detected = abnormal
+                if abnormal_types[row.name] is not None:
+                    abnormal_detected = detector.check_abnormal_from_row(row)
                     abnormal_flight_num = flight_num
                     abnormal_row = row
 
@@ -471,11 +468,11 @@ class LegStatusMonitor(BaseStatusMonitor):
         )
 
 
-def monitor_flight_status(target_date=None):
+def monitor_flight_status(target_date=None, verbose=True):
     """
     监控航班状态变化并发送通知（向后兼容的包装函数）
     """
-    monitor = LegStatusMonitor(target_date)
+    monitor = LegStatusMonitor(target_date, verbose)
     return monitor.run()
 
 
@@ -299,7 +299,8 @@ class LegScheduler(BaseScheduler):
             from processors.leg_status_monitor import monitor_flight_status
 
             print("\n📧 检查状态变化...")
-            success = monitor_flight_status(target_date)
+            # 每个抓取周期都会检查，控制台只输出警告和错误
+            success = monitor_flight_status(target_date, verbose=False)
 
             if success:
                 print("✅ 状态监控完成")
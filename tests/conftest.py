@@ -0,0 +1,16 @@
+"""
+pytest 公共配置
+
+测试期间切换到临时工作目录，默认日志（logs/）和数据时间戳（data/）等
+按相对路径写入的运行时文件不落入项目目录
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_workdir(tmp_path_factory):
+    """整个测试会话在临时目录中运行"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("workdir"))
+        yield
@@ -0,0 +1,58 @@
+"""
+AbnormalDetector 单元测试
+
+测试逐行检测与批量检测结果一致
+"""
+
+import os
+import sys
+import unittest
+
+# 添加项目根目录到路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import pandas as pd
+
+from core.abnormal_detector import AbnormalDetector
+
+ROWS = [
+    # 正常航班
+    ("VJ105", "VVNB-内排国际机场", "VVCS-昆仑国际机场"),
+    # 航线异常
+    ("VJ105", "VVNB-内排国际机场", "VVCI-海防吉碑国际"),
+    # 起降机场相同
+    ("VJ112", "VVTS-新山一国际机场", "VVTS-新山一国际机场"),
+    # 未知航班
+    ("VJ999", "VVNB-内排国际机场", "VVCI-海防吉碑国际"),
+    # 机场为空
+    ("VJ105", None, "VVCS-昆仑国际机场"),
+]
+
+
+class TestAbnormalDetector(unittest.TestCase):
+    """测试 AbnormalDetector"""
+
+    def setUp(self):
+        """每个测试前创建检测器"""
+        self.detector = AbnormalDetector()
+
+    def test_detect_abnormal_types(self):
+        """测试单条检测的异常类型"""
+        types = [(self.detector.detect_abnormal(*row) or {}).get("abnormal_type") for row in ROWS]
+
+        self.assertEqual(types, [None, "route_mismatch", "same_airport", "unknown_flight", None])
+
+    def test_batch_matches_single(self):
+        """测试批量检测与逐行检测结果一致"""
+        df = pd.DataFrame(ROWS, columns=["航班号", "起飞机场", "着陆机场"], index=[3, 1, 4, 0, 2])
+
+        batch = self.detector.detect_abnormal_types(df)
+
+        for index, row in df.iterrows():
+            single = self.detector.check_abnormal_from_row(row)
+            self.assertEqual(batch[index], single["abnormal_type"] if single else None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,7 +16,7 @@ sys.path.insert(0, project_root)
 
 import pandas as pd
 
-from core.base_monitor import BaseStatusMonitor
+from core.base_monitor import BaseStatusMonitor, hash_text
 
 
 class ConcreteStatusMonitor(BaseStatusMonitor):
@@ -116,6 +116,31 @@ class TestBaseStatusMonitor(unittest.TestCase):
         self.assertIsNotNone(df)
         self.assertEqual(len(df), 3)
 
+    def test_saved_csv_round_trip(self):
+        """测试 DataSaver 写出的 CSV 与 csv 模块一致，读取结果与 pd.read_csv 一致"""
+        import csv
+        import io
+
+        from core.data_saver import DataSaver
+
+        data = [
+            ["航班号", "OUT", "备注", "空列"],
+            ["VJ105", "07:40", "", ""],
+            ["VJ107", "", 'x,"y"', ""],
+        ]
+        saver = DataSaver(self.test_dir, lambda *args, **kwargs: None, verbose=False)
+        data_file = saver.save_csv(data, "leg.csv", subdir="")
+
+        expected = io.StringIO(newline="")
+        csv.writer(expected).writerows(data)
+        with open(data_file, encoding="utf-8-sig", newline="") as f:
+            self.assertEqual(f.read(), expected.getvalue())
+
+        df = ConcreteStatusMonitor(data_file=data_file).read_data_file()
+        pd.testing.assert_frame_equal(df, pd.read_csv(data_file))
+        self.assertEqual(df["OUT"].iloc[0], "07:40")
+        self.assertTrue(df["空列"].isna().all())
+
     def test_read_data_file_not_exists(self):
         """测试读取不存在的数据文件"""
         # 创建监控器（使用不存在的文件）
@@ -221,9 +246,15 @@ class TestBaseStatusMonitor(unittest.TestCase):
         with self.assertRaises(TypeError):
             BaseStatusMonitor()
 
-    def test_get_content_hash_abstract_method(self):
-        """测试 get_content_hash 是抽象方法"""
-        # 这个测试在 test_generate_content_abstract_method 中已覆盖
+    def test_get_content_hash_default(self):
+        """测试 get_content_hash 默认实现（列表按行拼接后哈希）"""
+        monitor = ConcreteStatusMonitor(data_file="x.csv", status_file="x.json")
+
+        default_hash = BaseStatusMonitor.get_content_hash
+
+        self.assertEqual(default_hash(monitor, ["a", "b"]), hash_text("a\nb"))
+        self.assertEqual(len(hash_text("a\nb")), 32)
+        self.assertNotEqual(default_hash(monitor, ["a"]), default_hash(monitor, ["b"]))
 
     def test_send_notification_abstract_method(self):
         """测试 send_notification 是抽象方法"""
@@ -275,6 +306,66 @@ class TestBaseStatusMonitor(unittest.TestCase):
         self.assertTrue(result)
         self.assertFalse(monitor2.notification_sent)
 
+    @patch("builtins.print")
+    def test_monitor_legacy_md5_status_not_notified(self, mock_print):
+        """测试升级前的 MD5 状态文件：内容未变化时不发送通知，按新算法重新保存"""
+        import hashlib
+
+        from core.base_monitor import CONTENT_HASH_ALGO
+
+        data_file = os.path.join(self.test_dir, "test_data.csv")
+        pd.DataFrame({"col1": [1, 2]}).to_csv(data_file, index=False)
+        status_file = os.path.join(self.test_dir, "test_status.json")
+
+        monitor = ConcreteStatusMonitor(data_file=data_file, status_file=status_file)
+        # 使用默认的 BLAKE2b 哈希（测试子类重写为 MD5）
+        monitor.get_content_hash = hash_text
+        legacy_hash = hashlib.md5(b"Generated content with 2 rows").hexdigest()
+        monitor.save_current_status(legacy_hash)
+
+        self.assertTrue(monitor.monitor())
+        self.assertFalse(monitor.notification_sent)
+        status = monitor.load_last_status()
+        self.assertEqual(status["hash_algo"], CONTENT_HASH_ALGO)
+        self.assertEqual(status["status_hash"], hash_text(monitor.content_generated))
+
+    @patch("builtins.print")
+    def test_monitor_skips_unchanged_data_file(self, mock_print):
+        """测试数据文件自上次保存后未变化（修改时间或内容）时跳过读取"""
+        data_file = os.path.join(self.test_dir, "test_data.csv")
+        pd.DataFrame({"col1": [1, 2]}).to_csv(data_file, index=False)
+        status_file = os.path.join(self.test_dir, "test_status.json")
+
+        ConcreteStatusMonitor(data_file=data_file, status_file=status_file).monitor()
+
+        monitor = ConcreteStatusMonitor(data_file=data_file, status_file=status_file)
+        with patch.object(monitor, "read_data_file") as mock_read:
+            self.assertTrue(monitor.monitor())
+        mock_read.assert_not_called()
+
+        # 仅修改时间变化、内容不变时按内容哈希跳过
+        stat = os.stat(data_file)
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        monitor = ConcreteStatusMonitor(data_file=data_file, status_file=status_file)
+        with patch.object(monitor, "read_data_file") as mock_read:
+            self.assertTrue(monitor.monitor())
+        mock_read.assert_not_called()
+
+        # 已记录新的修改时间，再次运行时不再计算内容哈希
+        last_status = monitor.load_last_status()
+        self.assertEqual(last_status["source_stat"], monitor.get_source_stat())
+        monitor = ConcreteStatusMonitor(data_file=data_file, status_file=status_file)
+        with patch.object(monitor, "get_source_digest") as mock_digest:
+            self.assertTrue(monitor.monitor())
+        mock_digest.assert_not_called()
+
+        # 内容变化后重新读取并对比哈希
+        pd.DataFrame({"col1": [3, 4]}).to_csv(data_file, index=False)
+        monitor = ConcreteStatusMonitor(data_file=data_file, status_file=status_file)
+        self.assertTrue(monitor.monitor())
+        self.assertIsNotNone(monitor.content_generated)
+        self.assertFalse(monitor.notification_sent)
+
     @patch("builtins.print")
     def test_monitor_flow_data_file_not_found(self, mock_print):
         """测试监控流程（数据文件不存在）"""
@@ -353,6 +444,19 @@ class TestBaseStatusMonitor(unittest.TestCase):
         self.assertTrue(os.path.exists(os.path.dirname(status_file)))
         self.assertTrue(os.path.exists(status_file))
 
+    @patch("builtins.print")
+    def test_save_status_failure_keeps_previous_file(self, mock_print):
+        """测试保存中途失败时保留上次的状态文件，且不留下临时文件"""
+        status_file = os.path.join(self.test_dir, "test_status.json")
+        monitor = ConcreteStatusMonitor(status_file=status_file)
+        monitor.save_current_status("old_hash")
+
+        with patch("core.base_monitor.os.replace", side_effect=OSError("磁盘已满")):
+            monitor.save_current_status("new_hash")
+
+        self.assertEqual(monitor.load_last_status()["status_hash"], "old_hash")
+        self.assertFalse(os.path.exists(f"{status_file}.tmp"))
+
     def test_load_status_with_invalid_json(self):
         """测试加载无效的JSON状态文件"""
         status_file = os.path.join(self.test_dir, "invalid.json")
@@ -0,0 +1,211 @@
+"""
+BaseNotifier 单元测试
+
+测试 SMTP 连接复用与重连
+"""
+
+import os
+import shutil
+import smtplib
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 添加项目根目录到路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from core.base_notifier import BaseNotifier, _attachment_part, _parse_yaml
+from exceptions.notification import EmailSendError
+
+YAML_CONFIG = """
+email:
+  smtp_server: smtp.example.com
+  smtp_port: 587
+  smtp_user: sender@example.com
+  smtp_password: password
+  receiver_email: receiver@example.com
+"""
+
+GMAIL_CONFIG = {
+    "sender_email": "sender@example.com",
+    "app_password": "password",
+    "recipients": ["receiver@example.com"],
+}
+
+
+class ConcreteNotifier(BaseNotifier):
+    """具体的通知器实现（用于测试）"""
+
+
+@patch("builtins.print")
+@patch("core.base_notifier.smtplib.SMTP")
+class TestBaseNotifier(unittest.TestCase):
+    """测试 BaseNotifier SMTP 连接管理"""
+
+    def test_connection_reused_across_sends(self, mock_smtp, mock_print):
+        """测试多次发送只建立一次连接和登录"""
+        notifier = ConcreteNotifier(config_dict=GMAIL_CONFIG)
+
+        self.assertTrue(notifier.send_email("主题1", "正文"))
+        self.assertTrue(notifier.send_email("主题2", "正文"))
+
+        server = mock_smtp.return_value
+        mock_smtp.assert_called_once_with(
+            "smtp.gmail.com", 587, timeout=ConcreteNotifier.SMTP_TIMEOUT
+        )
+        server.starttls.assert_called_once()
+        server.login.assert_called_once_with("sender@example.com", "password")
+        self.assertEqual(server.send_message.call_count, 2)
+
+    def test_message_with_attachment(self, mock_smtp, mock_print):
+        """测试邮件正文与附件（中文文件名）"""
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir, ignore_errors=True)
+        file_path = os.path.join(test_dir, "故障数据.csv")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("a,b\n1,2\n")
+
+        notifier = ConcreteNotifier(config_dict=GMAIL_CONFIG)
+        self.assertTrue(notifier.send_email("主题", "正文", attachments=[file_path]))
+
+        msg = mock_smtp.return_value.send_message.call_args[0][0]
+        self.assertEqual(msg["Subject"], "主题")
+        self.assertEqual(msg.get_body().get_content(), "正文\n")
+        attachment = next(msg.iter_attachments())
+        self.assertEqual(attachment.get_filename(), "故障数据.csv")
+        self.assertEqual(attachment.get_content(), b"a,b\n1,2\n")
+        self.assertIsNone(attachment["MIME-Version"])
+
+    def test_attachment_encoded_once_until_file_changes(self, mock_smtp, mock_print):
+        """测试同一附件在多封邮件中只编码一次，文件修改后重新编码"""
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir, ignore_errors=True)
+        file_path = os.path.join(test_dir, "data.csv")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("a,b\n1,2\n")
+
+        notifier = ConcreteNotifier(config_dict=GMAIL_CONFIG)
+        notifier.send_email("主题1", "正文", attachments=[file_path])
+        misses = _attachment_part.cache_info().misses
+        notifier.send_email("主题2", "正文", attachments=[file_path])
+        self.assertEqual(_attachment_part.cache_info().misses, misses)
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("a,b\n3,4\n")
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        notifier.send_email("主题3", "正文", attachments=[file_path])
+
+        msg = mock_smtp.return_value.send_message.call_args[0][0]
+        self.assertEqual(next(msg.iter_attachments()).get_content(), b"a,b\n3,4\n")
+
+    def test_reconnect_when_connection_dead(self, mock_smtp, mock_print):
+        """测试连接失效（NOOP 失败）时重新连接"""
+        notifier = ConcreteNotifier(config_dict=GMAIL_CONFIG)
+        notifier.send_email("主题1", "正文")
+
+        mock_smtp.return_value.noop.side_effect = smtplib.SMTPServerDisconnected()
+        self.assertTrue(notifier.send_email("主题2", "正文"))
+
+        self.assertEqual(mock_smtp.call_count, 2)
+
+    def test_reconnect_after_max_messages(self, mock_smtp, mock_print):
+        """测试单个连接发送达到上限后关闭并重新连接"""
+        notifier = ConcreteNotifier(config_dict=GMAIL_CONFIG)
+        notifier.SMTP_MAX_MESSAGES_PER_CONNECTION = 2
+
+        for i in range(5):
+            self.assertTrue(notifier.send_email(f"主题{i}", "正文"))
+
+        self.assertEqual(mock_smtp.call_count, 3)
+        self.assertEqual(mock_smtp.return_value.quit.call_count, 2)
+        self.assertEqual(notifier._smtp_sent, 1)
+
+    def test_close_quits_connection(self, mock_smtp, mock_print):
+        """测试 close 发送 QUIT 并释放连接"""
+        notifier = ConcreteNotifier(config_dict=GMAIL_CONFIG)
+        notifier.send_email("主题", "正文")
+
+        notifier.close()
+
+        mock_smtp.return_value.quit.assert_called_once()
+        self.assertIsNone(notifier._smtp)
+
+    def test_context_manager_closes_connection(self, mock_smtp, mock_print):
+        """测试 with 语句退出时关闭连接"""
+        with ConcreteNotifier(config_dict=GMAIL_CONFIG) as notifier:
+            notifier.send_email("主题", "正文")
+
+        mock_smtp.return_value.quit.assert_called_once()
+        self.assertIsNone(notifier._smtp)
+
+    def test_batch_closes_connection_on_exit(self, mock_smtp, mock_print):
+        """测试 batch 内共用连接，退出时关闭"""
+        notifier = ConcreteNotifier(config_dict=GMAIL_CONFIG)
+
+        with notifier.batch():
+            notifier.send_success_notification("任务")
+            notifier.send_error_notification("任务", "错误")
+
+        mock_smtp.assert_called_once()
+        mock_smtp.return_value.quit.assert_called_once()
+        self.assertIsNone(notifier._smtp)
+
+    def test_yaml_config_parsed_once(self, mock_smtp, mock_print):
+        """测试 YAML 配置在多个实例间只解析一次，且返回副本"""
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir, ignore_errors=True)
+        config_file = os.path.join(test_dir, "email_config.yaml")
+        with open(config_file, "w", encoding="utf-8") as f:
+            f.write(YAML_CONFIG)
+
+        notifier = ConcreteNotifier(config_file=config_file)
+        misses = _parse_yaml.cache_info().misses
+        notifier.config["smtp_user"] = "changed@example.com"
+        other = ConcreteNotifier(config_file=config_file)
+
+        self.assertTrue(other.is_enabled())
+        self.assertEqual(_parse_yaml.cache_info().misses, misses)
+        self.assertEqual(other.config["smtp_user"], "sender@example.com")
+
+    def test_send_email_async(self, mock_smtp, mock_print):
+        """测试后台发送返回 Future，close 等待发送完成"""
+        notifier = ConcreteNotifier(config_dict=GMAIL_CONFIG)
+
+        futures = [notifier.send_email_async(f"主题{i}", "正文") for i in range(3)]
+        notifier.close()
+
+        self.assertEqual([future.result() for future in futures], [True, True, True])
+        mock_smtp.assert_called_once()
+        self.assertEqual(mock_smtp.return_value.send_message.call_count, 3)
+        mock_smtp.return_value.quit.assert_called_once()
+        self.assertIsNone(notifier._executor)
+
+    def test_send_many_single_connection(self, mock_smtp, mock_print):
+        """测试 send_many 多封邮件共用一次连接和登录"""
+        notifier = ConcreteNotifier(config_dict=GMAIL_CONFIG)
+
+        results = notifier.send_many([("主题1", "正文"), ("主题2", "正文", [])])
+
+        self.assertEqual(results, [True, True])
+        server = mock_smtp.return_value
+        mock_smtp.assert_called_once()
+        server.login.assert_called_once()
+        self.assertEqual(server.send_message.call_count, 2)
+        server.quit.assert_called_once()
+
+    def test_batch_aborts_on_high_failure_rate(self, mock_smtp, mock_print):
+        """测试批量发送失败超过三分之一时中止"""
+        notifier = ConcreteNotifier(config_dict=GMAIL_CONFIG)
+        notifier.BATCH_MIN_SIZE = 3
+        mock_smtp.return_value.send_message.side_effect = smtplib.SMTPException("拒绝")
+
+        with self.assertRaises(EmailSendError), notifier.batch():
+            for _ in range(3):
+                notifier.send_email("主题", "正文")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -96,6 +96,38 @@ class TestBrowserHandler(unittest.TestCase):
         # 验证没有调用 set_user_data_path（因为路径不存在或未提供）
         mock_co.set_user_data_path.assert_not_called()
 
+    @patch("core.browser_handler.ChromiumPage")
+    @patch("core.browser_handler.ChromiumOptions")
+    def test_connect_reuses_alive_page(self, mock_co_class, mock_page_class):
+        """测试已有存活连接时不重复创建页面对象"""
+        handler = BrowserHandler(local_port=self.local_port)
+        mock_page = Mock()
+        mock_page.states.is_alive = True
+        handler.page = mock_page
+
+        result = handler.connect()
+
+        self.assertTrue(result)
+        self.assertIs(handler.page, mock_page)
+        mock_page_class.assert_not_called()
+
+    @patch("core.browser_handler.ChromiumPage")
+    @patch("core.browser_handler.ChromiumOptions")
+    def test_connect_replaces_dead_page(self, mock_co_class, mock_page_class):
+        """测试旧连接失效时重新创建页面对象"""
+        handler = BrowserHandler(local_port=self.local_port)
+        dead_page = Mock()
+        dead_page.states.is_alive = False
+        handler.page = dead_page
+
+        new_page = Mock()
+        mock_page_class.return_value = new_page
+
+        result = handler.connect()
+
+        self.assertTrue(result)
+        self.assertIs(handler.page, new_page)
+
     def test_get_page_when_connected(self):
         """测试获取页面对象（已连接状态）"""
         handler = BrowserHandler(local_port=self.local_port)
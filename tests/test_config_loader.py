@@ -0,0 +1,249 @@
+"""
+ConfigLoader / AircraftConfig 单元测试
+
+测试配置文件解析缓存与各配置读取方法
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 添加项目根目录到路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from config.aircraft_cfg import AircraftConfig
+from config.config_loader import _ENV_RE, ConfigLoader, _parse_ini, read_ini, split_csv
+from config.fast_config_parser import FastConfigParser
+
+SAMPLE_INI = """
+[paths]
+user_data_path = /tmp/chrome_debug
+
+[target]
+url = https://example.com/mainController/index.html
+
+[aircraft]
+aircraft_list = B-652G, B-656E
+
+[urls]
+home = mainController/index.html
+
+[scheduler]
+start_time = 07:00
+end_time = 20:00
+flight_fetch_times = 08:00, 13:00
+"""
+
+
+class TestConfigLoader(unittest.TestCase):
+    """测试 ConfigLoader"""
+
+    def setUp(self):
+        """每个测试前创建临时配置文件"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.test_dir, "config.ini")
+        with open(self.config_file, "w", encoding="utf-8") as f:
+            f.write(SAMPLE_INI)
+
+    def tearDown(self):
+        """每个测试后清理临时文件"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_read_sections(self):
+        """测试读取各配置节"""
+        loader = ConfigLoader(self.config_file)
+
+        self.assertEqual(loader.get_paths(), {"user_data_path": "/tmp/chrome_debug"})
+        self.assertEqual(loader.get_target_url(), "https://example.com/mainController/index.html")
+        self.assertEqual(loader.get_aircraft_list(), ["B-652G", "B-656E"])
+        self.assertEqual(loader.get_urls(), {"home": "mainController/index.html"})
+
+        scheduler = loader.get_scheduler_config()
+        self.assertEqual(scheduler["start_time"], "07:00")
+        self.assertEqual(scheduler["flight_fetch_times"], ["08:00", "13:00"])
+        # 未配置的项使用默认值
+        self.assertEqual(scheduler["faults_fetch_times"], ["08:00", "14:00", "20:00"])
+
+    def test_missing_config_file(self):
+        """测试配置文件不存在时使用默认值"""
+        loader = ConfigLoader(os.path.join(self.test_dir, "missing.ini"))
+
+        self.assertEqual(loader.get_aircraft_list(), [])
+        self.assertEqual(loader.get_urls(), {})
+        self.assertEqual(loader.get_scheduler_config()["start_time"], "06:30")
+
+    def test_file_removed_after_stat(self):
+        """测试 stat 之后、读取之前文件被删除时按文件不存在处理"""
+        with patch("config.config_loader._parse_ini", side_effect=FileNotFoundError):
+            self.assertEqual(read_ini(self.config_file), {})
+            with self.assertRaises(FileNotFoundError):
+                read_ini(self.config_file, missing_ok=False)
+
+    def test_parse_cached_across_instances(self):
+        """测试同一文件在多个实例间只解析一次"""
+        ConfigLoader(self.config_file)
+        misses = _parse_ini.cache_info().misses
+
+        ConfigLoader(self.config_file)
+        AircraftConfig(self.config_file)
+
+        self.assertEqual(_parse_ini.cache_info().misses, misses)
+
+    def test_reparse_after_file_change(self):
+        """测试文件修改后重新解析"""
+        loader = ConfigLoader(self.config_file)
+        self.assertEqual(loader.get_aircraft_list(), ["B-652G", "B-656E"])
+
+        with open(self.config_file, "w", encoding="utf-8") as f:
+            f.write("[aircraft]\naircraft_list = B-652G\n")
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(ConfigLoader(self.config_file).get_aircraft_list(), ["B-652G"])
+
+    def test_touch_without_change_keeps_mapping(self):
+        """测试仅修改时间变化、内容不变时复用同一解析结果"""
+        loader = ConfigLoader(self.config_file)
+        config = loader.config
+
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertIs(ConfigLoader(self.config_file).config, config)
+
+    def test_all_config_cached_until_file_changes(self):
+        """测试 get_all_config 结果缓存，文件修改后重建"""
+        loader = ConfigLoader(self.config_file)
+        all_config = loader.get_all_config()
+        self.assertIs(loader.get_all_config(), all_config)
+
+        with open(self.config_file, "w", encoding="utf-8") as f:
+            f.write("[aircraft]\naircraft_list = B-652G\n")
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(loader.get_all_config()["aircraft_list"], ["B-652G"])
+
+    def test_env_overrides_config_value(self):
+        """测试环境变量优先于 config.ini"""
+        with patch.dict(os.environ, {"SYSTEM_USERNAME": "env_user"}):
+            loader = ConfigLoader(self.config_file)
+
+        self.assertEqual(loader._get_value("credentials", "username"), "env_user")
+        self.assertEqual(loader.get_credentials()["username"], "env_user")
+
+    def test_gmail_config_cached(self):
+        """测试 Gmail 配置只读取一次，且返回副本"""
+        env = {"GMAIL_SENDER_EMAIL": "a@example.com", "GMAIL_RECIPIENTS": "b@example.com"}
+        with patch.dict(os.environ, env):
+            loader = ConfigLoader(self.config_file)
+
+        gmail_config = loader.get_gmail_config()
+        gmail_config["recipients"].append("c@example.com")
+
+        self.assertEqual(loader.get_gmail_config()["recipients"], ["b@example.com"])
+        self.assertIs(loader._gmail_config, loader._gmail_config)
+
+    def test_env_pattern(self):
+        """测试 .env 行解析（跳过注释、空行和无效行）"""
+        content = "# 注释\nUSERNAME=admin\n  GMAIL_PASSWORD = ab=cd  \n\nINVALID\n"
+
+        self.assertEqual(
+            _ENV_RE.findall(content),
+            [("USERNAME", "admin"), ("GMAIL_PASSWORD", "ab=cd")],
+        )
+
+    def test_split_csv(self):
+        """测试逗号分隔值解析"""
+        self.assertEqual(split_csv(" B-652G ,B-656E,, "), ["B-652G", "B-656E"])
+        self.assertEqual(split_csv(""), [])
+
+
+class TestAircraftConfig(unittest.TestCase):
+    """测试 AircraftConfig"""
+
+    def setUp(self):
+        """每个测试前创建临时配置文件"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.test_dir, "config.ini")
+        with open(self.config_file, "w", encoding="utf-8") as f:
+            f.write(SAMPLE_INI)
+
+    def tearDown(self):
+        """每个测试后清理临时文件"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_aircraft_mapping(self):
+        """测试飞机号映射"""
+        cfg = AircraftConfig(self.config_file)
+
+        self.assertEqual(
+            cfg.get_aircraft_mapping(),
+            {"B-652G": "C909-185/B-652G", "B-656E": "C909-196/B-656E"},
+        )
+        self.assertEqual(cfg.get_full_aircraft_name("B-656E"), "C909-196/B-656E")
+        self.assertEqual(cfg.get_full_aircraft_name("B-000X"), "B-000X")
+
+    def test_mapping_copy_does_not_affect_cache(self):
+        """测试修改返回的映射不影响缓存"""
+        cfg = AircraftConfig(self.config_file)
+
+        mapping = cfg.get_aircraft_mapping()
+        mapping["B-652G"] = "changed"
+
+        self.assertEqual(cfg.get_full_aircraft_name("B-652G"), "C909-185/B-652G")
+
+    def test_short_names_and_list(self):
+        """测试短飞机号列表与飞机号列表"""
+        cfg = AircraftConfig(self.config_file)
+
+        self.assertEqual(cfg.get_all_short_names(), ["B-652G", "B-656E"])
+        aircraft_list = cfg.get_aircraft_list()
+        aircraft_list.append("B-000X")
+        self.assertEqual(cfg.get_aircraft_list(), ["B-652G", "B-656E"])
+
+    def test_missing_config_file(self):
+        """测试配置文件不存在时报错"""
+        with self.assertRaises(FileNotFoundError):
+            AircraftConfig(os.path.join(self.test_dir, "missing.ini"))
+
+
+class TestFastConfigParser(unittest.TestCase):
+    """测试 FastConfigParser"""
+
+    def test_parse_like_configparser(self):
+        """测试解析结果与 configparser 一致（无插值）"""
+        import configparser
+
+        expected = configparser.RawConfigParser()
+        expected.read_string(SAMPLE_INI)
+
+        parser = FastConfigParser()
+        parser.read_string(SAMPLE_INI)
+
+        self.assertEqual(
+            parser.to_dict(),
+            {section: dict(expected.items(section)) for section in expected.sections()},
+        )
+
+    def test_comments_and_key_case(self):
+        """测试注释行跳过、键名小写、值中保留冒号"""
+        parser = FastConfigParser()
+        parser.read_string("# 注释\n[target]\n; 注释\nURL = https://a.com:8004/x\n")
+
+        self.assertEqual(parser.to_dict(), {"target": {"url": "https://a.com:8004/x"}})
+
+    def test_no_interpolation(self):
+        """测试值中的 % 原样保留，不做插值"""
+        parser = FastConfigParser()
+        parser.read_string("[credentials]\npassword = a%b%(c)s\n")
+
+        self.assertEqual(parser.to_dict(), {"credentials": {"password": "a%b%(c)s"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
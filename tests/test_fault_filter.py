@@ -0,0 +1,112 @@
+"""
+FaultFilter 单元测试
+
+测试组合过滤规则与关联故障过滤规则
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# 添加项目根目录到路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import pandas as pd
+
+from core.fault_filter import FaultFilter, get_fault_filter
+
+SINGLE_RULES = """机号,描述
+B-652G,液压
+,APU
+,
+B-656E,BLEED
+"""
+
+FAULTS = [
+    ("B-652G", "液压 低压", "08:00:00"),
+    ("B-656E", "液压 低压", "08:00:05"),
+    ("B-656E", "APU 故障", "08:01:00"),
+    ("B-652G", "BLEED 泄漏", "08:02:00"),
+    ("B-656E", "BLEED 泄漏", "08:03:00"),
+    ("B-652G", "发动机 振动", "08:04:00"),
+]
+
+
+class TestFaultFilter(unittest.TestCase):
+    """测试 FaultFilter"""
+
+    def setUp(self):
+        """每个测试前创建临时规则目录"""
+        self.test_dir = tempfile.mkdtemp()
+        self.df = pd.DataFrame(FAULTS, columns=["机号", "描述", "触发时间"])
+
+    def tearDown(self):
+        """每个测试后清理临时文件"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write_rules(self, name, content):
+        """写入规则文件"""
+        with open(os.path.join(self.test_dir, name), "w", encoding="utf-8-sig") as f:
+            f.write(content)
+
+    def test_single_filters(self):
+        """测试同行字段AND、多行规则OR、空规则忽略"""
+        self._write_rules("fault_filter_rules.csv", SINGLE_RULES)
+
+        result = FaultFilter(self.test_dir).apply_filters(self.df)
+
+        self.assertEqual(
+            result["描述"].tolist(),
+            ["液压 低压", "BLEED 泄漏", "发动机 振动"],
+        )
+        self.assertEqual(result.index.tolist(), [1, 3, 5])
+
+    def test_single_filter_values_are_literal(self):
+        """测试规则值按字面匹配，不作为正则"""
+        self._write_rules("fault_filter_rules.csv", "描述\nBLEED.泄漏\n(低压\n")
+        df = pd.DataFrame({"描述": ["BLEED 泄漏", "BLEED.泄漏", "液压(低压)"]})
+
+        result = FaultFilter(self.test_dir).apply_filters(df)
+
+        self.assertEqual(result["描述"].tolist(), ["BLEED 泄漏"])
+
+    def test_group_filters(self):
+        """测试同一机号在时间间隔内出现全部关联故障时过滤"""
+        self._write_rules(
+            "fault_group_filter_rules.csv",
+            "故障描述1,故障描述2,时间间隔(秒)\n液压,APU,120\nBLEED,发动机,60\n",
+        )
+
+        result = FaultFilter(self.test_dir).apply_filters(self.df)
+
+        # B-656E 液压/APU 间隔 55 秒被过滤；B-652G 缺少 APU，BLEED/发动机 间隔超过阈值
+        self.assertEqual(result.index.tolist(), [0, 3, 4, 5])
+
+    def test_get_fault_filter_cached_until_rules_change(self):
+        """测试规则文件未修改时复用实例，修改后重建"""
+        self._write_rules("fault_filter_rules.csv", SINGLE_RULES)
+        fault_filter = get_fault_filter(self.test_dir)
+        self.assertIs(get_fault_filter(self.test_dir), fault_filter)
+
+        path = os.path.join(self.test_dir, "fault_filter_rules.csv")
+        self._write_rules("fault_filter_rules.csv", "描述\nAPU\n")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertIsNot(get_fault_filter(self.test_dir), fault_filter)
+        self.assertEqual(
+            get_fault_filter(self.test_dir).get_filter_stats()["single_filter_rules"], 1
+        )
+
+    def test_no_rules(self):
+        """测试规则文件不存在时原样返回"""
+        result = FaultFilter(self.test_dir).apply_filters(self.df)
+
+        pd.testing.assert_frame_equal(result, self.df)
+
+
+if __name__ == "__main__":
+    unittest.main()
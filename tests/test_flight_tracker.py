@@ -0,0 +1,93 @@
+"""
+FlightTracker 单元测试
+
+测试航班阶段统计与监控优先级判断
+"""
+
+import os
+import sys
+import unittest
+from datetime import date, datetime
+from unittest.mock import patch
+
+# 添加项目根目录到路径
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import pandas as pd
+
+from core.flight_tracker import FlightTracker, _parse_time_column
+
+
+def _at(hour, minute=0):
+    """今天指定时刻"""
+    today = date.today()
+    return datetime(today.year, today.month, today.day, hour, minute)
+
+
+def _leg(aircraft, flight_number, out=None, off=None, on=None, in_=None):
+    """构造一条 leg 记录（中文列名）"""
+    fmt = "%Y-%m-%d %H:%M"
+    return {
+        "执飞飞机": aircraft,
+        "航班号": flight_number,
+        "OUT": out.strftime(fmt) if out else None,
+        "OFF": off.strftime(fmt) if off else None,
+        "ON": on.strftime(fmt) if on else None,
+        "IN": in_.strftime(fmt) if in_ else None,
+    }
+
+
+class TestFlightTracker(unittest.TestCase):
+    """测试 FlightTracker"""
+
+    def setUp(self):
+        """每个测试前创建不加载leg数据文件的跟踪器"""
+        with patch.object(FlightTracker, "_load_existing_leg_data"):
+            self.tracker = FlightTracker()
+        self.tracker.log = lambda *args, **kwargs: None
+
+    def test_phase_counts_follow_updates(self):
+        """测试空中/地面飞机数随状态更新变化"""
+        tracker = self.tracker
+        tracker.update_from_latest_leg_data([_leg("B-652G", "VJ105"), _leg("B-656E", "VJ107")])
+        self.assertFalse(tracker.needs_fault_monitoring(_at(8)))
+
+        tracker.update_from_latest_leg_data([_leg("B-652G", "VJ105", _at(7, 40), _at(7, 50))])
+        self.assertTrue(tracker.needs_fault_monitoring(_at(8)))
+        self.assertEqual(tracker.get_all_aircraft_in_air(), ["B-652G"])
+        self.assertEqual(tracker.get_all_aircraft_on_ground(), ["B-656E"])
+
+    def test_should_monitor_leg_first(self):
+        """测试监控优先级随时间变化，状态更新后重新判断"""
+        tracker = self.tracker
+        # VJ105 07:50 起飞，航程110分钟 → 09:40 计划到达；VJ107 计划 09:15 起飞
+        tracker.update_from_latest_leg_data(
+            [
+                _leg("B-652G", "VJ105", _at(7, 40), _at(7, 50)),
+                _leg("B-656E", "VJ107"),
+            ]
+        )
+        self.assertTrue(tracker.should_monitor_leg_first(_at(8)))  # 默认监控leg
+        self.assertFalse(tracker.needs_leg_monitoring(_at(9)))
+        self.assertTrue(tracker.needs_leg_monitoring(_at(9, 15)))
+
+        # 两架飞机都在空中 → 到达时间前监控故障页面
+        tracker.update_from_latest_leg_data([_leg("B-656E", "VJ107", _at(9, 10), _at(9, 20))])
+        self.assertFalse(tracker.should_monitor_leg_first(_at(9, 30)))
+        self.assertTrue(tracker.should_monitor_leg_first(_at(9, 40)))
+
+
+class TestParseTimeColumn(unittest.TestCase):
+    """测试leg时间列解析"""
+
+    def test_valid_and_blank_times(self):
+        """测试有效时间解析为datetime，空值和无效值为None"""
+        column = pd.Series(["2026-10-17 09:42", None, "", "bad"], index=[5, 6, 7, 8])
+        result = _parse_time_column(column)
+        self.assertEqual(result, [datetime(2026, 10, 17, 9, 42), None, None, None])
+        self.assertIs(type(result[0]), datetime)
+
+
+if __name__ == "__main__":
+    unittest.main()